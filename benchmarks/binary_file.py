@@ -0,0 +1,68 @@
+"""Compare the CPU and bytes per record of the text and binary file modes.
+
+python benchmarks/binary_file.py [records]
+
+"""
+
+import functools
+import logging
+from pathlib import Path
+import shutil
+import sys
+import tempfile
+import time
+
+from delogger.handlers.binary_file import BinaryFileHandler
+from delogger.handlers.count_rotating_file import CountRotatingFileHandler
+from delogger.modes.file import FileModeBase
+
+
+def measure(hdlr, records):
+    hdlr.setFormatter(logging.Formatter(FileModeBase.fmt, FileModeBase.datefmt))
+    record = logging.LogRecord(
+        "bench", logging.DEBUG, __file__, 10, "user %s id %d", ("name", 1), None
+    )
+
+    # Measure the encoding separately from the write and flush calls.
+    encode = hdlr.format
+    if isinstance(hdlr, BinaryFileHandler):
+        encode = functools.partial(hdlr.encode, templates={})
+    start = time.process_time()
+    for _ in range(records):
+        encode(record)
+    encode_cpu = time.process_time() - start
+
+    start = time.process_time()
+    hdlr.emit_batch([record] * records)
+    hdlr.close()
+    total_cpu = time.process_time() - start
+
+    size = Path(hdlr.filepath).stat().st_size
+    return records / encode_cpu, records / total_cpu, size / records
+
+
+def main(records=200000):
+    dirpath = tempfile.mkdtemp()
+    try:
+        handlers = {
+            "text": CountRotatingFileHandler(
+                str(Path(dirpath) / "text.log"), backup_count=0
+            ),
+            "binary": BinaryFileHandler(
+                str(Path(dirpath) / "binary.dlb"), backup_count=0
+            ),
+        }
+
+        print(f"file modes ({records} records)")
+        for name, hdlr in handlers.items():
+            encode, total, size = measure(hdlr, records)
+            print(
+                f"{name:>7}: encode {encode:>9.0f} records/s, "
+                f"batch write {total:>9.0f} records/s, {size:.1f} bytes/record"
+            )
+    finally:
+        shutil.rmtree(dirpath)
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,60 @@
+"""Compare the file handlers on DEBUG output.
+
+python benchmarks/buffered_file.py [records]
+
+"""
+
+import logging
+from pathlib import Path
+import shutil
+import sys
+import tempfile
+import time
+
+from delogger.handlers.buffered_file import BufferedFileHandler
+from delogger.handlers.count_rotating_file import CountRotatingFileHandler
+from delogger.handlers.ring_file import RingFileHandler
+from delogger.modes.file import FileModeBase
+
+
+def throughput(hdlr, records):
+    hdlr.setFormatter(logging.Formatter(FileModeBase.fmt, FileModeBase.datefmt))
+    record = logging.LogRecord(
+        "bench", logging.DEBUG, __file__, 10, "user %s id %d", ("name", 1), None
+    )
+
+    start = time.perf_counter()
+    for _ in range(records):
+        hdlr.handle(record)
+    hdlr.close()
+    elapsed = time.perf_counter() - start
+
+    return records / elapsed
+
+
+def main(records=200000):
+    dirpath = tempfile.mkdtemp()
+    try:
+        handlers = {
+            "CountRotatingFileHandler": CountRotatingFileHandler(
+                str(Path(dirpath) / "count.log"), backup_count=0
+            ),
+            "BufferedFileHandler": BufferedFileHandler(
+                str(Path(dirpath) / "buffered.log"), backup_count=0
+            ),
+            "RingFileHandler": RingFileHandler(str(Path(dirpath) / "ring.ring")),
+        }
+
+        print(f"file throughput ({records} records)")
+        for name, hdlr in handlers.items():
+            rate = throughput(hdlr, records)
+            # The ring file is written through mmap, without write calls.
+            default = 0 if isinstance(hdlr, RingFileHandler) else records
+            writes = getattr(hdlr, "writes", default)
+            print(f"{name:>24}: {rate:>9.0f} records/s, {writes} writes")
+    finally:
+        shutil.rmtree(dirpath)
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,43 @@
+"""Compare the format throughput of logging.Formatter and FastFormatter.
+
+python benchmarks/fast_format.py [records]
+
+"""
+
+import logging
+import sys
+import time
+
+from delogger.formatters.fast_formatter import FastFormatter
+from delogger.modes.file import FileModeBase
+from delogger.modes.stream import StreamDebugMode
+
+
+def throughput(formatter, records):
+    record = logging.LogRecord(
+        "bench", logging.INFO, __file__, 10, "user %s id %d", ("name", 1), None
+    )
+
+    start = time.perf_counter()
+    for _ in range(records):
+        formatter.format(record)
+    elapsed = time.perf_counter() - start
+
+    return records / elapsed
+
+
+def main(records=200000):
+    fmts = {
+        "file": (FileModeBase.fmt, FileModeBase.datefmt),
+        "stream": (StreamDebugMode.fmt, None),
+    }
+
+    print(f"format throughput ({records} records)")
+    for name, (fmt, datefmt) in fmts.items():
+        for cls in (logging.Formatter, FastFormatter):
+            rate = throughput(cls(fmt, datefmt), records)
+            print(f"{name:>7} {cls.__name__:>13}: {rate:>9.0f} records/s")
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,56 @@
+"""Check the python -X importtime of import delogger against a budget.
+
+Prints the median cumulative import time of delogger over fresh
+interpreters, and the slowest modules of the last run. Exits with 1 when
+the median is over the budget.
+
+python benchmarks/import_time.py [runs] [budget_ms]
+
+"""
+
+import os
+from pathlib import Path
+import statistics
+import subprocess
+import sys
+
+BUDGET_MS = 80
+
+
+def importtime(module):
+    """Cumulative import times in us by module, of a fresh interpreter."""
+
+    env = dict(os.environ, PYTHONPATH=str(Path(__file__).resolve().parents[1]))
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        env=env,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    ).stderr
+
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        times[name.strip()] = int(cumulative)
+
+    return times
+
+
+def main(runs=20, budget_ms=BUDGET_MS):
+    results = [importtime("delogger") for _ in range(runs)]
+    median = statistics.median(times["delogger"] for times in results) / 1000
+
+    print(f"import delogger: {median:.1f}ms (median of {runs}, budget {budget_ms}ms)")
+    print("slowest modules of the last run:")
+    slowest = sorted(results[-1].items(), key=lambda item: item[1], reverse=True)
+    for name, us in slowest[1:11]:
+        print(f"{us / 1000:8.1f}ms {name}")
+
+    return 0 if median <= budget_ms else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main(*[int(arg) for arg in sys.argv[1:]]))
@@ -0,0 +1,43 @@
+"""Compare the format throughput of the text file format and JsonFormatter.
+
+python benchmarks/json_format.py [records]
+
+"""
+
+import logging
+import sys
+import time
+
+from delogger.formatters import json_formatter
+from delogger.formatters.json_formatter import JsonFormatter
+from delogger.modes.file import FileModeBase
+
+
+def throughput(formatter, records):
+    record = logging.LogRecord(
+        "bench", logging.INFO, __file__, 10, "user %s id %d", ("name", 1), None
+    )
+
+    start = time.perf_counter()
+    for _ in range(records):
+        formatter.format(record)
+    elapsed = time.perf_counter() - start
+
+    return records / elapsed
+
+
+def main(records=200000):
+    formatters = {
+        "text": logging.Formatter(FileModeBase.fmt, FileModeBase.datefmt),
+        "json (stdlib)": JsonFormatter(backend="json"),
+    }
+    if json_formatter._can_orjson:
+        formatters["json (orjson)"] = JsonFormatter(backend="orjson")
+
+    print(f"format throughput ({records} records)")
+    for name, formatter in formatters.items():
+        print(f"{name:>14}: {throughput(formatter, records):>9.0f} records/s")
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
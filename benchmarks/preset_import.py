@@ -0,0 +1,68 @@
+"""Time the import of the presets and the build of their loggers.
+
+Before the presets were lazy, the import also built the logger, so the
+import paid both columns, and the log directory and the listener thread of
+the output preset were made at import.
+
+python benchmarks/preset_import.py [runs]
+
+"""
+
+import os
+from pathlib import Path
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+
+from delogger.presets import PRESETS
+
+SCRIPT = """
+import time
+begin = time.perf_counter()
+import {module}
+imported = time.perf_counter()
+{module}.logger
+print(imported - begin, time.perf_counter() - imported)
+"""
+
+
+def measure(module, runs, cwd):
+    """Median import and logger build times in ms, in fresh interpreters."""
+
+    script = SCRIPT.format(module=module)
+    env = dict(os.environ, PYTHONPATH=str(Path(__file__).resolve().parents[1]))
+    times = [
+        [
+            float(t)
+            for t in subprocess.run(
+                [sys.executable, "-c", script],
+                cwd=cwd,
+                env=env,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                universal_newlines=True,
+                check=True,
+            ).stdout.split()
+        ]
+        for _ in range(runs)
+    ]
+
+    return [statistics.median(column) * 1000 for column in zip(*times)]
+
+
+def main(runs=20):
+    cwd = tempfile.mkdtemp()
+    try:
+        print(f"median of {runs} fresh interpreters")
+        print(f"{'preset':>14} {'import':>10} {'logger':>10}")
+        for name, module in PRESETS.items():
+            imported, built = measure(module, runs, cwd)
+            print(f"{name:>14} {imported:8.1f}ms {built:8.1f}ms")
+    finally:
+        shutil.rmtree(cwd)
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
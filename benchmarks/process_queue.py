@@ -0,0 +1,95 @@
+"""Compare a single writer process with per-process file locking.
+
+Every worker process logs the same number of records to one log file.
+
+    python benchmarks/process_queue.py [processes] [records]
+
+"""
+
+import fcntl
+import logging
+import multiprocessing
+import os
+from pathlib import Path
+import shutil
+import sys
+import time
+
+from delogger import DeloggerProcessQueue
+from delogger.modes.file import CountRotatingFileMode
+
+OUTPUT_DIRPATH = "bench_log"
+FMT = "%(asctime)s.%(msecs).03d %(levelname)s %(filename)s:%(lineno)d %(funcName)s %(message)s"
+
+
+class LockedFileHandler(logging.FileHandler):
+    """FileHandler that takes an exclusive file lock for every record."""
+
+    def emit(self, record):
+        if self.stream is None:
+            self.stream = self._open()
+
+        fcntl.flock(self.stream.fileno(), fcntl.LOCK_EX)
+        try:
+            super().emit(record)
+        finally:
+            fcntl.flock(self.stream.fileno(), fcntl.LOCK_UN)
+
+
+def locked_worker(filepath, records):
+    logger = logging.getLogger(f"locked_{os.getpid()}")
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+    hdlr = LockedFileHandler(filepath)
+    hdlr.setFormatter(logging.Formatter(FMT, "%Y-%m-%d %H:%M:%S"))
+    logger.addHandler(hdlr)
+
+    for i in range(records):
+        logger.info("record %d", i)
+    hdlr.close()
+
+
+def queue_worker(logger, records):
+    for i in range(records):
+        logger.info("record %d", i)
+
+
+def run(target, args, processes):
+    ctx = multiprocessing.get_context("fork")
+    procs = [ctx.Process(target=target, args=args) for _ in range(processes)]
+
+    start = time.perf_counter()
+    for proc in procs:
+        proc.start()
+    for proc in procs:
+        proc.join()
+
+    return start
+
+
+def main(processes=4, records=20000):
+    Path(OUTPUT_DIRPATH).mkdir(exist_ok=True)
+    total = processes * records
+
+    start = run(locked_worker, (f"{OUTPUT_DIRPATH}/locked.log", records), processes)
+    locked = time.perf_counter() - start
+
+    delogger = DeloggerProcessQueue(
+        "bench_process_queue",
+        modes=[CountRotatingFileMode(f"{OUTPUT_DIRPATH}/queue.log", backup_count=0)],
+        context="fork",
+    )
+    logger = delogger.get_logger()
+    start = run(queue_worker, (logger, records), processes)
+    delogger.stop()
+    queued = time.perf_counter() - start
+
+    print(f"{processes} processes x {records} records")
+    print(f"per-process file lock: {total / locked:>10.0f} records/s")
+    print(f"single writer process: {total / queued:>10.0f} records/s")
+
+    shutil.rmtree(OUTPUT_DIRPATH)
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
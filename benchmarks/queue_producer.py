@@ -0,0 +1,45 @@
+"""Measure the per-record producer cost of each DeloggerQueue queue_type.
+
+python benchmarks/queue_producer.py [records]
+
+"""
+
+import logging
+import sys
+import time
+
+from delogger import DeloggerQueue
+
+
+class DiscardHandler(logging.Handler):
+    def emit(self, record):
+        pass
+
+
+def producer_cost(queue_type, records):
+    delogger = DeloggerQueue(f"bench_{queue_type}", queue_type=queue_type)
+    delogger.add_handler(DiscardHandler(), logging.DEBUG)
+    delogger.get_logger()
+    queue_hdlr = delogger._queue_hdlr
+
+    record = logging.LogRecord("bench", logging.INFO, __file__, 0, "msg", None, None)
+
+    start = time.perf_counter()
+    for _ in range(records):
+        queue_hdlr.enqueue(record)
+    elapsed = time.perf_counter() - start
+
+    delogger.join()
+    queue_hdlr.close()
+
+    return elapsed / records * 1e9
+
+
+def main(records=200000):
+    print(f"enqueue cost per record ({records} records)")
+    for queue_type in DeloggerQueue.QUEUE_TYPES:
+        print(f"{queue_type:>6}: {producer_cost(queue_type, records):>7.0f} ns")
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,59 @@
+"""Compare the old glob based retention scan with RetentionPolicy.
+
+python benchmarks/retention.py [files]
+
+"""
+
+from datetime import datetime
+from datetime import timedelta
+from pathlib import Path
+import re
+import shutil
+import sys
+import tempfile
+import time
+
+from delogger.util.retention import RetentionPolicy
+from delogger.util.retention import strftime_pattern
+
+FMT = "%Y%m%d_%H%M%S.log"
+
+
+def glob_scan(dirpath):
+    # CountRotatingFileHandler._get_match_files before RetentionPolicy
+    pattern = re.compile(r"\d{4}\d{2}\d{2}_\d{2}\d{2}\d{2}.log")
+    return [x for x in sorted(Path(dirpath).glob("*")) if pattern.search(str(x))]
+
+
+def main(files=100000):
+    dirpath = tempfile.mkdtemp()
+    try:
+        start = datetime(2020, 1, 1)
+        for i in range(files):
+            name = (start + timedelta(seconds=i)).strftime(FMT)
+            open(Path(dirpath) / name, "w").close()
+
+        begin = time.perf_counter()
+        glob_scan(dirpath)
+        glob_time = time.perf_counter() - begin
+
+        policy = RetentionPolicy(max_count=5)
+        match = strftime_pattern(FMT).fullmatch
+        begin = time.perf_counter()
+        policy.select(policy.scan(dirpath, match))
+        scan_time = time.perf_counter() - begin
+
+        begin = time.perf_counter()
+        removed = policy.apply(dirpath, match)
+        apply_time = time.perf_counter() - begin
+
+        print(f"retention of {files} files")
+        print(f"      glob scan: {glob_time:.3f}s (then removes 1 file)")
+        print(f"   scandir scan: {scan_time:.3f}s")
+        print(f"scan and remove: {apply_time:.3f}s ({len(removed)} files)")
+    finally:
+        shutil.rmtree(dirpath)
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -1,11 +1,34 @@
+from importlib import import_module
+
 from .decorators.base import DecoratorBase
 from .loggers.delogger import Delogger
 from .loggers.delogger_queue import DeloggerQueue
 from .modes.base import ModeBase
+from .util.lazy_import import module_getattr
 
 __all__ = (
     "Delogger",
     "DeloggerQueue",
+    "DeloggerProcessQueue",
+    "DeloggerAsync",
     "ModeBase",
     "DecoratorBase",
 )
+
+# Loaded on first access, they import asyncio and multiprocessing.
+_LAZY = {
+    "DeloggerAsync": ".loggers.delogger_async",
+    "DeloggerProcessQueue": ".loggers.delogger_process_queue",
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY:
+        value = getattr(import_module(_LAZY[name], __name__), name)
+        globals()[name] = value
+        return value
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+module_getattr(__name__)
@@ -0,0 +1,70 @@
+"""Command line tools of delogger.
+
+python -m delogger decode [--json] [--fmt FMT] [--datefmt DATEFMT] FILE...
+
+"""
+
+import argparse
+import sys
+from typing import List
+from typing import Optional
+
+from delogger.formatters.fast_formatter import FastFormatter
+from delogger.formatters.json_formatter import JsonFormatter
+from delogger.handlers.binary_file import MAGIC
+from delogger.handlers.binary_file import iter_binary_file
+from delogger.handlers.ring_file import HEADER_MAGIC
+from delogger.handlers.ring_file import read_ring_file
+from delogger.modes.file import FileModeBase
+
+
+def decode(args: argparse.Namespace) -> int:
+    if args.json:
+        formatter = JsonFormatter(datefmt=args.datefmt, extra=False)
+    else:
+        formatter = FastFormatter(args.fmt, args.datefmt or FileModeBase.datefmt)
+
+    out = sys.stdout
+    for filepath in args.files:
+        with open(filepath, "rb") as f:
+            head = f.read(len(HEADER_MAGIC))
+
+        if head.startswith(HEADER_MAGIC):
+            if args.json:
+                print(f"{filepath}: ring files hold formatted text", file=sys.stderr)
+                return 1
+            for line in read_ring_file(filepath):
+                out.write(line + "\n")
+        elif head[1:].startswith(MAGIC):
+            for record in iter_binary_file(filepath):
+                out.write(formatter.format(record) + "\n")
+        else:
+            print(f"{filepath}: not a delogger binary or ring file", file=sys.stderr)
+            return 1
+
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m delogger")
+    subparsers = parser.add_subparsers(dest="command")
+
+    decode_parser = subparsers.add_parser(
+        "decode", help="Render binary (BinaryFileMode) and ring (RingFileMode) logs."
+    )
+    decode_parser.add_argument("files", nargs="+", help="Log files.")
+    decode_parser.add_argument("--json", action="store_true", help="Output NDJSON.")
+    decode_parser.add_argument("--fmt", default=FileModeBase.fmt, help="Log format.")
+    decode_parser.add_argument("--datefmt", default=None, help="Date format.")
+    decode_parser.set_defaults(func=decode)
+
+    args = parser.parse_args(argv)
+    if args.command is None:
+        parser.print_help()
+        return 2
+
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
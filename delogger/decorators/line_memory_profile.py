@@ -1,8 +1,11 @@
+from typing import Any
 from typing import Generator
 from typing import List
 from typing import Tuple
 
 from delogger.decorators.base import DecoratorBase
+from delogger.util.lazy_import import can_import
+from delogger.util.lazy_import import import_optional
 from delogger.util.warn import warn_import
 
 try:
@@ -10,20 +13,24 @@ try:
 except ImportError:
     from io import StringIO
 
-try:
-    from line_profiler import LineProfiler
+# line_profiler and memory_profiler are imported by the first can_run.
+_can_line_profiler = can_import("line_profiler")
+LineProfiler: Any = None
 
-    _can_line_profiler = True
-except ImportError:  # pragma: no cover
-    _can_line_profiler = False
+_can_memory_profiler = can_import("memory_profiler")
+profile: Any = None
 
 
-try:
-    from memory_profiler import profile
+def _load_profilers() -> None:
+    global LineProfiler, _can_line_profiler, profile, _can_memory_profiler
 
-    _can_memory_profiler = True
-except ImportError:  # pragma: no cover
-    _can_memory_profiler = False
+    if _can_line_profiler and LineProfiler is None:
+        LineProfiler = import_optional("line_profiler", "LineProfiler")
+        _can_line_profiler = LineProfiler is not None
+
+    if _can_memory_profiler and profile is None:
+        profile = import_optional("memory_profiler", "profile")
+        _can_memory_profiler = profile is not None
 
 
 class LineEmpty(Exception):
@@ -48,6 +55,8 @@ class LineMemoryProfile(DecoratorBase):
     ]
 
     def can_run(self) -> bool:
+        _load_profilers()
+
         if not _can_line_profiler:
             warn_import(self.decorator_name, "line_profiler")
             return False
@@ -1,6 +1,9 @@
+from typing import Any
 from typing import Optional
 
 from delogger.decorators.base import DecoratorBase
+from delogger.util.lazy_import import can_import
+from delogger.util.lazy_import import import_optional
 from delogger.util.warn import warn_import
 
 try:
@@ -8,19 +11,26 @@ try:
 except ImportError:
     from io import StringIO
 
-try:
-    from line_profiler import LineProfiler
+# line_profiler is imported by the first can_run.
+_can_line_profiler = can_import("line_profiler")
+LineProfiler: Any = None
+
+
+def _load_line_profiler() -> bool:
+    global LineProfiler, _can_line_profiler
+
+    if _can_line_profiler and LineProfiler is None:
+        LineProfiler = import_optional("line_profiler", "LineProfiler")
+        _can_line_profiler = LineProfiler is not None
 
-    _can_line_profiler = True
-except ImportError:  # pragma: no cover
-    _can_line_profiler = False
+    return _can_line_profiler
 
 
 class LineProfile(DecoratorBase):
     decorator_name = "line_profile"
 
     def can_run(self) -> bool:
-        if not _can_line_profiler:
+        if not _load_line_profiler():
             warn_import(self.decorator_name, "line_profiler")
             return False
 
@@ -45,12 +55,12 @@ class LineProfileStats(DecoratorBase):
     def __init__(self) -> None:
         super().__init__()
 
-        self.prof: Optional[LineProfiler] = None
-        if _can_line_profiler:
+        self.prof: Optional[Any] = None
+        if _load_line_profiler():
             self.prof = LineProfiler()
 
     def can_run(self) -> bool:
-        if not _can_line_profiler:
+        if not _load_line_profiler():
             warn_import(self.decorator_name, "line_profiler")
             return False
 
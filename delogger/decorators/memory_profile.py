@@ -1,4 +1,8 @@
+from typing import Any
+
 from delogger.decorators.base import DecoratorBase
+from delogger.util.lazy_import import can_import
+from delogger.util.lazy_import import import_optional
 from delogger.util.warn import warn_import
 
 try:
@@ -6,19 +10,26 @@ try:
 except ImportError:
     from io import StringIO
 
-try:
-    from memory_profiler import profile
+# memory_profiler (and psutil) is imported by the first can_run.
+_can_memory_profiler = can_import("memory_profiler")
+profile: Any = None
+
+
+def _load_memory_profiler() -> bool:
+    global profile, _can_memory_profiler
+
+    if _can_memory_profiler and profile is None:
+        profile = import_optional("memory_profiler", "profile")
+        _can_memory_profiler = profile is not None
 
-    _can_memory_profiler = True
-except ImportError:  # pragma: no cover
-    _can_memory_profiler = False
+    return _can_memory_profiler
 
 
 class MemoryProfile(DecoratorBase):
     decorator_name = "memory_profile"
 
     def can_run(self) -> bool:
-        if not _can_memory_profiler:
+        if not _load_memory_profiler():
             warn_import(self.decorator_name, "memory_profiler")
             return False
 
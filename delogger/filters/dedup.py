@@ -0,0 +1,140 @@
+from collections import OrderedDict
+from logging import Handler
+from logging import LogRecord
+from logging import makeLogRecord
+from threading import Lock
+from time import monotonic
+from typing import Hashable
+from typing import List
+from typing import Tuple
+
+from delogger.handlers.shutdown import register_filter
+
+__all__ = ["DedupFilter"]
+
+
+class DedupFilter:
+    """A filter that collapses duplicate records of its handler.
+
+    Records are duplicates when their msg, args and level are the same. The
+    first record is output, and the duplicates within window seconds from it
+    are collapsed into one "(repeated N times)" record that the filter hands
+    to the handler when the window is over, and on flush, on the drain of
+    the logger and at exit.
+
+    The fingerprints are kept in a LRU table of at most max_entries entries.
+
+    Args:
+        handler (Handler): Handler the filter is added to.
+        window (float): Seconds to collapse the duplicates.
+        max_entries (int): Maximum number of tracked fingerprints.
+
+    Attributes:
+        suppressed (int): Number of collapsed records.
+
+    """
+
+    SUMMARY_ATTR: str = "dedup_summary"
+    """Attribute set on summary records, which the filter lets through."""
+
+    def __init__(
+        self, handler: Handler, window: float = 10.0, max_entries: int = 1024
+    ) -> None:
+        self.handler = handler
+        self.window = window
+        self.max_entries = max(max_entries, 1)
+        self.suppressed = 0
+
+        # fingerprint: [first time, repeated count, last repeated record]
+        self._entries: "OrderedDict[Hashable, List]" = OrderedDict()
+        self._lock = Lock()
+        self._next_sweep = monotonic() + window
+
+        # After the drain, so the queued duplicates are counted.
+        register_filter(self, after_drain=True)
+
+    @staticmethod
+    def fingerprint(record: LogRecord) -> Hashable:
+        """Key of the record, with the types of the args.
+
+        1, 1.0 and True are equal, but render differently.
+
+        """
+
+        args = record.args
+        if isinstance(args, tuple):
+            key: Hashable = tuple((arg.__class__, arg) for arg in args)
+        else:
+            key = (args.__class__, args)
+        try:
+            hash(key)
+        except TypeError:
+            key = repr(args)
+
+        return (record.msg, key, record.levelno)
+
+    def filter(self, record: LogRecord) -> bool:
+        if getattr(record, self.SUMMARY_ATTR, False):
+            return True
+
+        key = self.fingerprint(record)
+        now = monotonic()
+
+        summaries: List[Tuple[LogRecord, int]] = []
+        with self._lock:
+            entries = self._entries
+            entry = entries.get(key)
+            if entry is not None and now - entry[0] < self.window:
+                entries.move_to_end(key)
+                entry[1] += 1
+                entry[2] = record
+                self.suppressed += 1
+                allowed = False
+            else:
+                if entry is not None and entry[1]:
+                    summaries.append((entry[2], entry[1]))
+                entries[key] = [now, 0, None]
+                entries.move_to_end(key)
+                if len(entries) > self.max_entries:
+                    _, old = entries.popitem(last=False)
+                    if old[1]:
+                        summaries.append((old[2], old[1]))
+                allowed = True
+
+            if now >= self._next_sweep:
+                self._next_sweep = now + self.window
+                summaries.extend(self._pop_expired(now))
+
+        for last, count in summaries:
+            self._emit_summary(last, count)
+
+        return allowed
+
+    def flush(self) -> None:
+        """Hand the summaries of every collapsed record to the handler now."""
+
+        with self._lock:
+            summaries = self._pop_expired(None)
+
+        for last, count in summaries:
+            self._emit_summary(last, count)
+
+    def _pop_expired(self, now) -> List[Tuple[LogRecord, int]]:
+        summaries = []
+        for entry in self._entries.values():
+            if entry[1] and (now is None or now - entry[0] >= self.window):
+                summaries.append((entry[2], entry[1]))
+                entry[1] = 0
+                entry[2] = None
+
+        return summaries
+
+    def _emit_summary(self, last: LogRecord, count: int) -> None:
+        summary = makeLogRecord(last.__dict__)
+        summary.msg = "%s (repeated %d times)"
+        summary.args = (last.getMessage(), count)
+        summary.exc_info = None
+        summary.exc_text = None
+        setattr(summary, self.SUMMARY_ATTR, True)
+
+        self.handler.handle(summary)
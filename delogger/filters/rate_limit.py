@@ -0,0 +1,172 @@
+from collections import OrderedDict
+from logging import LogRecord
+from logging import getLogger
+from threading import Lock
+from threading import Timer
+from time import monotonic
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from delogger.handlers.shutdown import register_filter
+
+__all__ = ["RateLimitFilter"]
+
+SiteKey = Tuple[str, int, str, int]
+
+
+class RateLimitFilter:
+    """A filter that limits the records of each call site with a token bucket.
+
+    A call site is (logger name, level, pathname, lineno). Each site may
+    output burst records at once and then rate records per second. Every
+    summary_interval seconds, a "suppressed N records from site" record is
+    logged for each site that lost records, through the logger of the site.
+    A timer logs the summaries when no record comes after the interval, and
+    the remaining ones are logged on flush, on close and at exit.
+
+    The sites are kept in a LRU table of at most max_sites entries, so the
+    cost per record is O(1) and the memory is bounded.
+
+    Args:
+        rate (float): Records per second of each site.
+        rates (dict): Records per second of each site by level.
+        burst (float): Bucket size. The rate of the level, at least 1, if None.
+        max_sites (int): Maximum number of tracked sites.
+        summary_interval (float): Seconds between the suppressed summaries.
+
+    Attributes:
+        suppressed (int): Number of suppressed records.
+
+    """
+
+    SUMMARY_ATTR: str = "rate_limit_summary"
+    """Attribute set on summary records, which the filter lets through."""
+
+    def __init__(
+        self,
+        rate: float = 10.0,
+        rates: Optional[Dict[int, float]] = None,
+        burst: Optional[float] = None,
+        max_sites: int = 1024,
+        summary_interval: float = 60.0,
+    ) -> None:
+        self.rate = rate
+        self.rates = rates or {}
+        self.burst = burst
+        self.max_sites = max(max_sites, 1)
+        self.summary_interval = summary_interval
+        self.suppressed = 0
+
+        # site key: [tokens, last time, suppressed since the last summary]
+        self._sites: "OrderedDict[SiteKey, List]" = OrderedDict()
+        self._lock = Lock()
+        self._next_summary = monotonic() + summary_interval
+        self._timer: Optional[Timer] = None
+
+        register_filter(self)
+
+    def filter(self, record: LogRecord) -> bool:
+        if getattr(record, self.SUMMARY_ATTR, False):
+            return True
+
+        levelno = record.levelno
+        rate = self.rates.get(levelno, self.rate)
+        burst = self.burst if self.burst is not None else max(rate, 1)
+        key = (record.name, levelno, record.pathname, record.lineno)
+        now = monotonic()
+
+        summaries: List[Tuple[SiteKey, int]] = []
+        with self._lock:
+            sites = self._sites
+            site = sites.get(key)
+            if site is None:
+                site = sites[key] = [burst, now, 0]
+                if len(sites) > self.max_sites:
+                    old_key, old_site = sites.popitem(last=False)
+                    if old_site[2]:
+                        summaries.append((old_key, old_site[2]))
+            else:
+                sites.move_to_end(key)
+                site[0] = min(burst, site[0] + (now - site[1]) * rate)
+                site[1] = now
+
+            allowed = site[0] >= 1
+            if allowed:
+                site[0] -= 1
+            else:
+                site[2] += 1
+                self.suppressed += 1
+                if self._timer is None:
+                    self._start_timer(now)
+
+            if now >= self._next_summary:
+                self._next_summary = now + self.summary_interval
+                summaries.extend(self._pop_suppressed())
+
+        if summaries:
+            self._log_summaries(summaries)
+
+        return allowed
+
+    def flush(self) -> None:
+        """Log the summaries of the sites that lost records now."""
+
+        with self._lock:
+            summaries = self._pop_suppressed()
+
+        self._log_summaries(summaries)
+
+    def close(self) -> None:
+        """Stop the timer and log the remaining summaries."""
+
+        with self._lock:
+            timer, self._timer = self._timer, None
+            summaries = self._pop_suppressed()
+
+        if timer is not None:
+            timer.cancel()
+        self._log_summaries(summaries)
+
+    def _start_timer(self, now: float) -> None:
+        # Called with the lock held.
+        timer = Timer(max(self._next_summary - now, 0), self._on_timer)
+        timer.daemon = True
+        self._timer = timer
+        timer.start()
+
+    def _on_timer(self) -> None:
+        with self._lock:
+            if self._timer is None:
+                return
+
+            self._timer = None
+            self._next_summary = monotonic() + self.summary_interval
+            summaries = self._pop_suppressed()
+
+        self._log_summaries(summaries)
+
+    def _pop_suppressed(self) -> List[Tuple[SiteKey, int]]:
+        summaries = []
+        for key, site in self._sites.items():
+            if site[2]:
+                summaries.append((key, site[2]))
+                site[2] = 0
+
+        return summaries
+
+    def _log_summaries(self, summaries: List[Tuple[SiteKey, int]]) -> None:
+        for (name, levelno, pathname, lineno), count in summaries:
+            logger = getLogger(name)
+            record = logger.makeRecord(
+                name,
+                levelno,
+                pathname,
+                lineno,
+                "suppressed %d records from %s:%d",
+                (count, pathname, lineno),
+                None,
+            )
+            setattr(record, self.SUMMARY_ATTR, True)
+            logger.handle(record)
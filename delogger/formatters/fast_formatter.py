@@ -0,0 +1,108 @@
+from logging import Formatter
+from logging import LogRecord
+import re
+import time
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+__all__ = ["FastFormatter"]
+
+_FIELD_RE = re.compile(
+    r"%\((\w+)\)([#0+ -]*(?:\d+)?(?:\.\d+)?[diouxefgcrsa%])", re.IGNORECASE
+)
+
+_RECORD_ATTRS = frozenset(LogRecord("", 0, "", 0, "", None, None).__dict__)
+
+
+class FastFormatter(Formatter):
+    """Formatter that compiles the % style fmt into a render function.
+
+    The fields are read straight from the record into a positional format
+    string, and the date part of asctime is cached for the current second,
+    so only the milliseconds are formatted per record. The output is the
+    same as logging.Formatter.
+
+    Other styles and fmts the compiler does not handle fall back to
+    logging.Formatter.
+
+    Args:
+        fmt (str): Log format.
+        datefmt (str): Date format of asctime.
+        style (str): Format style.
+
+    """
+
+    def __init__(
+        self, fmt: Optional[str] = None, datefmt: Optional[str] = None, style: str = "%"
+    ) -> None:
+        super().__init__(fmt, datefmt, style)
+
+        # (second, datefmt, formatted date) of the last record.
+        self._time_cache: Tuple[int, Optional[str], str] = (-1, None, "")
+        self._render = self._compile(self._fmt) if style == "%" else None
+
+    def _compile(self, fmt: str) -> Optional[Callable[[LogRecord], str]]:
+        """Compile the fmt into a function, or None if it is not supported."""
+
+        parts: List[str] = []
+        values: List[str] = []
+        pos = 0
+        for match in _FIELD_RE.finditer(fmt):
+            literal = fmt[pos : match.start()]
+            if "%" in literal.replace("%%", ""):
+                return None
+
+            name, spec = match.groups()
+            parts.append(literal)
+            parts.append("%" + spec)
+            if name in _RECORD_ATTRS or name in ("message", "asctime"):
+                values.append(f"record.{name}")
+            else:
+                values.append(f"attrs[{name!r}]")
+            pos = match.end()
+
+        literal = fmt[pos:]
+        if "%" in literal.replace("%%", ""):
+            return None
+        parts.append(literal)
+
+        template = "".join(parts)
+        if not values:
+            template = template.replace("%%", "%")
+            return lambda record: template
+
+        source = (
+            "def render(record):\n"
+            "    attrs = record.__dict__\n"
+            f"    return template % ({', '.join(values)},)\n"
+        )
+        namespace: Dict[str, Any] = {"template": template}
+        exec(source, namespace)  # nosec
+
+        return namespace["render"]
+
+    def formatTime(self, record: LogRecord, datefmt: Optional[str] = None) -> str:
+        second = int(record.created)
+        cached_second, cached_datefmt, text = self._time_cache
+        if second != cached_second or datefmt != cached_datefmt:
+            ct = self.converter(second)
+            text = time.strftime(datefmt or self.default_time_format, ct)
+            self._time_cache = (second, datefmt, text)
+
+        if datefmt or not self.default_msec_format:
+            return text
+
+        return self.default_msec_format % (text, record.msecs)
+
+    def formatMessage(self, record: LogRecord) -> str:
+        if self._render is None:
+            return super().formatMessage(record)
+
+        try:
+            return self._render(record)
+        except KeyError as e:
+            raise ValueError("Formatting field not found in record: %s" % e)
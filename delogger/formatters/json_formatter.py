@@ -0,0 +1,199 @@
+import json
+from json.encoder import encode_basestring
+from logging import Formatter
+from logging import LogRecord
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Optional
+from typing import Sequence
+
+try:
+    import orjson
+
+    _can_orjson = True
+except ImportError:  # pragma: no cover
+    _can_orjson = False
+
+__all__ = ["JsonFormatter"]
+
+_BASE_RECORD = LogRecord("", 0, "", 0, "", None, None)
+
+RECORD_ATTRS = frozenset(_BASE_RECORD.__dict__)
+"""Attributes of every LogRecord."""
+
+RESERVED_ATTRS = RECORD_ATTRS | {"message", "asctime"}
+"""Attributes that are not extra fields."""
+
+
+# json.dumps builds a new encoder per call when it has options.
+_json_dumps = json.JSONEncoder(
+    ensure_ascii=False, separators=(",", ":"), default=str
+).encode
+
+
+def _orjson_dumps(data: Dict[str, Any]) -> str:
+    try:
+        return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS).decode(
+            "utf-8"
+        )
+    except TypeError:
+        # e.g. integers over 64 bits.
+        return _json_dumps(data)
+
+
+class JsonFormatter(Formatter):
+    """Formatter that outputs each record as one line of JSON.
+
+    The fields are chosen once and compiled into an encoder function that
+    reads them straight from the record. The exception, the stack and the
+    extra fields are only looked at when the record has them.
+
+    Args:
+        fields (list): Fields to output in order. Record attributes, and
+            "message" and "asctime" rendered like Formatter.
+        datefmt (str): Date format of asctime. The date and time with
+            milliseconds, like the text format of the file modes, if None.
+        extra (bool): Whether to output the fields given with extra=.
+        rename (dict): JSON key of each field.
+        backend (str): "orjson", "json" or "auto" to use orjson if it is
+            installed.
+
+    Attributes:
+        fields (tuple): Fields to output.
+        backend (str): JSON backend in use.
+
+    """
+
+    DEFAULT_FIELDS = (
+        "asctime",
+        "levelname",
+        "name",
+        "filename",
+        "lineno",
+        "funcName",
+        "message",
+    )
+    """Default fields, the same as the text format of the file modes."""
+
+    default_time_format = "%Y-%m-%d %H:%M:%S"
+    default_msec_format = "%s.%03d"
+    """asctime without datefmt, e.g. 2020-01-01 12:00:00.123."""
+
+    BACKENDS = ("auto", "orjson", "json")
+
+    def __init__(
+        self,
+        fields: Optional[Sequence[str]] = None,
+        datefmt: Optional[str] = None,
+        extra: bool = True,
+        rename: Optional[Dict[str, str]] = None,
+        backend: str = "auto",
+    ) -> None:
+        super().__init__(datefmt=datefmt)
+
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown backend: {backend}")
+        if backend == "orjson" and not _can_orjson:
+            raise ValueError("orjson is not installed")
+        if backend == "auto":
+            backend = "orjson" if _can_orjson else "json"
+
+        self.fields = tuple(fields or self.DEFAULT_FIELDS)
+        self.extra = extra
+        self.rename = rename or {}
+        self.backend = backend
+
+        self._dumps: Callable[[Dict[str, Any]], str] = (
+            _orjson_dumps if backend == "orjson" else _json_dumps
+        )
+        self._names = frozenset(self.rename.get(f, f) for f in self.fields)
+        self._encode = self._compile()
+        self._base_len = len(RECORD_ATTRS)
+
+    def _compile(self) -> Callable[[LogRecord], Any]:
+        """Compile the fields into an encoder function.
+
+        The orjson encoder makes the JSON object as a dict. The stdlib
+        encoder writes the JSON text directly, encoding str and int values
+        inline and only falling back to json for other types.
+
+        """
+
+        names = []
+        lines = []
+        for i, field in enumerate(self.fields):
+            if not field.isidentifier():
+                raise ValueError(f"Invalid field: {field}")
+
+            if field == "message":
+                expr = "record.getMessage()"
+            elif field == "asctime":
+                expr = "format_time(record, datefmt)"
+            elif field in RECORD_ATTRS:
+                expr = f"record.{field}"
+            else:
+                expr = f"getattr(record, {field!r}, None)"
+
+            names.append(self.rename.get(field, field))
+            lines.append(f"    v{i} = {expr}\n")
+
+        if self.backend == "orjson":
+            items = ", ".join(f"{name!r}: v{i}" for i, name in enumerate(names))
+            ret = f"    return {{{items}}}\n"
+        else:
+            parts = []
+            for i, name in enumerate(names):
+                sep = "{" if i == 0 else ","
+                parts.append(repr(sep + _json_dumps(name) + ":"))
+                parts.append(
+                    f"(enc_str(v{i}) if v{i}.__class__ is str else "
+                    f"str(v{i}) if v{i}.__class__ is int else dumps(v{i}))"
+                )
+            parts.append(repr("}" if names else "{}"))
+            ret = f"    return ''.join(({', '.join(parts)},))\n"
+
+        source = "def encode(record):\n" + "".join(lines) + ret
+        namespace: Dict[str, Any] = {
+            "format_time": self.formatTime,
+            "datefmt": self.datefmt,
+            "enc_str": encode_basestring,
+            "dumps": _json_dumps,
+        }
+        exec(source, namespace)  # nosec
+
+        return namespace["encode"]
+
+    def format(self, record: LogRecord) -> str:
+        encoded = self._encode(record)
+
+        lazy = None
+        if record.exc_info or record.exc_text or record.stack_info:
+            lazy = {}
+            if record.exc_info and not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+            if record.exc_text:
+                lazy["exc_info"] = record.exc_text
+            if record.stack_info:
+                lazy["stack_info"] = self.formatStack(record.stack_info)
+
+        attrs = record.__dict__
+        if self.extra and len(attrs) > self._base_len:
+            lazy = lazy or {}
+            for key, value in attrs.items():
+                if key not in RESERVED_ATTRS and key not in self._names:
+                    lazy[key] = value
+
+        if self.backend == "orjson":
+            if lazy:
+                encoded.update(lazy)
+            return self._dumps(encoded)
+
+        if not lazy:
+            return encoded
+
+        lazy_text = self._dumps(lazy)
+        if encoded == "{}":
+            return lazy_text
+
+        return encoded[:-1] + "," + lazy_text[1:]
@@ -0,0 +1,114 @@
+from abc import ABC
+from abc import abstractmethod
+from concurrent.futures import Executor
+from concurrent.futures import ThreadPoolExecutor
+from logging import Handler
+from logging import LogRecord
+from typing import List
+from typing import Optional
+from typing import Sequence
+
+from delogger.handlers.queue_listener import handle_batch
+from delogger.util.aio import get_running_loop
+from delogger.util.aio import run
+
+__all__ = ["AsyncHandlerBase", "AsyncExecutorHandler", "handle_batch_async"]
+
+
+class AsyncHandlerBase(Handler, ABC):
+    """Handler whose output is a coroutine.
+
+    DeloggerAsync awaits emit_batch_async from the task of the event loop.
+    Subclasses implement emit_async, and emit_batch_async if they can output
+    several records at once.
+
+    """
+
+    @abstractmethod
+    async def emit_async(self, record: LogRecord) -> None:
+        """Output the record."""
+
+    async def emit_batch_async(self, records: Sequence[LogRecord]) -> None:
+        for record in records:
+            await self.emit_async(record)
+
+    async def aclose(self) -> None:
+        self.close()
+
+    def emit(self, record: LogRecord) -> None:
+        """Output the record when the handler is used outside of an event loop."""
+
+        try:
+            run(self.emit_async(record))
+        except Exception:
+            self.handleError(record)
+
+
+async def handle_batch_async(
+    handler: AsyncHandlerBase, records: Sequence[LogRecord]
+) -> None:
+    """Let the async handler output the records that pass its filters.
+
+    Args:
+        handler (AsyncHandlerBase): Handler to output.
+        records (list): Records to output.
+
+    """
+
+    accepted: List[LogRecord] = []
+    for record in records:
+        rv = handler.filter(record)
+        if not rv:
+            continue
+        accepted.append(rv if isinstance(rv, LogRecord) else record)
+
+    if not accepted:
+        return
+
+    try:
+        await handler.emit_batch_async(accepted)
+    except Exception:
+        handler.handleError(accepted[-1])
+
+
+class AsyncExecutorHandler(AsyncHandlerBase):
+    """Run a blocking handler in an executor.
+
+    The records are passed to the handler with handle_batch, so file
+    handlers write each batch at once.
+
+    Args:
+        handler (Handler): Blocking handler, e.g. a file handler.
+        executor (Executor): Executor to run the handler. A single thread
+            executor is used by default to keep the order of the records.
+
+    Attributes:
+        handler (Handler): Blocking handler.
+        executor (Executor): Executor to run the handler.
+
+    """
+
+    def __init__(self, handler: Handler, executor: Optional[Executor] = None) -> None:
+        super().__init__(handler.level)
+
+        self.handler = handler
+        self._own_executor = executor is None
+        self.executor: Executor = executor or ThreadPoolExecutor(max_workers=1)
+
+    async def emit_async(self, record: LogRecord) -> None:
+        await self.emit_batch_async([record])
+
+    async def emit_batch_async(self, records: Sequence[LogRecord]) -> None:
+        loop = get_running_loop()
+        await loop.run_in_executor(self.executor, handle_batch, self.handler, records)
+
+    async def aclose(self) -> None:
+        loop = get_running_loop()
+        await loop.run_in_executor(self.executor, self.handler.close)
+        self.close()
+
+    def close(self) -> None:
+        if self._own_executor:
+            self.executor.shutdown(wait=False)
+
+        super().close()
@@ -0,0 +1,72 @@
+import asyncio
+from logging import LogRecord
+from typing import Sequence
+from urllib.parse import urlsplit
+
+from delogger.handlers.async_handler import AsyncHandlerBase
+from delogger.handlers.slack import SlackHandler
+
+__all__ = ["AsyncSlackHandler"]
+
+
+class AsyncSlackHandler(SlackHandler, AsyncHandlerBase):
+    """SlackHandler that posts with asyncio.open_connection.
+
+    It takes the same arguments as SlackHandler. Outside of an event loop
+    it sends with urllib like SlackHandler.
+
+    """
+
+    async def emit_async(self, record: LogRecord) -> None:
+        if not self.is_emit:
+            return
+
+        try:
+            await self.send_async(self.make_payload(record))
+        except Exception:
+            self.handleError(record)
+
+    async def emit_batch_async(self, records: Sequence[LogRecord]) -> None:
+        """Send the records, joining them into as few messages as possible."""
+
+        if not self.is_emit:
+            return
+
+        for record, payload in self.iter_batch_payloads(records):
+            try:
+                await self.send_async(payload)
+            except Exception:
+                self.handleError(record)
+
+    async def send_async(self, payload: bytes) -> None:
+        await asyncio.wait_for(self._post(payload), self.TIMEOUT)
+
+    async def _post(self, payload: bytes) -> None:
+        url = urlsplit(self.url)
+        is_https = url.scheme == "https"
+        port = url.port or (443 if is_https else 80)
+        path = url.path or "/"
+        if url.query:
+            path = f"{path}?{url.query}"
+
+        reader, writer = await asyncio.open_connection(
+            url.hostname, port, ssl=is_https or None
+        )
+        try:
+            headers = dict(self.headers)
+            headers["Host"] = url.netloc
+            headers["Content-Length"] = str(len(payload))
+            headers["Connection"] = "close"
+
+            lines = [f"POST {path} HTTP/1.1"]
+            lines.extend(f"{key}: {value}" for key, value in headers.items())
+            head = "\r\n".join(lines) + "\r\n\r\n"
+            writer.write(head.encode("latin-1") + payload)
+            await writer.drain()
+
+            status_line = await reader.readline()
+            status = int(status_line.split()[1])
+            if not 200 <= status < 300:
+                raise ConnectionError(f"Slack responded with status {status}")
+        finally:
+            writer.close()
@@ -0,0 +1,182 @@
+from abc import ABC
+from abc import abstractmethod
+from collections import Counter
+from logging import LogRecord
+from logging import WARNING
+from queue import Empty
+from queue import Full
+from threading import Lock
+from typing import Dict
+from typing import Optional
+
+__all__ = [
+    "BackpressurePolicy",
+    "BlockPolicy",
+    "DropNewestPolicy",
+    "DropOldestPolicy",
+    "DropBelowLevelPolicy",
+]
+
+
+class BackpressurePolicy(ABC):
+    """Decide what happens to a record when the bounded queue is full.
+
+    Attributes:
+        dropped (int): Number of records dropped by this policy.
+        dropped_levels (Counter): Number of dropped records per level.
+
+    """
+
+    def __init__(self) -> None:
+        self.dropped: int = 0
+        self.dropped_levels: Counter = Counter()
+
+        self._lock = Lock()
+
+    @abstractmethod
+    def put(self, queue, record: LogRecord) -> bool:
+        """Put the record into the queue.
+
+        Returns:
+            True if the record was enqueued, False if it was dropped.
+
+        """
+
+    def counters(self) -> Dict[str, int]:
+        """Get a snapshot of the drop counters."""
+
+        with self._lock:
+            counters = {"dropped": self.dropped}
+            for levelno, count in self.dropped_levels.items():
+                counters[f"dropped_{levelno}"] = count
+
+        return counters
+
+    def reset(self) -> None:
+        with self._lock:
+            self.dropped = 0
+            self.dropped_levels.clear()
+
+    def _drop(self, record) -> None:
+        with self._lock:
+            self.dropped += 1
+            self.dropped_levels[getattr(record, "levelno", 0)] += 1
+
+
+class BlockPolicy(BackpressurePolicy):
+    """Block the caller until there is room in the queue.
+
+    Args:
+        timeout (float): Seconds to wait before dropping the record.
+            Wait forever if None.
+
+    """
+
+    def __init__(self, timeout: Optional[float] = None) -> None:
+        super().__init__()
+
+        self.timeout = timeout
+
+    def put(self, queue, record: LogRecord) -> bool:
+        try:
+            queue.put(record, True, self.timeout)
+        except Full:
+            self._drop(record)
+            return False
+
+        return True
+
+
+class DropNewestPolicy(BackpressurePolicy):
+    """Drop the incoming record when the queue is full."""
+
+    def put(self, queue, record: LogRecord) -> bool:
+        try:
+            queue.put_nowait(record)
+        except Full:
+            self._drop(record)
+            return False
+
+        return True
+
+
+class DropOldestPolicy(BackpressurePolicy):
+    """Evict the oldest queued record to make room for the incoming one.
+
+    Control items such as flush barriers and the stop sentinel are never
+    evicted. They are put back at the end of the queue. Each queued item is
+    looked at once at most, and the incoming record is dropped when no
+    record can be evicted, so the caller never spins nor blocks.
+
+    """
+
+    def put(self, queue, record: LogRecord) -> bool:
+        held = None
+        try:
+            for _ in range(queue.qsize() + 1):
+                try:
+                    queue.put_nowait(record)
+                    return True
+                except Full:
+                    pass
+
+                try:
+                    evicted = queue.get_nowait()
+                except Empty:
+                    continue
+
+                if hasattr(queue, "task_done"):
+                    queue.task_done()
+
+                # Records (and routed records) carry a level, control items do not.
+                if hasattr(evicted, "levelno"):
+                    self._drop(evicted)
+                    if held is None:
+                        continue
+                    evicted, held = held, None
+
+                try:
+                    queue.put_nowait(evicted)
+                except Full:
+                    # Another producer took the freed slot, the next evicted
+                    # record makes room for the control item.
+                    held = evicted
+
+            self._drop(record)
+            return False
+        finally:
+            if held is not None:
+                # Only when the other producers filled the queue with control
+                # items, which the listener takes soon.
+                queue.put(held)
+
+
+class DropBelowLevelPolicy(BackpressurePolicy):
+    """Drop records below the level when the queue is full.
+
+    Records at or above the level block like BlockPolicy.
+
+    Args:
+        level (int): Records below this level are dropped.
+        timeout (float): Seconds to wait for records at or above the level.
+            Wait forever if None.
+
+    """
+
+    def __init__(self, level: int = WARNING, timeout: Optional[float] = None) -> None:
+        super().__init__()
+
+        self.level = level
+        self.timeout = timeout
+
+    def put(self, queue, record: LogRecord) -> bool:
+        try:
+            if record.levelno < self.level:
+                queue.put_nowait(record)
+            else:
+                queue.put(record, True, self.timeout)
+        except Full:
+            self._drop(record)
+            return False
+
+        return True
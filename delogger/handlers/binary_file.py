@@ -0,0 +1,345 @@
+import json
+from logging import Formatter
+from logging import LogRecord
+from logging import makeLogRecord
+import os
+import struct
+from typing import Any
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+from delogger.handlers.count_rotating_file import CountRotatingFileHandler
+
+__all__ = ["BinaryFileHandler", "iter_binary_file"]
+
+MAGIC = b"DLBIN\x01"
+
+# entry tags
+T_HEADER = 0
+T_TEMPLATE = 1
+T_RECORD = 2
+T_MESSAGE = 3
+
+# tag, template id, created, flags, number of args
+RECORD = struct.Struct("<BIdBB")
+# tag, template id, length of the json template
+TEMPLATE = struct.Struct("<BII")
+U32 = struct.Struct("<I")
+
+# record flags
+F_EXC_TEXT = 1
+F_STACK_INFO = 2
+
+# arg types
+A_NONE = 0
+A_TRUE = 1
+A_FALSE = 2
+A_INT = 3
+A_FLOAT = 4
+A_STR = 5
+A_INT32 = 6
+A_STR8 = 7
+
+_A_INT = struct.Struct("<Bq")
+_A_INT32 = struct.Struct("<Bi")
+_A_FLOAT = struct.Struct("<Bd")
+_A_STR = struct.Struct("<BI")
+_A_STR8 = struct.Struct("<BB")
+_INT32_MIN = -(2**31)
+_INT32_MAX = 2**31 - 1
+_INT_MIN = -(2**63)
+_INT_MAX = 2**63 - 1
+
+_formatter = Formatter()
+
+TemplateKey = Tuple[str, int, str, str, int, Optional[str]]
+
+
+def _pack_args(args: Sequence) -> Optional[bytes]:
+    """Pack the args, or None if an arg is not None, bool, int, float or str."""
+
+    parts: List[bytes] = []
+    for arg in args:
+        arg_type = type(arg)
+        if arg_type is str:
+            data = arg.encode("utf-8", "surrogatepass")
+            if len(data) < 256:
+                parts.append(_A_STR8.pack(A_STR8, len(data)))
+            else:
+                parts.append(_A_STR.pack(A_STR, len(data)))
+            parts.append(data)
+        elif arg_type is int:
+            if _INT32_MIN <= arg <= _INT32_MAX:
+                parts.append(_A_INT32.pack(A_INT32, arg))
+            elif _INT_MIN <= arg <= _INT_MAX:
+                parts.append(_A_INT.pack(A_INT, arg))
+            else:
+                return None
+        elif arg_type is float:
+            parts.append(_A_FLOAT.pack(A_FLOAT, arg))
+        elif arg is None:
+            parts.append(b"\x00")
+        elif arg is True:
+            parts.append(b"\x01")
+        elif arg is False:
+            parts.append(b"\x02")
+        else:
+            return None
+
+    return b"".join(parts)
+
+
+def _pack_str(text: str) -> bytes:
+    data = text.encode("utf-8", "surrogatepass")
+    return U32.pack(len(data)) + data
+
+
+class BinaryFileHandler(CountRotatingFileHandler):
+    """CountRotatingFileHandler that writes a compact binary log.
+
+    The name, level, msg and call site of a record are written once per
+    file as a template, and each record is then the template id, the
+    created time, and the args packed by type. Records whose args are not
+    None, bool, int, float or str, or whose msg is not a str, are written
+    with their rendered message. The exception and stack texts are kept,
+    the extra attributes are not.
+
+    The handlers of a file share its writer and its template table, so
+    they write one header and one set of templates. Each batch is encoded
+    and written under the lock of the writer.
+
+    Decode the file with `python -m delogger decode`, or iter_binary_file.
+
+    Args:
+        filepath (str): log filepath.
+        backup_count (int): Leave logs up to the designated generation.
+
+    """
+
+    terminator = ""
+
+    CONTEXT_KEY: str = "binary_templates"
+    """Key of the template table in the context of the shared writer."""
+
+    def __init__(self, filepath: str, backup_count: int = 5) -> None:
+        super().__init__(filepath, backup_count, mode="ab")
+
+    def _open(self):
+        stream = super()._open()
+        with stream.lock:
+            # The first handler of the open file writes the header.
+            if self.CONTEXT_KEY not in stream.context:
+                stream.write(bytes((T_HEADER,)) + MAGIC)
+                stream.context[self.CONTEXT_KEY] = {}
+
+        return stream
+
+    def encode(self, record: LogRecord, templates: Dict[TemplateKey, int]) -> bytes:
+        """Encode a record into entries of the binary log.
+
+        Args:
+            record (LogRecord): Record.
+            templates (dict): Template ids of the file, updated with the
+                template of the record if it is new.
+
+        """
+
+        msg = record.msg
+        args = record.args
+        packed = None
+        if type(msg) is str and (not args or type(args) is tuple and len(args) < 256):
+            packed = _pack_args(args) if args else b""
+
+        key = (
+            record.name,
+            record.levelno,
+            msg if packed is not None else "",
+            record.pathname,
+            record.lineno,
+            record.funcName,
+        )
+        entries: List[bytes] = []
+        template_id = templates.get(key)
+        if template_id is None:
+            template_id = templates[key] = len(templates)
+            data = json.dumps(
+                [key[0], key[1], record.levelname, *key[2:]], ensure_ascii=False
+            ).encode("utf-8", "surrogatepass")
+            entries.append(TEMPLATE.pack(T_TEMPLATE, template_id, len(data)))
+            entries.append(data)
+
+        if record.exc_info and not record.exc_text:
+            formatter = self.formatter or _formatter
+            record.exc_text = formatter.formatException(record.exc_info)
+        flags = 0
+        if record.exc_text:
+            flags |= F_EXC_TEXT
+        if record.stack_info:
+            flags |= F_STACK_INFO
+
+        if packed is None:
+            entries.append(
+                RECORD.pack(T_MESSAGE, template_id, record.created, flags, 0)
+            )
+            entries.append(_pack_str(record.getMessage()))
+        else:
+            entries.append(
+                RECORD.pack(T_RECORD, template_id, record.created, flags, len(args))
+            )
+            entries.append(packed)
+
+        if flags & F_EXC_TEXT:
+            entries.append(_pack_str(record.exc_text))
+        if flags & F_STACK_INFO:
+            entries.append(_pack_str(record.stack_info))
+
+        return b"".join(entries)
+
+    def emit(self, record) -> None:
+        self.emit_batch((record,))
+
+    def emit_batch(self, records: Sequence) -> None:
+        """Write the records with a single write and flush."""
+
+        if self.stream is None:
+            try:
+                self.stream = self._open()
+            except Exception:
+                self.handleError(records[-1])
+                return
+
+        stream = self.stream
+        with stream.lock:
+            templates = stream.context[self.CONTEXT_KEY]
+            data: List[bytes] = []
+            for record in records:
+                try:
+                    data.append(self.encode(record, templates))
+                except Exception:
+                    self.handleError(record)
+
+            try:
+                stream.write(b"".join(data))
+            except Exception:
+                self.handleError(records[-1])
+                return
+
+        try:
+            self.flush()
+        except Exception:
+            self.handleError(records[-1])
+
+
+class _Reader:
+    def __init__(self, data: bytes) -> None:
+        self.data = data
+        self.pos = 0
+
+    def unpack(self, st: struct.Struct) -> Tuple:
+        values = st.unpack_from(self.data, self.pos)
+        self.pos += st.size
+        return values
+
+    def read(self, size: int) -> bytes:
+        if self.pos + size > len(self.data):
+            raise EOFError
+        data = self.data[self.pos : self.pos + size]
+        self.pos += size
+        return data
+
+    def read_str(self) -> str:
+        (size,) = self.unpack(U32)
+        return self.read(size).decode("utf-8", "surrogatepass")
+
+    def read_args(self, count: int) -> Tuple:
+        args: List[Any] = []
+        for _ in range(count):
+            arg_type = self.data[self.pos]
+            if arg_type == A_STR8:
+                args.append(self.read_str_arg(_A_STR8))
+            elif arg_type == A_INT32:
+                args.append(self.unpack(_A_INT32)[1])
+            elif arg_type == A_STR:
+                args.append(self.read_str_arg(_A_STR))
+            elif arg_type == A_INT:
+                args.append(self.unpack(_A_INT)[1])
+            elif arg_type == A_FLOAT:
+                args.append(self.unpack(_A_FLOAT)[1])
+            else:
+                self.pos += 1
+                args.append((None, True, False)[arg_type])
+
+        return tuple(args)
+
+    def read_str_arg(self, st: struct.Struct) -> str:
+        _, size = self.unpack(st)
+        return self.read(size).decode("utf-8", "surrogatepass")
+
+
+def iter_binary_file(filepath: str) -> Iterator[LogRecord]:
+    """Iterate the records of a binary log file.
+
+    A record cut off at the end of the file, e.g. by a crash, is skipped.
+
+    Yields:
+        LogRecord with the attributes of the file format, and msecs as
+        LogRecord computes them.
+
+    """
+
+    with open(filepath, "rb") as f:
+        reader = _Reader(f.read())
+
+    data = reader.data
+    templates: Dict[int, List] = {}
+    try:
+        while reader.pos < len(data):
+            tag = data[reader.pos]
+            if tag == T_HEADER:
+                reader.pos += 1
+                if reader.read(len(MAGIC)) != MAGIC:
+                    raise ValueError(f"Not a binary log file: {filepath}")
+                templates = {}
+            elif tag == T_TEMPLATE:
+                _, template_id, size = reader.unpack(TEMPLATE)
+                templates[template_id] = json.loads(reader.read(size).decode("utf-8"))
+            elif tag in (T_RECORD, T_MESSAGE):
+                _, template_id, created, flags, nargs = reader.unpack(RECORD)
+                name, levelno, levelname, msg, pathname, lineno, func = templates[
+                    template_id
+                ]
+                if tag == T_RECORD:
+                    args = reader.read_args(nargs)
+                else:
+                    msg, args = reader.read_str(), ()
+
+                exc_text = reader.read_str() if flags & F_EXC_TEXT else None
+                stack_info = reader.read_str() if flags & F_STACK_INFO else None
+
+                filename = os.path.basename(pathname)
+                yield makeLogRecord(
+                    {
+                        "name": name,
+                        "msg": msg,
+                        "args": args,
+                        "levelname": levelname,
+                        "levelno": levelno,
+                        "pathname": pathname,
+                        "filename": filename,
+                        "module": os.path.splitext(filename)[0],
+                        "lineno": lineno,
+                        "funcName": func,
+                        "created": created,
+                        "msecs": int((created - int(created)) * 1000) + 0.0,
+                        "exc_text": exc_text,
+                        "stack_info": stack_info,
+                    }
+                )
+            else:
+                raise ValueError(f"Unknown entry {tag} at {reader.pos}: {filepath}")
+    except (EOFError, struct.error, IndexError):
+        return
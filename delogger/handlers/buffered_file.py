@@ -0,0 +1,159 @@
+from logging import ERROR
+import threading
+from time import monotonic
+from typing import List
+from typing import Optional
+from typing import Sequence
+
+from delogger.handlers.count_rotating_file import CountRotatingFileHandler
+
+__all__ = ["BufferedFileHandler"]
+
+
+class BufferedFileHandler(CountRotatingFileHandler):
+    """CountRotatingFileHandler that writes the formatted records in chunks.
+
+    The records are formatted on emit and kept in memory, and the buffer is
+    written with one write call when any of these happens:
+
+    - The buffer holds buffer_size characters or more.
+    - The oldest buffered record is flush_interval_ms old. A daemon timer
+      thread checks it, so the buffer is written in quiet periods too.
+    - A record at flush_level or above arrives.
+    - flush or close is called, e.g. by logging.shutdown at exit.
+
+    Args:
+        filepath (str): log filepath.
+        backup_count (int): Leave logs up to the designated generation.
+        buffer_size (int): Characters buffered before a write.
+        flush_interval_ms (float): Maximum age of a buffered record.
+        flush_level (int): Records at this level or above are written at
+            once with the buffered records.
+
+    Attributes:
+        writes (int): Number of write calls.
+
+    """
+
+    def __init__(
+        self,
+        filepath: str,
+        backup_count: int = 5,
+        buffer_size: int = 64 * 1024,
+        flush_interval_ms: float = 1000,
+        flush_level: int = ERROR,
+    ) -> None:
+        super().__init__(filepath, backup_count)
+
+        self.buffer_size = buffer_size
+        self.flush_interval_ms = flush_interval_ms
+        self.flush_level = flush_level
+        self.writes = 0
+
+        self._buffer: List[str] = []
+        self._buffered = 0
+        # monotonic time of the oldest buffered record
+        self._oldest = 0.0
+        # newest buffered record, reported when the write fails
+        self._last_record = None
+        self._timer: Optional[threading.Thread] = None
+        self._closed = threading.Event()
+
+    def emit(self, record) -> None:
+        try:
+            msg = self.format(record) + self.terminator
+        except Exception:
+            self.handleError(record)
+            return
+
+        self._append(msg, record, record.levelno >= self.flush_level)
+
+    def emit_batch(self, records: Sequence) -> None:
+        """Buffer the records and write them if a flush trigger is hit."""
+
+        msgs: List[str] = []
+        urgent = False
+        for record in records:
+            try:
+                msgs.append(self.format(record) + self.terminator)
+            except Exception:
+                self.handleError(record)
+                continue
+
+            if record.levelno >= self.flush_level:
+                urgent = True
+
+        if msgs:
+            self._append("".join(msgs), records[-1], urgent)
+
+    def _append(self, msg: str, record, urgent: bool) -> None:
+        if not self._buffer:
+            self._oldest = monotonic()
+            self._start_timer()
+
+        self._buffer.append(msg)
+        self._buffered += len(msg)
+        self._last_record = record
+
+        if urgent or self._buffered >= self.buffer_size:
+            self._write()
+
+    def _write(self) -> None:
+        """Write the buffer to the file. The handler lock must be held."""
+
+        if not self._buffer:
+            return
+
+        data = "".join(self._buffer)
+        self._buffer = []
+        self._buffered = 0
+
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+
+            self.stream.write(data)
+            self.stream.flush()
+            self.writes += 1
+        except Exception:
+            self.handleError(self._last_record)
+
+    def flush(self) -> None:
+        self.acquire()
+        try:
+            self._write()
+        finally:
+            self.release()
+
+        super().flush()
+
+    def close(self) -> None:
+        self._closed.set()
+        self.flush()
+
+        super().close()
+
+    def _start_timer(self) -> None:
+        if self._timer is not None or not self.flush_interval_ms:
+            return
+
+        self._timer = threading.Thread(
+            target=self._run_timer, name="BufferedFileHandler", daemon=True
+        )
+        self._timer.start()
+
+    def _run_timer(self) -> None:
+        interval = self.flush_interval_ms / 1000
+        wait = interval
+        while not self._closed.wait(wait):
+            self.acquire()
+            try:
+                wait = interval
+                if self._buffer:
+                    age = monotonic() - self._oldest
+                    if age >= interval:
+                        self._write()
+                    else:
+                        wait = interval - age
+            finally:
+                self.release()
@@ -1,44 +1,89 @@
 from logging import FileHandler
 import os
 from pathlib import Path
-import re
 from typing import Dict
 from typing import List
-
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+from delogger.handlers.file_writer import open_shared
+from delogger.handlers.stream_batch import StreamBatchMixin
+from delogger.util.compress import check_compression
+from delogger.util.compress import compressed_suffixes
+from delogger.util.compress import is_idle
+from delogger.util.compress import recover
+from delogger.util.compress import submit
 from delogger.util.log_file import LogFile
+from delogger.util.retention import RetentionPolicy
+from delogger.util.retention import strftime_pattern
 
 __all__ = ["CountRotatingFileHandler"]
 
 
-class CountRotatingFileHandler(FileHandler):
+class CountRotatingFileHandler(StreamBatchMixin, FileHandler):
     """This handler to keep the saved log count.
 
     Args:
         filepath (str): log filepath.
         backup_count (int): Leave logs up to the designated generation.
+        mode (str): File open mode.
+        compression (str): Compress the superseded log files of the
+            directory in the background, with "gzip", "bz2" or "lzma".
+            The files the handler rolls over from are compressed at once,
+            and the other files of the directory when they are idle, see
+            IDLE_SECONDS. The compressed files count for backup_count.
+        max_bytes (int): Roll over to a new file named from filepath when
+            the file would pass max_bytes. The size is tracked in memory.
+            Never roll over if 0. Only this handler moves to the new file,
+            the other handlers of the file keep writing it.
+        retention (RetentionPolicy): Limits of the log files of the
+            directory, applied at start and at rollover.
+            RetentionPolicy(max_count=backup_count) by default.
+
+    The file is written through the SharedFileWriter of its resolved path,
+    so the handlers of a file share one file descriptor, and their records
+    never interleave.
 
     Attributes:
         filepath (str): File path determined only once at runtime.
 
     """
 
-    _files: List[LogFile] = []
-    """This list saving LogFile of output log file."""
+    _files: Dict[str, LogFile] = {}
+    """LogFile of the output log files, by resolved path."""
 
-    _LOG_FMT_RE: Dict[str, List[str]] = {
-        r"\d{4}": ["%Y"],
-        r"\d{2}": ["%m", "%d", "%H", "%M", "%S"],
-        r"\d{6}": ["%f"],
-    }
+    def __init__(
+        self,
+        filepath: str,
+        backup_count: int = 5,
+        mode: str = "a",
+        compression: Optional[str] = None,
+        max_bytes: int = 0,
+        retention: Optional[RetentionPolicy] = None,
+    ) -> None:
+        check_compression(compression)
 
-    def __init__(self, filepath: str, backup_count: int = 5) -> None:
         dirpath = str(Path(filepath).parent)
         fmt = Path(filepath).name
 
-        self.logfile = self._load_file_path(dirpath, fmt, backup_count)
+        self.backup_count = backup_count
+        self.compression = compression
+        self.max_bytes = max_bytes
+        self.retention = retention or RetentionPolicy(max_count=backup_count)
+        self._dirpath = dirpath
+        self._match = strftime_pattern(fmt).fullmatch
+
+        self.logfile, is_new = self._load_file_path(dirpath, fmt)
         self.filepath = str(self.logfile.filepath)
+        # strftime name of the current file and its .N suffix
+        self._rollover_name = self.logfile.filepath
+        self._rollover_count = 0
 
-        super().__init__(self.filepath)
+        super().__init__(self.filepath, mode)
+
+        if is_new:
+            self._clean_directory()
 
     def _open(self):
         """It is executed at log output.
@@ -50,9 +95,95 @@ class CountRotatingFileHandler(FileHandler):
         # If there is no save destination directory, the directory is created.
         self.logfile.mkdir()
 
-        return super()._open()
+        stream = open_shared(
+            self.baseFilename, self.mode, self.encoding, getattr(self, "errors", None)
+        )
+        if self.max_bytes:
+            stream.track_size()
+
+        return stream
+
+    def emit(self, record) -> None:
+        if self.max_bytes:
+            self.emit_batch((record,))
+        else:
+            super().emit(record)
+
+    def emit_batch(self, records: Sequence) -> None:
+        """Write the records with a single write and flush.
+
+        With max_bytes, the records are split over the files at rollover.
+
+        """
+
+        if not self.max_bytes:
+            super().emit_batch(records)
+            return
+
+        msgs: List[str] = []
+        pending = 0
+        for record in records:
+            try:
+                msg = self.format(record) + self.terminator
+                if self.stream is None:
+                    self.stream = self._open()
+                size = self.stream.measure(msg)
+                written = self.stream.size + pending
+                if written and written + size > self.max_bytes:
+                    self._write_batch(msgs, record)
+                    msgs = []
+                    pending = 0
+                    self.doRollover()
+            except Exception:
+                self.handleError(record)
+                continue
+
+            msgs.append(msg)
+            pending += size
+
+        self._write_batch(msgs, records[-1])
+
+    def doRollover(self) -> None:
+        """Close the file and continue in a new file named from filepath.
+
+        The new file is named by the strftime of filepath at the rollover,
+        with a .NNN suffix if the name of the time was already used.
+        The retention applies to the files of the directory, and the closed
+        file is compressed if compression is set.
+
+        """
 
-    def _load_file_path(self, dirpath: str, fmt: str, backup_count: int) -> LogFile:
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+
+        previous = self.baseFilename
+        logfile = LogFile(str(self.logfile.filepath_raw))
+        name = logfile.filepath
+        count = 0
+        if name == self._rollover_name:
+            count = self._rollover_count + 1
+        self._rollover_name = name
+
+        path = Path(f"{name}.{count:03d}") if count else name
+        while os.path.exists(path):
+            count += 1
+            path = Path(f"{name}.{count:03d}")
+        self._rollover_count = count
+        logfile.filepath = path
+
+        files = CountRotatingFileHandler._files
+        if files.get(os.path.realpath(previous)) is self.logfile:
+            del files[os.path.realpath(previous)]
+        files[os.path.realpath(path)] = logfile
+        self.logfile = logfile
+        self.filepath = str(path)
+        self.baseFilename = os.path.abspath(self.filepath)
+
+        self.stream = self._open()
+        self._clean_directory(previous)
+
+    def _load_file_path(self, dirpath: str, fmt: str) -> Tuple[LogFile, bool]:
         """Get the file path of the log output destination.
 
         For each directory, determine the log file path only once at runtime.
@@ -60,36 +191,50 @@ class CountRotatingFileHandler(FileHandler):
         Args:
             dirpath (str): Directory path.
             fmt (str): Filename like date_string.
-            backup_count (int): Leave logs up to the designated generation.
+
+        Returns:
+            The LogFile, and whether it is determined by this call.
 
         """
 
         logfile = LogFile(str(Path(dirpath) / fmt))
+        key = os.path.realpath(logfile.filepath)
 
         # If already same logfile, return the filepath.
-        for fpath in CountRotatingFileHandler._files:
-            if fpath == logfile:
-                return fpath
-        CountRotatingFileHandler._files.append(logfile)
-
-        if backup_count <= 0:
-            return logfile
+        known = CountRotatingFileHandler._files.setdefault(key, logfile)
 
-        file_list = self._get_match_files(logfile.filepath.parent, fmt)
+        return known, known is logfile
 
-        # Delete the old file and set a new filepath
-        if len(file_list) >= backup_count:
-            os.remove(file_list[0])
-        return logfile
+    def _clean_directory(self, superseded: Optional[str] = None) -> None:
+        """Apply the retention and compress the superseded log files.
 
-    def _get_match_files(self, dirpath, fmt) -> List[Path]:
-        _fmt = fmt
-        for patter, date_strs in self._LOG_FMT_RE.items():
-            for date_str in date_strs:
-                _fmt = _fmt.replace(date_str, patter)
+        Args:
+            superseded (str): File closed by a rollover. The idle log files
+                of the directory that are not open in the process if None.
 
-        # TODO: check file stat?? datefmt only ok??
-        pattern = re.compile(_fmt)
-        files = [x for x in sorted(Path(dirpath).glob("*")) if pattern.search(str(x))]
+        """
 
-        return files
+        self.retention.enforce(self._dirpath, self._match, protect=self.baseFilename)
+
+        if self.compression is None:
+            return
+
+        if superseded is not None:
+            paths = [superseded]
+        else:
+            # The files the handlers of the process write.
+            protect = set(CountRotatingFileHandler._files)
+            protect.add(os.path.realpath(self.baseFilename))
+            recover(self._dirpath, self.compression, protect)
+            suffixes = compressed_suffixes()
+            paths = [
+                entry.path
+                for entry in RetentionPolicy().scan(self._dirpath, self._match)
+                if not entry.name.endswith(suffixes)
+                and os.path.realpath(entry.path) not in protect
+                and is_idle(entry.path)
+            ]
+
+        for path in paths:
+            if os.path.exists(path):
+                submit(path, self.compression)
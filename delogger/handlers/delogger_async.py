@@ -0,0 +1,192 @@
+import asyncio
+from collections import deque
+from logging import Handler
+from logging import LogRecord
+from logging.handlers import QueueHandler
+from typing import Deque
+from typing import List
+from typing import Optional
+from typing import Sequence
+
+from delogger.handlers.async_handler import AsyncExecutorHandler
+from delogger.handlers.async_handler import AsyncHandlerBase
+from delogger.handlers.async_handler import handle_batch_async
+from delogger.util.aio import get_running_loop
+
+__all__ = ["DeloggerAsyncHandler"]
+
+
+def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    try:
+        return get_running_loop()
+    except RuntimeError:
+        return None
+
+
+class DeloggerAsyncHandler(QueueHandler):
+    """Handler that puts records into an asyncio queue drained by a task.
+
+    The drain task starts on the running loop at the first record logged
+    from the loop. Records logged before that are kept until it starts, up
+    to maxsize or PENDING_MAXSIZE records, and records logged from other
+    threads are handed over to the loop thread.
+
+    Args:
+        handlers (list): Handlers to output. Handlers that are not
+            AsyncHandlerBase are wrapped with AsyncExecutorHandler.
+        maxsize (int): Maximum number of queued records. Unbounded if <= 0.
+        max_batch (int): Maximum number of records handled at once.
+
+    Attributes:
+        handlers (list): Async handlers to output.
+        dropped (int): Number of records dropped because the queue was full.
+
+    """
+
+    PENDING_MAXSIZE: int = 10000
+    """Records kept until the drain task starts, if maxsize is unbounded."""
+
+    def __init__(
+        self, handlers: Sequence[Handler], maxsize: int = -1, max_batch: int = 1000
+    ) -> None:
+        super().__init__(None)
+
+        self.handlers: List[AsyncHandlerBase] = [
+            hdlr if isinstance(hdlr, AsyncHandlerBase) else AsyncExecutorHandler(hdlr)
+            for hdlr in handlers
+        ]
+        self.maxsize = maxsize
+        self.max_batch = max(max_batch, 1)
+        self.dropped = 0
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+        self._pending: Deque[LogRecord] = deque()
+
+    @property
+    def output_handlers(self) -> List[AsyncHandlerBase]:
+        return self.handlers
+
+    def start(self) -> None:
+        """Start the drain task on the running loop."""
+
+        if self._task is not None and not self._task.done():
+            return
+
+        self._loop = get_running_loop()
+        self.queue = asyncio.Queue(max(self.maxsize, 0))
+        self._task = self._loop.create_task(self._drain())
+
+        while self._pending:
+            self._put(self._pending.popleft())
+
+    def enqueue(self, record: LogRecord) -> None:
+        loop = _running_loop()
+        # The task is done if its loop has finished without aclose.
+        if self._task is None or self._task.done():
+            if loop is None:
+                self._keep(record)
+                return
+            self.start()
+
+        if loop is self._loop:
+            self._put(record)
+        else:
+            self._loop.call_soon_threadsafe(self._put, record)
+
+    def _keep(self, record: LogRecord) -> None:
+        maxsize = self.maxsize if self.maxsize > 0 else self.PENDING_MAXSIZE
+        if len(self._pending) >= maxsize:
+            self.dropped += 1
+            return
+
+        self._pending.append(record)
+
+    def _put(self, record: LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except asyncio.QueueFull:
+            self.dropped += 1
+
+    async def flush_async(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every record logged before the call is handled.
+
+        Args:
+            timeout (float): Seconds to wait. Wait forever if None.
+
+        Returns:
+            True if the records are handled, False on timeout.
+
+        """
+
+        self.start()
+        barrier = self._loop.create_future()
+
+        async def _wait() -> None:
+            # The barrier waits for room and is never dropped.
+            await self.queue.put(barrier)
+            await asyncio.shield(barrier)
+
+        try:
+            await asyncio.wait_for(_wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+
+        return True
+
+    async def aclose(self, timeout: Optional[float] = None) -> bool:
+        """Flush the records, stop the drain task and close the handlers.
+
+        Returns:
+            True if every record was handled before the timeout.
+
+        """
+
+        flushed = await self.flush_async(timeout)
+
+        task, self._task = self._task, None
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        self._loop = None
+
+        await asyncio.gather(
+            *(hdlr.aclose() for hdlr in self.handlers), return_exceptions=True
+        )
+
+        return flushed
+
+    async def _drain(self) -> None:
+        queue = self.queue
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < self.max_batch:
+                try:
+                    batch.append(queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+
+            records: List[LogRecord] = []
+            for item in batch:
+                if isinstance(item, asyncio.Future):
+                    if records:
+                        await self._handle(records)
+                        records = []
+                    if not item.done():
+                        item.set_result(True)
+                else:
+                    records.append(item)
+
+            if records:
+                await self._handle(records)
+
+    async def _handle(self, records: List[LogRecord]) -> None:
+        # Handlers run concurrently on each batch, and the next batch waits for
+        # all of them, so each handler outputs the records in order.
+        await asyncio.gather(
+            *(
+                handle_batch_async(
+                    hdlr, [record for record in records if record.levelno >= hdlr.level]
+                )
+                for hdlr in self.handlers
+            )
+        )
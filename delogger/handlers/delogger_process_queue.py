@@ -0,0 +1,110 @@
+from collections import deque
+from logging import Formatter
+from logging.handlers import QueueHandler
+from multiprocessing.util import Finalize
+import os
+from threading import Event
+from threading import Lock
+from threading import Thread
+from typing import Any
+from typing import Dict
+from typing import Optional
+
+__all__ = ["DeloggerProcessQueueHandler"]
+
+
+class DeloggerProcessQueueHandler(QueueHandler):
+    """QueueHandler that sends records to a multiprocessing queue.
+
+    Records are pre-rendered before they are put into the queue, so they can
+    be pickled: the message is merged with args and exc_info is rendered to
+    exc_text. The formatters of the writer process still append exc_text and
+    stack_info as usual.
+
+    Only the attribute dict of the record is sent, which is cheaper to copy
+    and pickle than the record itself. Records are buffered in the process
+    and a sender thread puts them into the queue as lists, so one pickle and
+    one pipe write carry many records. The buffer is flushed when the process
+    exits.
+
+    Custom attributes added with `extra` must be picklable.
+
+    """
+
+    _exc_formatter = Formatter()
+
+    SENDER_EXITPRIORITY: int = 100
+    """Flush before the finalizer of multiprocessing.Queue (10) closes it."""
+
+    def __init__(self, queue) -> None:
+        super().__init__(queue)
+
+        self._sender_pid: Optional[int] = None
+
+    def prepare(self, record) -> Dict[str, Any]:
+        """Get the picklable attribute dict of the record."""
+
+        msg = record.getMessage()
+
+        attrs = dict(record.__dict__)
+        attrs["msg"] = msg
+        attrs["args"] = None
+        attrs["message"] = msg
+
+        if record.exc_info:
+            if not record.exc_text:
+                attrs["exc_text"] = self._exc_formatter.formatException(record.exc_info)
+            attrs["exc_info"] = None
+
+        return attrs
+
+    def enqueue(self, record) -> None:
+        if self._sender_pid != os.getpid():
+            # The handler lock is reinitialized in forked children, so it is
+            # never inherited in the locked state.
+            with self.lock:
+                if self._sender_pid != os.getpid():
+                    self._start_sender()
+
+        self._buffer.append(record)
+        if self._sender_idle:
+            self._sender_idle = False
+            self._wakeup.set()
+
+    def flush(self) -> None:
+        """Put the buffered records into the queue."""
+
+        if self._sender_pid != os.getpid():
+            return
+
+        with self._send_lock:
+            buffer = self._buffer
+            records = [buffer.popleft() for _ in range(len(buffer))]
+            if records:
+                # Wait for room when the queue is bounded.
+                self.queue.put(records)
+
+    def _start_sender(self) -> None:
+        # Records buffered by the parent process must not be sent twice.
+        self._buffer: deque = deque()
+        self._send_lock = Lock()
+        self._wakeup = Event()
+        self._sender_idle = True
+        self._sender_pid = os.getpid()
+
+        Thread(
+            target=self._send, name="DeloggerProcessQueueSender", daemon=True
+        ).start()
+        Finalize(self, type(self).flush, (self,), exitpriority=self.SENDER_EXITPRIORITY)
+
+    def _send(self) -> None:
+        while True:
+            self._wakeup.wait()
+            self._wakeup.clear()
+
+            self.flush()
+
+            self._sender_idle = True
+            if self._buffer:
+                self._sender_idle = False
+                self._wakeup.set()
@@ -1,22 +1,188 @@
+from logging import Handler
 from logging.handlers import QueueHandler
 from logging.handlers import QueueListener
+from queue import Full
+from time import monotonic
+from typing import Any
+from typing import List
+from typing import Optional
+
+from delogger.handlers.backpressure import BackpressurePolicy
+from delogger.handlers.backpressure import BlockPolicy
+from delogger.handlers.queue_listener import FlushBarrier
+from delogger.handlers.shutdown import DEFAULT_DRAIN_TIMEOUT
+from delogger.handlers.shutdown import DrainReport
+
+IMMUTABLE_TYPES = frozenset(
+    (str, bytes, int, float, complex, bool, type(None), type(Ellipsis))
+)
+
+
+def is_immutable(value: Any) -> bool:
+    """Check that the value can not change after it is logged."""
+
+    if type(value) in IMMUTABLE_TYPES:
+        return True
+
+    if type(value) in (tuple, frozenset):
+        return all(is_immutable(v) for v in value)
+
+    return False
 
 
 class DeloggerQueueHandler(QueueHandler):
-    def __init__(self, listener: QueueListener, *args, **kwargs) -> None:
+    """QueueHandler that starts its listener and applies a backpressure policy.
+
+    Args:
+        listener (QueueListener): Listener that consumes the queue.
+        queue: Queue to put records.
+        policy (BackpressurePolicy): What to do when the queue is full.
+        prepare (str): Where records are rendered.
+            "eager": Render the message in the calling thread (QueueHandler).
+            "lazy": Enqueue the record as is and render it in the listener
+                thread. Records whose msg or args are not immutable are
+                rendered eagerly, so later changes to them are not logged.
+            "listener": Always render in the listener thread. The caller must
+                not change the args after logging.
+        drain_timeout (float): Seconds to drain the queued records on close
+            and at shutdown.
+
+    Attributes:
+        listener (QueueListener): Listener that consumes the queue.
+        policy (BackpressurePolicy): What to do when the queue is full.
+        prepare_strategy (str): Where records are rendered.
+        drain_timeout (float): Seconds to drain the queued records on close
+            and at shutdown.
+
+    """
+
+    PREPARE_STRATEGIES = ("eager", "lazy", "listener")
+
+    def __init__(
+        self,
+        listener: QueueListener,
+        *args,
+        policy: Optional[BackpressurePolicy] = None,
+        prepare: str = "eager",
+        drain_timeout: float = DEFAULT_DRAIN_TIMEOUT,
+        **kwargs,
+    ) -> None:
+        if prepare not in self.PREPARE_STRATEGIES:
+            raise ValueError(f"Unknown prepare strategy: {prepare}")
+
         super().__init__(*args, **kwargs)
 
         self.listener = listener
+        self.policy: BackpressurePolicy = policy or BlockPolicy()
+        self.prepare_strategy = prepare
+        self.drain_timeout = drain_timeout
         self.start()
 
     def start(self) -> None:
         self.listener.start()
 
-    def join(self) -> None:
-        self.listener.queue.join()  # type: ignore
+    @property
+    def output_handlers(self) -> List[Handler]:
+        """Handlers that output the queued records."""
+
+        return self.listener.output_handlers()
+
+    def prepare(self, record):
+        strategy = self.prepare_strategy
+        if strategy == "listener":
+            return record
+
+        if strategy == "lazy" and self._is_safe(record):
+            return record
+
+        return super().prepare(record)
+
+    def _is_safe(self, record) -> bool:
+        if type(record.msg) is not str:
+            return False
+
+        args = record.args
+        return not args or is_immutable(args)
+
+    def enqueue(self, record) -> None:
+        self.policy.put(self.queue, record)
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every record enqueued before the call is handled.
+
+        A FlushBarrier is put into the queue and the listener marks it done
+        when it reaches it, so the queue does not need task_done bookkeeping.
+
+        Args:
+            timeout (float): Seconds to wait. Wait forever if None.
+
+        Returns:
+            True if the records are handled, False on timeout or if a lane
+            was too full to take the barrier.
+
+        """
+
+        if not self.listener._thread:
+            return False
+
+        deadline = None if timeout is None else monotonic() + timeout
+        barrier = FlushBarrier(timeout)
+        try:
+            # The barrier is never dropped by the backpressure policy.
+            self.queue.put(barrier, True, timeout)
+        except Full:
+            return False
+
+        remaining = None if deadline is None else max(deadline - monotonic(), 0)
+        return barrier.wait(remaining)
+
+    def flush_queue(self, timeout: Optional[float] = None) -> DrainReport:
+        """Wait until the queued records are handled, leaving the listener running.
+
+        Args:
+            timeout (float): Seconds to wait. Wait forever if None.
+
+        Returns:
+            DrainReport of the records handled during the wait and the
+            records still queued at the deadline.
+
+        """
+
+        handled = self.handled
+        if self.join(timeout):
+            return DrainReport(self.handled - handled, 0)
+
+        return DrainReport(self.handled - handled, self.pending())
+
+    def drain(self, timeout: Optional[float] = None) -> DrainReport:
+        """Stop the listener after it handles the queued records.
+
+        Args:
+            timeout (float): Seconds to wait. Wait forever if None.
+
+        Returns:
+            DrainReport of the records handled during the drain and the
+            records still queued at the deadline.
+
+        """
+
+        handled = self.handled
+        self.listener.stop(timeout)
+
+        return DrainReport(self.handled - handled, self.pending())
+
+    @property
+    def handled(self) -> int:
+        """Number of records of the handler handled by the listener."""
+
+        return self.listener.handled
+
+    def pending(self) -> int:
+        """Number of records of the handler not handled yet."""
+
+        return self.listener.pending()
 
     def close(self, *args, **kwargs):
-        if self.listener._thread:  # pragma: no cover
-            self.listener.stop()  # pragma: no cover
+        self.drain(self.drain_timeout)
 
-        super().close(*args, **kwargs)  # pragma: no cover
+        super().close(*args, **kwargs)
@@ -0,0 +1,154 @@
+import os
+import threading
+from typing import Any
+from typing import Dict
+from typing import Optional
+from typing import Tuple
+
+__all__ = ["SharedFileWriter", "open_shared"]
+
+_writers: Dict[Tuple[str, str], "SharedFileWriter"] = {}
+_lock = threading.Lock()
+
+
+class SharedFileWriter:
+    """A file opened once for every handler of the process that writes it.
+
+    It is a file-like object for the stream of FileHandler. Each write call
+    is done under the lock of the writer, so the records of the handlers
+    never interleave, and flush is skipped when nothing was written since
+    the last flush. close releases a reference and the file is closed when
+    the last handler closes it.
+
+    Use open_shared to get the writer of a path.
+
+    Attributes:
+        name (str): Resolved file path.
+        mode (str): File open mode.
+        size (int): File size in bytes, tracked in memory after track_size.
+        refs (int): Number of handlers that use the writer.
+        lock (RLock): Lock of the writes. Hold it to write data that depends
+            on what the handlers wrote before.
+        context (dict): State of the handlers kept with the open file, e.g.
+            the templates of BinaryFileHandler.
+
+    """
+
+    def __init__(
+        self,
+        name: str,
+        mode: str = "a",
+        encoding: Optional[str] = None,
+        errors: Optional[str] = None,
+    ) -> None:
+        self.name = name
+        self.mode = mode
+        self.refs = 0
+
+        self._stream = open(name, mode, encoding=encoding, errors=errors)
+        self._binary = "b" in mode
+        self._dirty = False
+        self.lock = threading.RLock()
+        self.context: Dict[str, Any] = {}
+        self.size = os.path.getsize(name)
+        self._track_size = False
+
+    @property
+    def closed(self) -> bool:
+        return self._stream.closed
+
+    def is_current(self) -> bool:
+        """Whether the writer is open on the file that is at its path now."""
+
+        if self._stream.closed:
+            return False
+
+        try:
+            st = os.stat(self.name)
+        except FileNotFoundError:
+            return False
+        fst = os.fstat(self._stream.fileno())
+
+        return (st.st_dev, st.st_ino) == (fst.st_dev, fst.st_ino)
+
+    def track_size(self) -> None:
+        """Track the size in memory from now on, for handlers with max_bytes.
+
+        Other handlers do not need the size, so their writes do not pay for
+        encoding the data twice.
+
+        """
+
+        with self.lock:
+            if self._track_size:
+                return
+
+            self._stream.flush()
+            self.size = os.fstat(self._stream.fileno()).st_size
+            self._track_size = True
+
+    def measure(self, data) -> int:
+        """Get the number of bytes the data takes in the file."""
+
+        if self._binary:
+            return len(data)
+
+        return len(data.encode(self._stream.encoding, self._stream.errors))
+
+    def write(self, data) -> None:
+        with self.lock:
+            self._stream.write(data)
+            if self._track_size:
+                self.size += self.measure(data)
+            self._dirty = True
+
+    def flush(self) -> None:
+        with self.lock:
+            if self._dirty:
+                self._dirty = False
+                self._stream.flush()
+
+    def close(self) -> None:
+        """Release a reference, and close the file if it was the last one."""
+
+        with _lock:
+            self.refs -= 1
+            if self.refs > 0:
+                return
+
+            if _writers.get((self.name, self.mode)) is self:
+                del _writers[(self.name, self.mode)]
+
+        with self.lock:
+            self._stream.close()
+
+
+def open_shared(
+    filepath: str,
+    mode: str = "a",
+    encoding: Optional[str] = None,
+    errors: Optional[str] = None,
+) -> SharedFileWriter:
+    """Get the writer of a file and take a reference to it.
+
+    The writers are keyed by the resolved path and the mode, so handlers
+    that reach the same file through different paths share one writer. The
+    encoding and errors of the first handler apply. A file that was removed
+    or replaced is opened again by a new writer.
+
+    Args:
+        filepath (str): File path.
+        mode (str): File open mode.
+        encoding (str): Encoding of a text file.
+        errors (str): Encoding errors of a text file.
+
+    """
+
+    key = (os.path.realpath(filepath), mode)
+    with _lock:
+        writer = _writers.get(key)
+        if writer is None or not writer.is_current():
+            writer = _writers[key] = SharedFileWriter(key[0], mode, encoding, errors)
+        writer.refs += 1
+
+    return writer
@@ -0,0 +1,155 @@
+from logging import Handler
+from logging import NOTSET
+from queue import Full
+from typing import Callable
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+from typing import Type
+from typing import Union
+
+from delogger.handlers.backpressure import BackpressurePolicy
+from delogger.handlers.backpressure import DropNewestPolicy
+from delogger.handlers.queue_listener import DeloggerQueueListener
+from delogger.handlers.queue_listener import FlushBarrier
+from delogger.util.ring_queue import RingQueue
+
+__all__ = ["Lane"]
+
+HandlerMatch = Union[
+    Type[Handler], Tuple[Type[Handler], ...], Callable[[Handler], bool]
+]
+
+
+class Lane:
+    """Own bounded queue and listener thread for a group of handlers.
+
+    The main listener of DeloggerQueue puts records into the lane instead of
+    calling its handlers, so a slow handler (Slack) never holds back the
+    other handlers (files). Records keep their order within the lane.
+
+    Args:
+        match: Handler class, tuple of handler classes or predicate that
+            selects the handlers of the lane.
+        maxsize (int): Maximum number of queued records. Unbounded if <= 0.
+        policy (BackpressurePolicy): What to do when the lane is full.
+            Drop the incoming record by default, so the main listener is
+            never blocked.
+        max_batch (int): Maximum number of records the lane handles at once.
+        max_wait_ms (float): Maximum time the lane waits for a batch to fill up.
+        barrier_timeout (float): Seconds the main listener waits to put a
+            FlushBarrier into the full lane before it reports the lane in
+            FlushBarrier.missed, so a stuck lane can not stall the main
+            listener during join.
+
+    Attributes:
+        handlers (list): Handlers of the lane.
+        queue (RingQueue): Queue of the lane.
+        policy (BackpressurePolicy): What to do when the lane is full.
+        level (int): Lowest level of the handlers.
+
+    """
+
+    def __init__(
+        self,
+        match: HandlerMatch,
+        maxsize: int = 1000,
+        policy: Optional[BackpressurePolicy] = None,
+        *,
+        max_batch: int = 1000,
+        max_wait_ms: float = 0,
+        barrier_timeout: float = 1.0,
+    ) -> None:
+        self.match = match
+        self.maxsize = maxsize
+        self.policy: BackpressurePolicy = policy or DropNewestPolicy()
+        self.max_batch = max_batch
+        self.max_wait_ms = max_wait_ms
+        self.barrier_timeout = barrier_timeout
+
+        self.handlers: List[Handler] = []
+        self.queue = RingQueue(maxsize)
+        self.level = NOTSET
+        self.listener: Optional[DeloggerQueueListener] = None
+
+    def matches(self, handler: Handler) -> bool:
+        if isinstance(self.match, (type, tuple)):
+            return isinstance(handler, self.match)
+
+        return bool(self.match(handler))
+
+    def take(self, handlers: Sequence[Handler]) -> List[Handler]:
+        """Take the matching handlers.
+
+        Returns:
+            Handlers that do not match the lane.
+
+        """
+
+        if self.listener is not None:
+            raise RuntimeError("The lane is already used.")
+
+        rest = []
+        for handler in handlers:
+            if self.matches(handler):
+                self.handlers.append(handler)
+            else:
+                rest.append(handler)
+
+        self.level = min((hdlr.level for hdlr in self.handlers), default=NOTSET)
+        self.listener = DeloggerQueueListener(
+            self.queue,
+            *self.handlers,
+            respect_handler_level=True,
+            max_batch=self.max_batch,
+            max_wait_ms=self.max_wait_ms,
+        )
+
+        return rest
+
+    def start(self) -> None:
+        if self.listener and not self.listener._thread:
+            self.listener.start()
+
+    def stop(self, timeout: Optional[float] = None) -> bool:
+        if not self.listener:
+            return True
+
+        return self.listener.stop(timeout)
+
+    def pending(self) -> int:
+        if not self.listener:
+            return 0
+
+        return self.listener.pending()
+
+    def put_batch(self, records) -> None:
+        level = self.level
+        put = self.policy.put
+        for record in records:
+            if record.levelno >= level:
+                put(self.queue, record)
+
+    def put_barrier(self, barrier: FlushBarrier) -> bool:
+        """Put the barrier, waiting at most barrier_timeout for room.
+
+        Returns:
+            True if the barrier is queued, False if the lane is reported in
+            barrier.missed.
+
+        """
+
+        timeout = self.barrier_timeout
+        remaining = barrier.remaining()
+        if remaining is not None:
+            timeout = min(timeout, remaining)
+
+        barrier.add()
+        try:
+            self.queue.put(barrier, True, timeout)
+        except Full:
+            barrier.miss(self)
+            return False
+
+        return True
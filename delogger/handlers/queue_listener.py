@@ -0,0 +1,307 @@
+from logging import Handler
+from logging import LogRecord
+from logging.handlers import QueueListener
+import queue
+from threading import Event
+from threading import Lock
+from time import monotonic
+from typing import List
+from typing import Optional
+from typing import Sequence
+
+__all__ = ["DeloggerQueueListener", "FlushBarrier", "handle_batch"]
+
+
+class FlushBarrier:
+    """Queue item that is done when the listener reaches it.
+
+    Every record enqueued before the barrier has been handled by then.
+    A listener that forwards records to lanes adds one count per lane, so
+    the barrier is done only after every lane has reached it too. A lane
+    that stays full is skipped and reported in missed, and wait returns
+    False.
+
+    Args:
+        timeout (float): Seconds the barrier is waited for. A lane gives up
+            putting the barrier at the deadline. No deadline if None.
+
+    Attributes:
+        deadline (float): monotonic deadline of the barrier, or None.
+        missed (list): Lanes the barrier could not be put into.
+
+    """
+
+    def __init__(self, timeout: Optional[float] = None) -> None:
+        self._event = Event()
+        self._count = 1
+        self._lock = Lock()
+        self.deadline = None if timeout is None else monotonic() + timeout
+        self.missed: List = []
+
+    def add(self) -> None:
+        with self._lock:
+            self._count += 1
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left until the deadline, or None."""
+
+        return _remaining(self.deadline)
+
+    def miss(self, lane) -> None:
+        """Report a lane the barrier could not be put into, and count it done."""
+
+        with self._lock:
+            self.missed.append(lane)
+
+        self.done()
+
+    def done(self) -> None:
+        with self._lock:
+            self._count -= 1
+            if self._count > 0:
+                return
+
+        self._event.set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        return self._event.wait(timeout) and not self.missed
+
+
+def handle_batch(handler: Handler, records: Sequence[LogRecord]) -> None:
+    """Let the handler handle the records.
+
+    Handlers implementing emit_batch(records) are called once with every
+    record that passed the filters, holding the handler lock only once.
+    Other handlers fall back to handle(record) per record.
+
+    Args:
+        handler (Handler): Handler to output.
+        records (list): Records to output.
+
+    """
+
+    emit_batch = getattr(handler, "emit_batch", None)
+    if emit_batch is None:
+        for record in records:
+            handler.handle(record)
+        return
+
+    accepted = []
+    for record in records:
+        rv = handler.filter(record)
+        if not rv:
+            continue
+        accepted.append(rv if isinstance(rv, LogRecord) else record)
+
+    if not accepted:
+        return
+
+    handler.acquire()
+    try:
+        emit_batch(accepted)
+    finally:
+        handler.release()
+
+
+def _remaining(deadline: Optional[float]) -> Optional[float]:
+    return None if deadline is None else max(deadline - monotonic(), 0)
+
+
+class DeloggerQueueListener(QueueListener):
+    """QueueListener that drains the queue in batches.
+
+    Each wakeup dequeues up to max_batch records, waiting at most
+    max_wait_ms for more records to arrive, and passes the batch to the
+    handlers with handle_batch. A FlushBarrier in the queue is done once the
+    records before it are handled.
+
+    Records are also put into the lanes, which output them to their own
+    handlers on their own threads.
+
+    Args:
+        queue: Queue to consume.
+        *handlers: Handlers to output.
+        respect_handler_level (bool): Whether to check the handler level.
+        max_batch (int): Maximum number of records per batch.
+        max_wait_ms (float): Maximum time to wait for a batch to fill up.
+        lanes (list): Lanes that get the records after the handlers.
+
+    Attributes:
+        handled (int): Number of records handled by the listener.
+
+    """
+
+    def __init__(
+        self,
+        queue,
+        *handlers,
+        respect_handler_level: bool = True,
+        max_batch: int = 1000,
+        max_wait_ms: float = 0,
+        lanes: Sequence = (),
+    ) -> None:
+        super().__init__(queue, *handlers, respect_handler_level=respect_handler_level)
+
+        self.max_batch = max(max_batch, 1)
+        self.max_wait_ms = max_wait_ms
+        self.lanes = list(lanes)
+        self.handled = 0
+
+        self._sentinel_queued = False
+        self._sentinel_taken = False
+        self._in_flight = 0
+
+    def start(self) -> None:
+        for lane in self.lanes:
+            lane.start()
+
+        super().start()
+
+    def stop(self, timeout: Optional[float] = None) -> bool:
+        """Stop the listener after it handles the queued records.
+
+        Args:
+            timeout (float): Seconds to wait. Wait forever if None.
+
+        Returns:
+            True if the listener and the lanes stopped, False on timeout.
+
+        """
+
+        if not self._thread:
+            return True
+
+        deadline = None if timeout is None else monotonic() + timeout
+        if not self._sentinel_queued:
+            try:
+                self.queue.put(self._sentinel, True, timeout)
+            except queue.Full:
+                return False
+            self._sentinel_queued = True
+
+        self._thread.join(_remaining(deadline))
+        if self._thread.is_alive():
+            return False
+
+        self._thread = None
+        self._sentinel_queued = False
+        self._sentinel_taken = False
+
+        # The thread has put every record into the lanes by now.
+        stopped = True
+        for lane in self.lanes:
+            stopped = lane.stop(_remaining(deadline)) and stopped
+
+        return stopped
+
+    def output_handlers(self) -> List[Handler]:
+        """Handlers of the listener and its lanes."""
+
+        handlers = list(self.handlers)
+        for lane in self.lanes:
+            handlers.extend(lane.handlers)
+
+        return handlers
+
+    def pending(self) -> int:
+        """Number of records left in the queue and the lanes."""
+
+        count = self.queue.qsize() + self._in_flight
+        if self._sentinel_queued and not self._sentinel_taken:
+            count -= 1
+        for lane in self.lanes:
+            count += lane.pending()
+
+        return max(count, 0)
+
+    def dequeue_batch(self) -> List:
+        """Dequeue records until the batch is full or the wait time is over.
+
+        The sentinel is always the last item of the batch.
+
+        """
+
+        item = self.dequeue(True)
+        batch = [item]
+        if item is self._sentinel:
+            return batch
+
+        q = self.queue
+        deadline = monotonic() + self.max_wait_ms / 1000 if self.max_wait_ms else 0
+        while len(batch) < self.max_batch:
+            try:
+                item = q.get_nowait()
+            except queue.Empty:
+                remaining = deadline - monotonic()
+                if remaining <= 0:
+                    break
+
+                try:
+                    item = q.get(True, remaining)
+                except queue.Empty:
+                    break
+
+            batch.append(item)
+            if item is self._sentinel:
+                break
+
+        return batch
+
+    def handle_batch(self, records: List[LogRecord]) -> None:
+        records = [self.prepare(record) for record in records]
+        for handler in self.handlers:
+            if self.respect_handler_level:
+                level = handler.level
+                accepted = [record for record in records if record.levelno >= level]
+            else:
+                accepted = records
+
+            if accepted:
+                handle_batch(handler, accepted)
+
+        for lane in self.lanes:
+            lane.put_batch(records)
+
+        self.handled += len(records)
+
+    def _monitor(self) -> None:
+        q = self.queue
+        has_task_done = hasattr(q, "task_done")
+        while True:
+            try:
+                batch = self.dequeue_batch()
+            except queue.Empty:  # pragma: no cover
+                break
+
+            is_stop = batch[-1] is self._sentinel
+            if is_stop:
+                self._sentinel_taken = True
+                del batch[-1]
+
+            self._in_flight = len(batch)
+            try:
+                self._handle_items(batch)
+            finally:
+                self._in_flight = 0
+                if has_task_done:
+                    for _ in range(len(batch) + is_stop):
+                        q.task_done()
+
+            if is_stop:
+                break
+
+    def _handle_items(self, items: List) -> None:
+        records: List[LogRecord] = []
+        for item in items:
+            if isinstance(item, FlushBarrier):
+                if records:
+                    self.handle_batch(records)
+                    records = []
+                for lane in self.lanes:
+                    lane.put_barrier(item)
+                item.done()
+            else:
+                records.append(item)
+
+        if records:
+            self.handle_batch(records)
@@ -0,0 +1,127 @@
+from logging import ERROR
+from logging import Handler
+from typing import List
+from typing import Sequence
+
+__all__ = ["RingBufferHandler"]
+
+
+class RingBufferHandler(Handler):
+    """A handler that keeps the last records and dumps them on a trigger.
+
+    Records below trigger_level are stored unformatted in a preallocated
+    ring of capacity slots, overwriting the oldest one, so a record costs a
+    slot store. When a record at trigger_level or above arrives, the stored
+    records and then the record are handed to the target handlers, which
+    format and output the records they accept, and the ring is cleared.
+
+    The records are stored as they are logged, so the args must not change
+    after logging.
+
+    Args:
+        targets (list): Handlers that output the dumped records.
+        capacity (int): Number of records to keep.
+        trigger_level (int): Records at this level or above dump the ring.
+
+    Attributes:
+        targets (list): Handlers that output the dumped records.
+        dumps (int): Number of dumps.
+
+    """
+
+    def __init__(
+        self,
+        targets: Sequence[Handler],
+        capacity: int = 1000,
+        trigger_level: int = ERROR,
+    ) -> None:
+        super().__init__()
+
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+
+        self.targets: List[Handler] = list(targets)
+        self.capacity = capacity
+        self.trigger_level = trigger_level
+        self.dumps = 0
+
+        self._ring: List = [None] * capacity
+        self._pos = 0
+        self._count = 0
+
+    @property
+    def output_handlers(self) -> List[Handler]:
+        """Handlers that output the records."""
+
+        return self.targets
+
+    def emit(self, record) -> None:
+        if record.levelno < self.trigger_level:
+            pos = self._pos
+            self._ring[pos] = record
+            self._pos = pos + 1 if pos + 1 < self.capacity else 0
+            if self._count < self.capacity:
+                self._count += 1
+            return
+
+        self._dump()
+        self._handle(record)
+
+    def records(self) -> List:
+        """Get the stored records, oldest first."""
+
+        self.acquire()
+        try:
+            return self._records()
+        finally:
+            self.release()
+
+    def _records(self) -> List:
+        start = self._pos - self._count
+        if start >= 0:
+            return self._ring[start : self._pos]
+
+        return self._ring[start:] + self._ring[: self._pos]
+
+    def dump(self) -> None:
+        """Hand the stored records to the targets now."""
+
+        self.acquire()
+        try:
+            self._dump()
+        finally:
+            self.release()
+
+    def _dump(self) -> None:
+        records = self._records()
+        self._ring = [None] * self.capacity
+        self._pos = 0
+        self._count = 0
+
+        if records:
+            self.dumps += 1
+        for record in records:
+            self._handle(record)
+
+    def _handle(self, record) -> None:
+        for hdlr in self.targets:
+            if record.levelno >= hdlr.level:
+                hdlr.handle(record)
+
+    def flush(self) -> None:
+        for hdlr in self.targets:
+            hdlr.flush()
+
+    def close(self) -> None:
+        self.acquire()
+        try:
+            self._ring = [None] * self.capacity
+            self._pos = 0
+            self._count = 0
+        finally:
+            self.release()
+
+        for hdlr in self.targets:
+            hdlr.close()
+
+        super().close()
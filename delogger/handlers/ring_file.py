@@ -0,0 +1,284 @@
+from logging import Handler
+import mmap
+import os
+from pathlib import Path
+import struct
+import threading
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Tuple
+import zlib
+
+__all__ = ["RingFileHandler", "iter_ring_file", "read_ring_file"]
+
+# magic, capacity, cursor, wrap count, next seq
+HEADER = struct.Struct("<8sQQQQ")
+HEADER_MAGIC = b"DLRING1\0"
+
+# magic, payload length, seq, crc32 of the seq and payload
+FRAME = struct.Struct("<4sIQI")
+FRAME_MAGIC = b"DLR\x01"
+
+_rings: Dict[str, "_Ring"] = {}
+_lock = threading.Lock()
+
+
+def _crc(seq_bytes: bytes, payload: bytes) -> int:
+    return zlib.crc32(payload, zlib.crc32(seq_bytes))
+
+
+class _Ring:
+    """A ring file mapped once for every handler of the process that writes it.
+
+    Frames are written under the lock of the ring, so the handlers of a ring
+    share its cursor and never overwrite each other's frames. close releases
+    a reference and the file is unmapped when the last handler closes it.
+
+    Use _open_ring to get the ring of a path.
+
+    """
+
+    def __init__(self, name: str, size: int) -> None:
+        self.name = name
+        self.size = size
+        self.capacity = size - HEADER.size
+        self.cursor = 0
+        self.wrap = 0
+        self.seq = 0
+        self.refs = 0
+        self.lock = threading.Lock()
+
+        Path(name).parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(name, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            st = os.fstat(fd)
+            if st.st_size != size:
+                os.ftruncate(fd, 0)
+                os.ftruncate(fd, size)
+            self._mmap = mmap.mmap(fd, size)
+        finally:
+            os.close(fd)
+        self._file_id = (st.st_dev, st.st_ino)
+
+        magic, capacity, cursor, wrap, seq = HEADER.unpack_from(self._mmap, 0)
+        if magic == HEADER_MAGIC and capacity == self.capacity:
+            self.cursor, self.wrap, self.seq = cursor, wrap, seq
+        else:
+            self._mmap[:] = bytes(size)
+            self._write_header()
+
+    def is_current(self) -> bool:
+        """Whether the ring is mapped on the file that is at its path now."""
+
+        try:
+            st = os.stat(self.name)
+        except FileNotFoundError:
+            return False
+
+        return (st.st_dev, st.st_ino) == self._file_id
+
+    def _write_header(self) -> None:
+        HEADER.pack_into(
+            self._mmap,
+            0,
+            HEADER_MAGIC,
+            self.capacity,
+            self.cursor,
+            self.wrap,
+            self.seq,
+        )
+
+    def write_frame(self, payload: bytes) -> None:
+        """Write one frame at the cursor."""
+
+        payload = payload[: self.capacity - FRAME.size]
+        frame_size = FRAME.size + len(payload)
+
+        with self.lock:
+            seq = self.seq
+            mm = self._mmap
+            if self.cursor + frame_size > self.capacity:
+                start = HEADER.size + self.cursor
+                mm[start:] = bytes(len(mm) - start)
+                self.cursor = 0
+                self.wrap += 1
+
+            offset = HEADER.size + self.cursor
+            seq_bytes = seq.to_bytes(8, "little")
+            FRAME.pack_into(
+                mm, offset, FRAME_MAGIC, len(payload), seq, _crc(seq_bytes, payload)
+            )
+            mm[offset + FRAME.size : offset + frame_size] = payload
+
+            self.cursor += frame_size
+            self.seq = seq + 1
+            self._write_header()
+
+    def flush(self) -> None:
+        with self.lock:
+            if not self._mmap.closed:
+                self._mmap.flush()
+
+    def close(self) -> None:
+        """Release a reference, and unmap the file if it was the last one."""
+
+        with _lock:
+            self.refs -= 1
+            if self.refs > 0:
+                return
+
+            if _rings.get(self.name) is self:
+                del _rings[self.name]
+
+        with self.lock:
+            if not self._mmap.closed:
+                self._mmap.flush()
+                self._mmap.close()
+
+
+def _open_ring(filepath: str, size: int) -> _Ring:
+    """Get the ring of a file and take a reference to it.
+
+    The rings are keyed by the resolved path. A file that was removed or
+    replaced is mapped again by a new ring.
+
+    Raises:
+        ValueError: If the ring is open with another size.
+
+    """
+
+    key = os.path.realpath(filepath)
+    with _lock:
+        ring = _rings.get(key)
+        if ring is None or not ring.is_current():
+            ring = _rings[key] = _Ring(key, size)
+        elif ring.size != size:
+            raise ValueError(f"{filepath} is open as a ring of {ring.size} bytes")
+        ring.refs += 1
+
+    return ring
+
+
+class RingFileHandler(Handler):
+    """A handler that writes records into a fixed size file as a ring.
+
+    The file is preallocated with size bytes and mapped with mmap. Each
+    record is a frame of (magic, length, seq, crc32, formatted message),
+    written at the cursor of the header. A frame that does not fit before
+    the end of the file is written at the start, the tail is zeroed and the
+    wrap count is incremented, overwriting the oldest frames.
+
+    Writes are memory copies, and the kernel writes the pages back, so the
+    records survive a crash of the process. An existing ring of the same
+    size is continued. Read the records with read_ring_file.
+
+    The handlers of a file share one mapping of its resolved path, and with
+    it the cursor, so their frames never overwrite each other.
+
+    Args:
+        filepath (str): Ring file path.
+        size (int): File size in bytes including the header.
+
+    Attributes:
+        capacity (int): Bytes of the frame area.
+        cursor (int): Offset of the next frame in the frame area.
+        wrap (int): Number of times the ring wrapped.
+        seq (int): Sequence number of the next frame.
+
+    """
+
+    def __init__(self, filepath: str, size: int = 16 * 1024 * 1024) -> None:
+        super().__init__()
+
+        if size <= HEADER.size + FRAME.size:
+            raise ValueError(f"size must be larger than {HEADER.size + FRAME.size}")
+
+        self.filepath = filepath
+        self._ring = _open_ring(filepath, size)
+        self._closed = False
+
+    @property
+    def capacity(self) -> int:
+        return self._ring.capacity
+
+    @property
+    def cursor(self) -> int:
+        return self._ring.cursor
+
+    @property
+    def wrap(self) -> int:
+        return self._ring.wrap
+
+    @property
+    def seq(self) -> int:
+        return self._ring.seq
+
+    def emit(self, record) -> None:
+        try:
+            payload = self.format(record).encode("utf-8", "replace")
+            self.write_frame(payload)
+        except Exception:
+            self.handleError(record)
+
+    def write_frame(self, payload: bytes) -> None:
+        """Write one frame at the cursor."""
+
+        self._ring.write_frame(payload)
+
+    def flush(self) -> None:
+        self._ring.flush()
+
+    def close(self) -> None:
+        self.acquire()
+        try:
+            if not self._closed:
+                self._closed = True
+                self._ring.close()
+        finally:
+            self.release()
+
+        super().close()
+
+
+def iter_ring_file(filepath: str) -> Iterator[Tuple[int, bytes]]:
+    """Iterate the valid frames of a ring file in file order.
+
+    The whole frame area is scanned for frame magics, and frames whose crc
+    does not match, e.g. half overwritten or half written on a crash, are
+    skipped.
+
+    Yields:
+        (seq, payload) of each frame.
+
+    """
+
+    with open(filepath, "rb") as f:
+        data = f.read()
+
+    magic, capacity, _, _, _ = HEADER.unpack_from(data, 0)
+    if magic != HEADER_MAGIC:
+        raise ValueError(f"Not a ring file: {filepath}")
+
+    end = HEADER.size + capacity
+    pos = data.find(FRAME_MAGIC, HEADER.size, end)
+    while pos != -1 and pos + FRAME.size <= end:
+        _, length, seq, crc = FRAME.unpack_from(data, pos)
+        payload_start = pos + FRAME.size
+        payload = data[payload_start : payload_start + length]
+        if (
+            payload_start + length <= end
+            and _crc(seq.to_bytes(8, "little"), payload) == crc
+        ):
+            yield seq, payload
+            pos = data.find(FRAME_MAGIC, payload_start + length, end)
+        else:
+            pos = data.find(FRAME_MAGIC, pos + 1, end)
+
+
+def read_ring_file(filepath: str) -> List[str]:
+    """Read the records of a ring file in chronological order."""
+
+    frames = sorted(iter_ring_file(filepath))
+
+    return [payload.decode("utf-8", "replace") for _, payload in frames]
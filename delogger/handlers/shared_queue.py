@@ -0,0 +1,248 @@
+from logging import Handler
+from logging import LogRecord
+from threading import Lock
+from time import monotonic
+from typing import List
+from typing import Optional
+
+from delogger.handlers.delogger_queue import DeloggerQueueHandler
+from delogger.handlers.queue_listener import DeloggerQueueListener
+from delogger.handlers.queue_listener import FlushBarrier
+from delogger.handlers.shutdown import DrainReport
+
+__all__ = ["RoutedRecord", "SharedQueueHandler", "SharedQueueListener"]
+
+
+class RoutedRecord:
+    """Queue item of a record and the handler set of the logger that sent it.
+
+    Attributes:
+        route (DeloggerQueueListener): Threadless listener with the handlers
+            and lanes of the logger.
+        record (LogRecord): Record to output.
+        levelno (int): Level of the record, read by the backpressure policies.
+
+    """
+
+    __slots__ = ("route", "record", "levelno")
+
+    def __init__(self, route: DeloggerQueueListener, record: LogRecord) -> None:
+        self.route = route
+        self.record = record
+        self.levelno = record.levelno
+
+
+class SharedQueueListener(DeloggerQueueListener):
+    """One listener thread for the queues of many loggers.
+
+    Each queue item is a RoutedRecord, and consecutive records of the same
+    route are handled as one batch by the route, so the records keep their
+    order within a logger and across loggers.
+
+    The loggers take a reference with acquire and drop it with release, and
+    the listener stops when the last one is released.
+
+    Attributes:
+        users (int): Number of loggers that use the listener.
+
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+
+        self.users = 0
+        self._users_lock = Lock()
+        self._closing = False
+
+    def start(self) -> None:
+        if self._thread:
+            return
+
+        super().start()
+
+    def stop(self, timeout: Optional[float] = None) -> bool:
+        # A stopped listener is never handed out again.
+        self._closing = True
+
+        return super().stop(timeout)
+
+    def acquire(self) -> bool:
+        """Take a reference for a logger.
+
+        Returns:
+            True if the reference is taken, False if the listener is
+            stopping and a new one is needed.
+
+        """
+
+        with self._users_lock:
+            if self._closing:
+                return False
+
+            self.users += 1
+
+        return True
+
+    def release(
+        self, route: DeloggerQueueListener, timeout: Optional[float] = None
+    ) -> bool:
+        """Drop the reference of a logger, and stop the lanes of its route.
+
+        The listener stops after its queued records when the last reference
+        is dropped.
+
+        Args:
+            route (DeloggerQueueListener): Route of the logger.
+            timeout (float): Seconds to wait. Wait forever if None.
+
+        Returns:
+            True if everything to stop stopped, False on timeout.
+
+        """
+
+        deadline = None if timeout is None else monotonic() + timeout
+
+        def remaining() -> Optional[float]:
+            return None if deadline is None else max(deadline - monotonic(), 0)
+
+        # The listener thread iterates over the lanes, so the list is replaced.
+        self.lanes = [lane for lane in self.lanes if lane not in route.lanes]
+        stopped = True
+        for lane in route.lanes:
+            stopped = lane.stop(remaining()) and stopped
+
+        with self._users_lock:
+            self.users -= 1
+            if self.users > 0:
+                return stopped
+            self._closing = True
+
+        return self.stop(remaining()) and stopped
+
+    def add_route(self, route: DeloggerQueueListener) -> None:
+        for lane in route.lanes:
+            self.lanes.append(lane)
+            if self._thread:
+                lane.start()
+
+    def _handle_items(self, items: List) -> None:
+        route: Optional[DeloggerQueueListener] = None
+        records: List[LogRecord] = []
+        for item in items:
+            if isinstance(item, FlushBarrier):
+                if records:
+                    self._handle_route(route, records)
+                    records = []
+                for lane in self.lanes:
+                    lane.put_barrier(item)
+                item.done()
+                continue
+
+            if item.route is not route:
+                if records:
+                    self._handle_route(route, records)
+                    records = []
+                route = item.route
+
+            records.append(item.record)
+
+        if records:
+            self._handle_route(route, records)
+
+    def _handle_route(self, route, records: List[LogRecord]) -> None:
+        route.handle_batch(records)
+        self.handled += len(records)
+
+
+class SharedQueueHandler(DeloggerQueueHandler):
+    """DeloggerQueueHandler of one logger on the shared queue.
+
+    drain flushes the records of the logger and releases the listener, which
+    keeps running for the other loggers.
+
+    Args:
+        listener (SharedQueueListener): Shared listener, acquired for the
+            handler.
+        route (DeloggerQueueListener): Threadless listener with the handlers
+            and lanes of the logger.
+        *args: Arguments of DeloggerQueueHandler after the listener.
+        **kwargs: Keyword arguments of DeloggerQueueHandler.
+
+    Attributes:
+        route (DeloggerQueueListener): Handlers and lanes of the logger.
+        enqueued (int): Number of records of the logger put into the queue.
+
+    """
+
+    def __init__(
+        self,
+        listener: SharedQueueListener,
+        route: DeloggerQueueListener,
+        *args,
+        **kwargs
+    ) -> None:
+        self.route = route
+        self.enqueued = 0
+        self._released = False
+        self._release_lock = Lock()
+        listener.add_route(route)
+
+        super().__init__(listener, *args, **kwargs)
+
+    @property
+    def output_handlers(self) -> List[Handler]:
+        return self.route.output_handlers()
+
+    def enqueue(self, record) -> None:
+        if self._released:
+            return
+
+        if self.policy.put(self.queue, RoutedRecord(self.route, record)):
+            self.enqueued += 1
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        if self._released:
+            return False
+
+        return super().join(timeout)
+
+    def drain(self, timeout: Optional[float] = None) -> DrainReport:
+        """Flush the records of the logger and release the shared listener.
+
+        A FlushBarrier is waited for instead of stopping the listener, and
+        the reference is released only when the records are handled, so a
+        drain that times out can be retried.
+
+        Args:
+            timeout (float): Seconds to wait. Wait forever if None.
+
+        Returns:
+            DrainReport of the records of the logger.
+
+        """
+
+        deadline = None if timeout is None else monotonic() + timeout
+        handled = self.handled
+        if not self.join(timeout):
+            return DrainReport(self.handled - handled, self.pending())
+
+        with self._release_lock:
+            if self._released:
+                return DrainReport(self.handled - handled, 0)
+            self._released = True
+
+        remaining = None if deadline is None else max(deadline - monotonic(), 0)
+        self.listener.release(self.route, remaining)
+
+        return DrainReport(self.handled - handled, self.pending())
+
+    @property
+    def handled(self) -> int:
+        return self.route.handled
+
+    def pending(self) -> int:
+        count = self.enqueued - self.route.handled
+        for lane in self.route.lanes:
+            count += lane.pending()
+
+        return max(count, 0)
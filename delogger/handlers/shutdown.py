@@ -0,0 +1,227 @@
+import atexit
+import os
+import signal
+import sys
+import threading
+from time import monotonic
+from typing import Dict
+from typing import Iterable
+from typing import NamedTuple
+from typing import Optional
+from typing import Sequence
+from weakref import WeakSet
+
+__all__ = [
+    "DrainReport",
+    "register",
+    "drain_all",
+    "flush_all",
+    "flush_filters",
+    "install_signal_handlers",
+    "register_filter",
+]
+
+DEFAULT_DRAIN_TIMEOUT: float = 5.0
+"""Default seconds to drain the queued records at shutdown."""
+
+
+class DrainReport(NamedTuple):
+    """Result of draining the queued records.
+
+    Attributes:
+        flushed (int): Number of records handled during the drain.
+        abandoned (int): Number of records still queued at the deadline.
+
+    """
+
+    flushed: int = 0
+    abandoned: int = 0
+
+
+last_report: Optional[DrainReport] = None
+"""Report of the last drain_all."""
+
+_handlers: WeakSet = WeakSet()
+_filters: WeakSet = WeakSet()
+_after_drain_filters: WeakSet = WeakSet()
+_lock = threading.Lock()
+_at_exit_registered = False
+_previous_handlers: Dict[int, object] = {}
+
+
+def register(handler, signals: Sequence[int] = (signal.SIGTERM,)) -> None:
+    """Drain the handler at interpreter exit, and flush it when the signals arrive.
+
+    The signals of every call are installed, so the handlers are flushed on
+    any signal a registered logger asked for.
+
+    Args:
+        handler: Handler with drain(timeout), flush_queue(timeout) and
+            drain_timeout.
+        signals (list): Signals to flush on. See install_signal_handlers.
+
+    """
+
+    with _lock:
+        _handlers.add(handler)
+    _register_at_exit()
+    install_signal_handlers(signals)
+
+
+def register_filter(flt, after_drain: bool = False) -> None:
+    """Flush the filter before the handlers are drained or flushed.
+
+    The summaries the filter holds back are logged at interpreter exit, and
+    queued with the other records by drain_all and flush_all.
+
+    Args:
+        flt: Filter with flush().
+        after_drain (bool): Flush after the handlers instead, for a filter
+            of an output handler that sees the queued records.
+
+    """
+
+    with _lock:
+        (_after_drain_filters if after_drain else _filters).add(flt)
+    _register_at_exit()
+
+
+def flush_filters(filters: Iterable) -> None:
+    """Call flush of the filters that have one.
+
+    Args:
+        filters (list): Filters, e.g. Logger.filters.
+
+    """
+
+    for flt in list(filters):
+        flush = getattr(flt, "flush", None)
+        if flush is not None:
+            flush()
+
+
+def drain_all(timeout: Optional[float] = None) -> DrainReport:
+    """Drain every registered handler within one deadline.
+
+    Handlers are drained one after another, so a handler that is still
+    stuck at the deadline leaves no time for the next ones.
+
+    Args:
+        timeout (float): Seconds for all the handlers together. The largest
+            drain_timeout of the handlers by default.
+
+    """
+
+    global last_report
+
+    flush_filters(_filters)
+    handlers = list(_handlers)
+    if timeout is None:
+        timeout = max((hdlr.drain_timeout for hdlr in handlers), default=0)
+
+    deadline = monotonic() + timeout
+    flushed = abandoned = 0
+    for hdlr in handlers:
+        report = hdlr.drain(max(deadline - monotonic(), 0))
+        flushed += report.flushed
+        abandoned += report.abandoned
+    flush_filters(_after_drain_filters)
+
+    last_report = DrainReport(flushed, abandoned)
+    return last_report
+
+
+def flush_all(timeout: Optional[float] = None) -> DrainReport:
+    """Wait until every registered handler handles its queued records.
+
+    Unlike drain_all, the listeners keep running, so records logged after
+    the call are still handled.
+
+    Args:
+        timeout (float): Seconds for all the handlers together. The largest
+            drain_timeout of the handlers by default.
+
+    """
+
+    flush_filters(_filters)
+    handlers = list(_handlers)
+    if timeout is None:
+        timeout = max((hdlr.drain_timeout for hdlr in handlers), default=0)
+
+    deadline = monotonic() + timeout
+    flushed = abandoned = 0
+    for hdlr in handlers:
+        report = hdlr.flush_queue(max(deadline - monotonic(), 0))
+        flushed += report.flushed
+        abandoned += report.abandoned
+    flush_filters(_after_drain_filters)
+
+    return DrainReport(flushed, abandoned)
+
+
+def install_signal_handlers(signals: Sequence[int] = (signal.SIGTERM,)) -> None:
+    """Flush the registered handlers before the signals terminate the process.
+
+    Signal handlers can only be set from the main thread, so nothing is
+    installed from other threads. Ignored signals are left alone, and a
+    Python signal handler set before is called after the flush. The
+    listeners keep running for the records it logs, and are drained at exit.
+
+    """
+
+    if threading.current_thread() is not threading.main_thread():
+        return
+
+    for signum in signals:
+        previous = signal.getsignal(signum)
+        if previous in (signal.SIG_IGN, None, _on_signal):
+            continue
+
+        _previous_handlers[signum] = previous
+        signal.signal(signum, _on_signal)
+
+
+def _register_at_exit() -> None:
+    global _at_exit_registered
+
+    with _lock:
+        is_first = not _at_exit_registered
+        _at_exit_registered = True
+
+    if is_first:
+        atexit.register(_drain_at_exit)
+
+
+def _drain_at_exit() -> None:
+    report = drain_all()
+    if report.abandoned:
+        sys.stderr.write(
+            f"delogger: {report.abandoned} queued records abandoned at shutdown "
+            f"({report.flushed} flushed)\n"
+        )
+
+
+def _flush_on_signal() -> None:
+    report = flush_all()
+    if report.abandoned:
+        sys.stderr.write(
+            f"delogger: {report.abandoned} queued records not flushed on signal "
+            f"({report.flushed} flushed)\n"
+        )
+
+
+def _on_signal(signum, frame) -> None:
+    # The signal may interrupt the main thread while it holds a queue lock,
+    # so flush from another thread and give up at the deadline.
+    timeout = max((hdlr.drain_timeout for hdlr in list(_handlers)), default=0)
+    thread = threading.Thread(target=_flush_on_signal, daemon=True)
+    thread.start()
+    thread.join(timeout + 1)
+
+    previous = _previous_handlers.get(signum, signal.SIG_DFL)
+    if callable(previous):
+        previous(signum, frame)
+        return
+
+    signal.signal(signum, previous)
+    os.kill(os.getpid(), signum)
@@ -8,7 +8,11 @@ from logging import NOTSET
 from logging import WARNING
 from typing import Any
 from typing import Dict
+from typing import Iterator
+from typing import List
 from typing import Optional
+from typing import Sequence
+from typing import Tuple
 import urllib.request
 
 
@@ -65,6 +69,9 @@ class SlackHandler(Handler):
     POST_MESSAGE_URL: str = "https://slack.com/api/chat.postMessage"
     """Execution when using token API."""
 
+    BATCH_MAX_LENGTH: int = 4000
+    """Maximum text length of a message sent by emit_batch."""
+
     def __init__(
         self,
         url: Optional[str] = None,
@@ -102,10 +109,10 @@ class SlackHandler(Handler):
 
         super().__init__()
 
-    def make_json(self, record) -> Dict[str, Any]:
+    def make_json(self, record, text: Optional[str] = None) -> Dict[str, Any]:
         json_data: Dict[str, Any] = {}
 
-        json_data["text"] = self.format(record)
+        json_data["text"] = self.format(record) if text is None else text
         if self.as_user:
             json_data["as_user"] = self.as_user
 
@@ -125,13 +132,19 @@ class SlackHandler(Handler):
 
         return json_data
 
-    def make_payload(self, record) -> bytes:
+    def make_payload(self, record, text: Optional[str] = None) -> bytes:
         """Get slack's payload."""
 
-        json_data = self.make_json(record)
+        json_data = self.make_json(record, text)
 
         return json.dumps(json_data).encode("utf-8")
 
+    def send(self, payload: bytes) -> None:
+        request = urllib.request.Request(
+            url=self.url, method="POST", data=payload, headers=self.headers
+        )
+        urllib.request.urlopen(request, timeout=self.TIMEOUT)
+
     def emit(self, record):
         """Send a message to Slack."""
 
@@ -139,15 +152,57 @@ class SlackHandler(Handler):
             if not self.is_emit:
                 return
 
-            payload = self.make_payload(record)
-            request = urllib.request.Request(
-                url=self.url, method="POST", data=payload, headers=self.headers
-            )
-            urllib.request.urlopen(request, timeout=self.TIMEOUT)
+            self.send(self.make_payload(record))
 
         except Exception:
             self.handleError(record)
 
+    def emit_batch(self, records: Sequence) -> None:
+        """Send the records to Slack, joining them into as few messages as possible.
+
+        The icon and username follow the highest level record of each message.
+
+        """
+
+        if not self.is_emit:
+            return
+
+        for record, payload in self.iter_batch_payloads(records):
+            try:
+                self.send(payload)
+            except Exception:
+                self.handleError(record)
+
+    def iter_batch_payloads(self, records: Sequence) -> Iterator[Tuple[Any, bytes]]:
+        """Join the records into payloads of at most BATCH_MAX_LENGTH characters.
+
+        Yields:
+            The highest level record and the payload of each message.
+
+        """
+
+        texts: List[str] = []
+        length = 0
+        top = None
+        for record in records:
+            try:
+                text = self.format(record)
+            except Exception:
+                self.handleError(record)
+                continue
+
+            if texts and length + len(text) + 1 > self.BATCH_MAX_LENGTH:
+                yield top, self.make_payload(top, "\n".join(texts))
+                texts, length, top = [], 0, None
+
+            texts.append(text)
+            length += len(text) + 1
+            if top is None or record.levelno > top.levelno:
+                top = record
+
+        if texts:
+            yield top, self.make_payload(top, "\n".join(texts))
+
     def __eq__(self, other):
         """Comparison for SlackHandler.
 
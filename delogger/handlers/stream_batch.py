@@ -0,0 +1,47 @@
+from typing import List
+from typing import Sequence
+
+__all__ = ["StreamBatchMixin"]
+
+
+class StreamBatchMixin:
+    """Add emit_batch to StreamHandler based handlers.
+
+    The records are formatted and written with one write call and one flush.
+    Handlers with shouldRollover/doRollover (BaseRotatingHandler) roll over
+    between records as emit does.
+
+    """
+
+    def emit_batch(self, records: Sequence) -> None:
+        """Write the records with a single write and flush."""
+
+        should_rollover = getattr(self, "shouldRollover", None)
+
+        msgs: List[str] = []
+        for record in records:
+            try:
+                if should_rollover and should_rollover(record):
+                    self._write_batch(msgs, record)
+                    msgs = []
+                    self.doRollover()
+
+                msgs.append(self.format(record) + self.terminator)
+            except Exception:
+                self.handleError(record)
+
+        if msgs:
+            self._write_batch(msgs, records[-1])
+
+    def _write_batch(self, msgs: List[str], record) -> None:
+        if not msgs:
+            return
+
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+
+            self.stream.write("".join(msgs))
+            self.flush()
+        except Exception:
+            self.handleError(record)
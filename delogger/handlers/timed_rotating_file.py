@@ -0,0 +1,65 @@
+from logging import handlers
+import os
+from typing import Optional
+
+from delogger.handlers.stream_batch import StreamBatchMixin
+from delogger.util.compress import check_compression
+from delogger.util.compress import recover
+from delogger.util.compress import submit
+from delogger.util.retention import RetentionPolicy
+
+__all__ = ["TimedRotatingFileHandler"]
+
+
+class TimedRotatingFileHandler(StreamBatchMixin, handlers.TimedRotatingFileHandler):
+    """logging.handlers.TimedRotatingFileHandler that supports emit_batch.
+
+    Args:
+        *args: Arguments of logging.handlers.TimedRotatingFileHandler.
+        compression (str): Compress the rotated files in the background,
+            with "gzip", "bz2" or "lzma".
+        retention (RetentionPolicy): Limits of the rotated files, applied
+            at start and at rollover in addition to backupCount.
+        **kwargs: Keyword arguments of
+            logging.handlers.TimedRotatingFileHandler.
+
+    """
+
+    def __init__(
+        self,
+        *args,
+        compression: Optional[str] = None,
+        retention: Optional[RetentionPolicy] = None,
+        **kwargs
+    ) -> None:
+        check_compression(compression)
+
+        super().__init__(*args, **kwargs)
+
+        self.compression = compression
+        self.retention = retention or RetentionPolicy()
+        if compression is not None:
+            self.rotator = self._rotate_and_compress
+            recover(
+                os.path.dirname(self.baseFilename), compression, [self.baseFilename]
+            )
+
+        self._apply_retention()
+
+    def doRollover(self) -> None:
+        super().doRollover()
+
+        self._apply_retention()
+
+    def _apply_retention(self) -> None:
+        prefix = os.path.basename(self.baseFilename) + "."
+        self.retention.enforce(
+            os.path.dirname(self.baseFilename), lambda name: name.startswith(prefix)
+        )
+
+    def _rotate_and_compress(self, source: str, dest: str) -> None:
+        if not os.path.exists(source):
+            return
+
+        os.replace(source, dest)
+        submit(dest, self.compression)
@@ -1,7 +1,8 @@
 from logging import CRITICAL
 from logging import DEBUG
-from logging import Formatter
+from logging import Handler
 from logging import Logger
+from logging import NOTSET
 from logging import StreamHandler
 from logging import WARNING
 from logging import addLevelName
@@ -10,14 +11,37 @@ import os
 from typing import Dict
 from typing import List
 from typing import Optional
-
-from colorlog import ColoredFormatter
+from typing import Sequence
 
 from delogger.decorators.base import DecoratorBase
+from delogger.filters.dedup import DedupFilter
 from delogger.filters.only_filter import OnlyFilter
+from delogger.formatters.fast_formatter import FastFormatter
 from delogger.modes.base import ModeBase
 
 
+def lowest_handler_level(handlers: Sequence[Handler]) -> int:
+    """Get the lowest level the handlers output.
+
+    Handlers that pass the records on, such as queue handlers, expose the
+    handlers that output them as output_handlers.
+
+    Returns:
+        The lowest level, or NOTSET if there is no handler.
+
+    """
+
+    levels = []
+    for hdlr in handlers:
+        outputs = getattr(hdlr, "output_handlers", None)
+        if outputs is None:
+            levels.append(hdlr.level)
+        elif outputs:
+            levels.append(max(hdlr.level, lowest_handler_level(outputs)))
+
+    return min(levels, default=NOTSET)
+
+
 class DeloggerBase:
     """A class that provides a decided logger.
 
@@ -26,10 +50,15 @@ class DeloggerBase:
         parent (str): Log file save destination.
         *args: DeloggerSetting.
         **kwargs: DeloggerSetting.
+        level (int): Logger level. By default the logger level follows the
+            lowest level of the handlers, so disabled records are dropped by
+            isEnabledFor. Set it, e.g. to DEBUG, when ancestors output the
+            records through propagation.
 
     Attributes:
         _logger (logging.Logger): Logger.
         _is_new_logger (bool): Whether it is a first generation logger.
+        level (int): Logger level set by the user, or None.
 
     """
 
@@ -38,6 +67,8 @@ class DeloggerBase:
         name: Optional[str] = None,
         modes: Optional[List[ModeBase]] = None,
         decorators: Optional[List[DecoratorBase]] = None,
+        *,
+        level: Optional[int] = None,
     ) -> None:
         addLevelName(WARNING, "WARN")
         addLevelName(CRITICAL, "CRIT")
@@ -45,8 +76,9 @@ class DeloggerBase:
         # base logger
         name = name or os.getenv("DELOGGER_NAME", "delogger")
         logger = getLogger(name)
-        logger.setLevel(DEBUG)
         self._logger: Logger = logger
+        self.level = level
+        self.update_level()
 
         # check already set logger
         if len(self._logger.handlers) > 0:
@@ -96,6 +128,7 @@ class DeloggerBase:
         datefmt: Optional[str] = None,
         only_level: bool = False,
         formatter=None,
+        dedup_window: Optional[float] = None,
     ) -> None:
         """Helper function to add a handler.
 
@@ -107,19 +140,64 @@ class DeloggerBase:
             only_level (bool): Whether to output only to specified han-
             dler level.
             formatter: Handler formatter.
+            dedup_window (float): Seconds to collapse duplicate records of
+                the handler with DedupFilter. Not collapsed if None.
 
         """
 
         hdlr.setLevel(level)
 
         # Set formatter.
-        formatter = formatter or Formatter(fmt, datefmt)
+        formatter = formatter or FastFormatter(fmt, datefmt)
         hdlr.setFormatter(formatter)
 
         if only_level:
             hdlr.addFilter(OnlyFilter(level))
 
+        if dedup_window is not None:
+            hdlr.addFilter(DedupFilter(hdlr, dedup_window))
+
         self._logger.addHandler(hdlr)
+        self.update_level()
+
+    def remove_handler(self, hdlr) -> None:
+        """Remove a handler from the logger.
+
+        Args:
+            hdlr: Handler.
+
+        """
+
+        self._logger.removeHandler(hdlr)
+        self.update_level()
+
+    def add_filter(self, flt) -> None:
+        """Add a filter to the logger.
+
+        Logger filters run before any handler, e.g. RateLimitFilter drops
+        records before they are queued.
+
+        Args:
+            flt: Filter.
+
+        """
+
+        self._logger.addFilter(flt)
+
+    def update_level(self) -> None:
+        """Set the logger level to the lowest level of the handlers.
+
+        Called whenever add_handler or remove_handler changes the handlers.
+        Call it after changing the level of a handler directly.
+
+        """
+
+        if self.level is not None:
+            self._logger.setLevel(self.level)
+            return
+
+        level = lowest_handler_level(self._logger.handlers)
+        self._logger.setLevel(level or DEBUG)
 
     def add_stream_handler(self, level: int, *, hdlr=None, **kwargs) -> None:
         """Helper function to add a stream handler.
@@ -141,7 +219,7 @@ class DeloggerBase:
         *,
         hdlr=None,
         datefmt: Optional[str] = None,
-        **kwargs
+        **kwargs,
     ) -> None:
         """Helper function to add a color stream handler.
 
@@ -152,6 +230,9 @@ class DeloggerBase:
 
         """
 
+        # colorlog is imported by the first color handler, not at import.
+        from colorlog import ColoredFormatter
+
         formatter = ColoredFormatter(
             kwargs.get("fmt", None), log_colors=log_colors, style="%", datefmt=datefmt
         )
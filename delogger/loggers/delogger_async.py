@@ -0,0 +1,98 @@
+from logging import Logger
+from logging import NOTSET
+from typing import List
+from typing import Optional
+
+from delogger.decorators.base import DecoratorBase
+from delogger.handlers.delogger_async import DeloggerAsyncHandler
+from delogger.loggers.base import DeloggerBase
+from delogger.modes.base import ModeBase
+
+
+class DeloggerAsync(DeloggerBase):
+    """Delogger for asyncio that never blocks the event loop.
+
+    Logging calls put records into an asyncio queue without blocking, and a
+    task of the running loop outputs them to the handlers. Handlers that are
+    not AsyncHandlerBase, e.g. file handlers, run in an executor.
+
+    Await flush() to wait for the records and aclose() on shutdown.
+
+    Args:
+        maxsize (int): Maximum number of queued records. Unbounded if <= 0.
+        max_batch (int): Maximum number of records handled at once.
+    """
+
+    def __init__(
+        self,
+        name: Optional[str] = None,
+        modes: Optional[List[ModeBase]] = None,
+        decorators: Optional[List[DecoratorBase]] = None,
+        *,
+        level: Optional[int] = None,
+        maxsize: int = -1,
+        max_batch: int = 1000,
+    ) -> None:
+        self.maxsize = maxsize
+        self.max_batch = max_batch
+        self._async_hdlr: Optional[DeloggerAsyncHandler] = None
+
+        super().__init__(name=name, modes=modes, decorators=decorators, level=level)
+
+    def get_logger(self) -> Logger:
+        if not self.is_already_setup():
+            self.async_logger()
+        else:
+            self._async_hdlr = self._find_async_hdlr(self._logger.handlers)
+
+        return super().get_logger()
+
+    def async_logger(self) -> None:
+        """Move the handlers behind a DeloggerAsyncHandler."""
+
+        handlers = self._logger.handlers[:]
+        for hdlr in handlers:
+            self._logger.removeHandler(hdlr)
+
+        async_handler = DeloggerAsyncHandler(
+            handlers, maxsize=self.maxsize, max_batch=self.max_batch
+        )
+        self.add_handler(async_handler, NOTSET)
+
+        self._async_hdlr = async_handler
+
+    async def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every record logged before the call is handled.
+
+        Args:
+            timeout (float): Seconds to wait. Wait forever if None.
+
+        Returns:
+            True if the records are handled, False otherwise.
+
+        """
+
+        if not self._async_hdlr:
+            return False
+
+        return await self._async_hdlr.flush_async(timeout)
+
+    async def aclose(self, timeout: Optional[float] = None) -> bool:
+        """Flush the records and close the handlers.
+
+        Returns:
+            True if every record was handled before the timeout.
+
+        """
+
+        if not self._async_hdlr:
+            return False
+
+        return await self._async_hdlr.aclose(timeout)
+
+    def _find_async_hdlr(self, handlers) -> Optional[DeloggerAsyncHandler]:
+        for handler in handlers:
+            if isinstance(handler, DeloggerAsyncHandler):
+                return handler
+
+        return None
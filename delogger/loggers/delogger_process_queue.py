@@ -0,0 +1,257 @@
+import atexit
+from logging import LogRecord
+from logging import Logger
+from logging import NOTSET
+from logging import getLogger
+import multiprocessing
+import os
+import signal
+from typing import List
+from typing import Optional
+
+from delogger.decorators.base import DecoratorBase
+from delogger.handlers.delogger_process_queue import DeloggerProcessQueueHandler
+from delogger.handlers.queue_listener import DeloggerQueueListener
+from delogger.loggers.base import DeloggerBase
+from delogger.loggers.base import lowest_handler_level
+from delogger.loggers.delogger import Delogger
+from delogger.modes.base import ModeBase
+
+__all__ = ["DeloggerProcessQueue"]
+
+
+class _WriterListener(DeloggerQueueListener):
+    """Listener of the writer process.
+
+    Producers put lists of record attribute dicts into the queue.
+
+    """
+
+    def dequeue_batch(self) -> List:
+        batch: List = []
+        for item in super().dequeue_batch():
+            if not isinstance(item, list):
+                batch.append(item)
+                continue
+
+            for attrs in item:
+                record = LogRecord.__new__(LogRecord)
+                record.__dict__ = attrs
+                batch.append(record)
+
+        return batch
+
+
+def _writer_main(
+    que,
+    level_conn,
+    name: str,
+    modes: List[ModeBase],
+    max_batch: int,
+    max_wait_ms: float,
+) -> None:
+    """Entry point of the writer process.
+
+    Build the handlers from the modes, send their lowest level to the parent
+    process and output every record of the queue until the sentinel arrives.
+
+    """
+
+    # Ctrl-C is sent to the whole process group. Keep writing until the
+    # parent process sends the sentinel.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    # A forked writer inherits the producer side handler of the parent.
+    logger = getLogger(name)
+    for hdlr in logger.handlers[:]:
+        logger.removeHandler(hdlr)
+
+    delogger = Delogger(name, modes=modes)
+    handlers = delogger.get_logger().handlers[:]
+
+    level_conn.send(lowest_handler_level(handlers))
+    level_conn.close()
+
+    listener = _WriterListener(
+        que,
+        *handlers,
+        respect_handler_level=True,
+        max_batch=max_batch,
+        max_wait_ms=max_wait_ms,
+    )
+    listener._monitor()
+
+    for hdlr in handlers:
+        hdlr.close()
+
+
+class DeloggerProcessQueue(DeloggerBase):
+    """Delogger that outputs records in a single dedicated writer process.
+
+    Modes are not loaded in the calling process. They are sent to the writer
+    process, which builds and owns every file, stream and Slack handler.
+    Every process logs through a multiprocessing queue, so processes never
+    race on the same log file or its rotation.
+
+    get_logger waits until the writer process has built the handlers, and the
+    producer side handler takes their lowest level, so disabled records are
+    dropped before they are queued.
+
+    Processes forked after get_logger inherit the queue. Spawned processes
+    have to receive `queue` and call `DeloggerProcessQueue.attach`.
+
+    Args:
+        context (str): multiprocessing start method of the writer process.
+        maxsize (int): Maximum number of queued records. Unbounded if <= 0.
+        max_batch (int): Maximum number of records the writer handles at once.
+        max_wait_ms (float): Maximum time the writer waits for a batch to fill up.
+
+    Attributes:
+        queue: multiprocessing queue to the writer process.
+
+    """
+
+    LEVEL_TIMEOUT: float = 10
+    """Seconds to wait for the level of the writer process."""
+
+    def __init__(
+        self,
+        name: Optional[str] = None,
+        modes: Optional[List[ModeBase]] = None,
+        decorators: Optional[List[DecoratorBase]] = None,
+        *,
+        level: Optional[int] = None,
+        context: Optional[str] = None,
+        maxsize: int = -1,
+        max_batch: int = 1000,
+        max_wait_ms: float = 0,
+    ) -> None:
+        self.context = context
+        self.maxsize = maxsize
+        self.max_batch = max_batch
+        self.max_wait_ms = max_wait_ms
+
+        self.queue = None
+        self._modes: List[ModeBase] = []
+        self._process = None
+        self._pid: Optional[int] = None
+        self._queue_hdlr: Optional[DeloggerProcessQueueHandler] = None
+
+        super().__init__(name=name, modes=modes, decorators=decorators, level=level)
+
+    @classmethod
+    def attach(cls, queue, name: Optional[str] = None) -> Logger:
+        """Get a logger that sends records to an already running writer.
+
+        Use it in processes that did not inherit the logger, such as spawned
+        processes.
+
+        Args:
+            queue: `queue` of the DeloggerProcessQueue.
+            name (str): Logger name.
+
+        """
+
+        delogger = DeloggerBase(name)
+        if not cls._find_queue_hdlr(delogger._logger.handlers):
+            delogger.add_handler(DeloggerProcessQueueHandler(queue), NOTSET)
+
+        return delogger.get_logger()
+
+    def load_mode(self, mode: ModeBase) -> None:
+        if self._process is not None:
+            raise RuntimeError("The writer process is already started.")
+
+        self._modes.append(mode)
+
+    def get_logger(self) -> Logger:
+        if self.is_already_setup():
+            self._queue_hdlr = self._find_queue_hdlr(self._logger.handlers)
+            if self._queue_hdlr:
+                self.queue = self._queue_hdlr.queue
+        else:
+            self.start()
+
+        return super().get_logger()
+
+    def start(self) -> None:
+        """Start the writer process and send records to it."""
+
+        ctx = multiprocessing.get_context(self.context)
+        self.queue = ctx.Queue(self.maxsize if self.maxsize > 0 else 0)
+        level_recv, level_send = ctx.Pipe(duplex=False)
+        self._process = ctx.Process(
+            target=_writer_main,
+            args=(
+                self.queue,
+                level_send,
+                self._logger.name,
+                self._modes,
+                self.max_batch,
+                self.max_wait_ms,
+            ),
+            name=f"delogger-writer-{self._logger.name}",
+            daemon=True,
+        )
+        self._process.start()
+        self._pid = os.getpid()
+        level_send.close()
+
+        self._queue_hdlr = DeloggerProcessQueueHandler(self.queue)
+        self.add_handler(self._queue_hdlr, self._recv_level(level_recv))
+
+        atexit.register(self.stop)
+
+    def stop(self, timeout: Optional[float] = None) -> bool:
+        """Stop the writer process after it outputs every queued record.
+
+        Only the process that started the writer can stop it.
+
+        Args:
+            timeout (float): Seconds to wait for the writer process.
+
+        Returns:
+            True if the writer process exited, False otherwise.
+
+        """
+
+        if self._process is None or os.getpid() != self._pid:
+            return False
+
+        if self._queue_hdlr:
+            self._queue_hdlr.flush()
+        self.queue.put(None)
+        self._process.join(timeout)
+        if self._process.is_alive():
+            return False
+
+        atexit.unregister(self.stop)
+        if self._queue_hdlr:
+            self._logger.removeHandler(self._queue_hdlr)
+            self._queue_hdlr = None
+        self._process = None
+        self._is_new_logger = True
+
+        return True
+
+    def _recv_level(self, conn) -> int:
+        """Get the lowest level of the writer handlers, or NOTSET on failure."""
+
+        try:
+            if conn.poll(self.LEVEL_TIMEOUT):
+                return conn.recv()
+        except EOFError:
+            # The writer process exited before building the handlers.
+            pass
+        finally:
+            conn.close()
+
+        return NOTSET
+
+    @staticmethod
+    def _find_queue_hdlr(handlers) -> Optional[DeloggerProcessQueueHandler]:
+        for handler in handlers:
+            if isinstance(handler, DeloggerProcessQueueHandler):
+                return handler
+
+        return None
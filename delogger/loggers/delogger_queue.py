@@ -1,22 +1,119 @@
 from logging import Logger
 from logging import NOTSET
-from logging.handlers import QueueListener
-from queue import Queue
+import queue
+import signal
+from threading import Lock
+from typing import Dict
+from typing import List
 from typing import Optional
+from typing import Sequence
 
+from delogger.decorators.base import DecoratorBase
+from delogger.handlers.backpressure import BackpressurePolicy
 from delogger.handlers.delogger_queue import DeloggerQueueHandler
+from delogger.handlers.lane import Lane
+from delogger.handlers.queue_listener import DeloggerQueueListener
+from delogger.handlers.shared_queue import SharedQueueHandler
+from delogger.handlers.shared_queue import SharedQueueListener
+from delogger.handlers.shutdown import DEFAULT_DRAIN_TIMEOUT
+from delogger.handlers.shutdown import DrainReport
+from delogger.handlers.shutdown import flush_filters
+from delogger.handlers.shutdown import register
 from delogger.loggers.base import DeloggerBase
+from delogger.modes.base import ModeBase
+from delogger.util.ring_queue import RingQueue
 
 
 class DeloggerQueue(DeloggerBase):
     """Non-blocking Delogger using DeloggerQueueHandler.
 
     Args:
-        default (bool): Whether to use the default handler.
+        maxsize (int): Maximum number of queued records. Unbounded if <= 0.
+        policy (BackpressurePolicy): What to do when the queue is full.
+        max_batch (int): Maximum number of records the listener handles at once.
+        max_wait_ms (float): Maximum time the listener waits for a batch to fill up.
+        queue_type (str): Queue implementation.
+            "queue": queue.Queue.
+            "simple": queue.SimpleQueue. Lowest producer cost, unbounded only.
+                An unbounded queue.Queue on Python 3.6.
+            "ring": delogger.util.ring_queue.RingQueue. Lock-light, can be bounded.
+        lanes (list): Lanes that run the matching handlers on their own
+            threads, e.g. Lane(SlackHandler) so a slow webhook does not hold
+            back the file output.
+        prepare (str): Where records are rendered, "eager", "lazy" or "listener".
+            See DeloggerQueueHandler.
+        drain_timeout (float): Seconds to drain the queued records at exit.
+        drain_on_exit (bool): Whether to drain the queued records at
+            interpreter exit and flush them on drain_signals.
+        drain_signals (list): Signals to flush the queued records on before
+            the process terminates. The listener keeps running until exit.
+            Only installed from the main thread over the default or a
+            Python signal handler.
+        shared (bool): Whether to use the queue and listener thread shared by
+            every DeloggerQueue logger. Records are still output only by the
+            handlers of their logger. Shared unless maxsize, max_batch,
+            max_wait_ms or queue_type is set by default. Pass False to
+            isolate the logger on its own thread.
     """
 
+    QUEUE_TYPES = ("queue", "simple", "ring")
+
     _queue_hdlr: Optional[DeloggerQueueHandler] = None
-    """A common QueueListener for all loggers."""
+    """DeloggerQueueHandler of the logger."""
+
+    _shared_listener: Optional[SharedQueueListener] = None
+    """A common QueueListener for the loggers that do not opt out."""
+
+    _shared_lock = Lock()
+
+    def __init__(
+        self,
+        name: Optional[str] = None,
+        modes: Optional[List[ModeBase]] = None,
+        decorators: Optional[List[DecoratorBase]] = None,
+        *,
+        level: Optional[int] = None,
+        maxsize: int = -1,
+        policy: Optional[BackpressurePolicy] = None,
+        max_batch: int = 1000,
+        max_wait_ms: float = 0,
+        queue_type: str = "queue",
+        lanes: Optional[List[Lane]] = None,
+        prepare: str = "eager",
+        drain_timeout: float = DEFAULT_DRAIN_TIMEOUT,
+        drain_on_exit: bool = True,
+        drain_signals: Sequence[int] = (signal.SIGTERM,),
+        shared: Optional[bool] = None,
+    ) -> None:
+        if queue_type not in self.QUEUE_TYPES:
+            raise ValueError(f"Unknown queue_type: {queue_type}")
+        if queue_type == "simple" and maxsize > 0:
+            raise ValueError("SimpleQueue can not be bounded")
+        if prepare not in DeloggerQueueHandler.PREPARE_STRATEGIES:
+            raise ValueError(f"Unknown prepare strategy: {prepare}")
+
+        is_default_queue = (
+            maxsize <= 0
+            and max_batch == 1000
+            and max_wait_ms == 0
+            and queue_type == "queue"
+        )
+        if shared and not is_default_queue:
+            raise ValueError("The shared queue can not be configured")
+
+        self.maxsize = maxsize
+        self.policy = policy
+        self.max_batch = max_batch
+        self.max_wait_ms = max_wait_ms
+        self.queue_type = queue_type
+        self.lanes = lanes or []
+        self.prepare = prepare
+        self.drain_timeout = drain_timeout
+        self.drain_on_exit = drain_on_exit
+        self.drain_signals = drain_signals
+        self.shared = is_default_queue if shared is None else shared
+
+        super().__init__(name=name, modes=modes, decorators=decorators, level=level)
 
     def get_logger(self) -> Logger:
         if not self.is_already_setup():
@@ -25,6 +122,8 @@ class DeloggerQueue(DeloggerBase):
             self._queue_hdlr: Optional[DeloggerQueueHandler] = self._find_queue_hdlr(
                 self._logger.handlers
             )
+            if self._queue_hdlr:
+                self.policy = self._queue_hdlr.policy
 
         return super().get_logger()
 
@@ -39,19 +138,122 @@ class DeloggerQueue(DeloggerBase):
         for hdlr in handlers:
             self._logger.removeHandler(hdlr)
 
-        que: Queue = Queue(-1)
-        listener = QueueListener(que, *handlers, respect_handler_level=True)
-        queue_handler = DeloggerQueueHandler(listener, que)
+        lanes = []
+        for lane in self.lanes:
+            handlers = lane.take(handlers)
+            if lane.handlers:
+                lanes.append(lane)
+
+        if self.shared:
+            listener = self._get_shared_listener()
+            route = DeloggerQueueListener(
+                None, *handlers, respect_handler_level=True, lanes=lanes
+            )
+            queue_handler: DeloggerQueueHandler = SharedQueueHandler(
+                listener,
+                route,
+                listener.queue,
+                policy=self.policy,
+                prepare=self.prepare,
+                drain_timeout=self.drain_timeout,
+            )
+        else:
+            que = self._make_queue()
+            listener = DeloggerQueueListener(
+                que,
+                *handlers,
+                respect_handler_level=True,
+                max_batch=self.max_batch,
+                max_wait_ms=self.max_wait_ms,
+                lanes=lanes,
+            )
+            queue_handler = DeloggerQueueHandler(
+                listener,
+                que,
+                policy=self.policy,
+                prepare=self.prepare,
+                drain_timeout=self.drain_timeout,
+            )
         self.add_handler(queue_handler, NOTSET)
+        if self.drain_on_exit:
+            register(queue_handler, self.drain_signals)
 
         self._queue_hdlr = queue_handler
+        self.policy = queue_handler.policy
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every record logged before the call is handled.
+
+        Args:
+            timeout (float): Seconds to wait. Wait forever if None.
+
+        Returns:
+            True if the records are handled, False otherwise.
+
+        """
 
-    def join(self) -> bool:
         if not self._queue_hdlr:
             return False
 
-        self._queue_hdlr.join()
-        return True
+        return self._queue_hdlr.join(timeout)
+
+    def drain(self, timeout: Optional[float] = None) -> DrainReport:
+        """Stop the listener after it handles the queued records.
+
+        A logger on the shared listener flushes its records with a
+        FlushBarrier and releases the listener, which keeps running for the
+        other loggers and stops with the last one.
+
+        The filters of the logger, e.g. RateLimitFilter, are flushed first,
+        so their summaries are drained with the records, and the filters of
+        the output handlers, e.g. DedupFilter, after the records.
+
+        Args:
+            timeout (float): Seconds to wait. Wait forever if None.
+
+        Returns:
+            DrainReport of the flushed and abandoned records.
+
+        """
+
+        if not self._queue_hdlr:
+            return DrainReport()
+
+        flush_filters(self._logger.filters)
+        report = self._queue_hdlr.drain(timeout)
+        for hdlr in self._queue_hdlr.output_handlers:
+            flush_filters(hdlr.filters)
+
+        return report
+
+    def drop_counters(self) -> Dict[str, int]:
+        """Get the drop counters of the backpressure policy."""
+
+        if not self.policy:
+            return {}
+
+        return self.policy.counters()
+
+    @classmethod
+    def _get_shared_listener(cls) -> SharedQueueListener:
+        with cls._shared_lock:
+            listener = DeloggerQueue._shared_listener
+            if listener is None or not listener.acquire():
+                listener = SharedQueueListener(queue.Queue())
+                listener.acquire()
+                DeloggerQueue._shared_listener = listener
+
+        return listener
+
+    def _make_queue(self):
+        if self.queue_type == "simple":
+            # queue.SimpleQueue is new in Python 3.7.
+            return getattr(queue, "SimpleQueue", queue.Queue)()
+
+        if self.queue_type == "ring":
+            return RingQueue(self.maxsize)
+
+        return queue.Queue(self.maxsize)
 
     def _find_queue_hdlr(self, handlers) -> Optional[DeloggerQueueHandler]:
         for handler in handlers:
@@ -1,12 +1,23 @@
 from logging import DEBUG
-from logging.handlers import TimedRotatingFileHandler
+from logging import ERROR
 from typing import Optional
 
+from delogger.handlers.binary_file import BinaryFileHandler
+from delogger.handlers.buffered_file import BufferedFileHandler
 from delogger.handlers.count_rotating_file import CountRotatingFileHandler
+from delogger.handlers.ring_file import RingFileHandler
+from delogger.handlers.timed_rotating_file import TimedRotatingFileHandler
 from delogger.modes.base import ModeBase
 from delogger.util.log_file import LogFile
+from delogger.util.retention import RetentionPolicy
 
-__all__ = ["CountRotatingFileMode", "TimedRotatingFileMode"]
+__all__ = [
+    "BinaryFileMode",
+    "BufferedFileMode",
+    "CountRotatingFileMode",
+    "RingFileMode",
+    "TimedRotatingFileMode",
+]
 
 
 class FileModeBase(ModeBase):
@@ -20,6 +31,9 @@ class CountRotatingFileMode(FileModeBase):
         filepath: str = "log/%Y%m%d_%H%M%S.log",
         backup_count: int = 5,
         level: int = DEBUG,
+        compression: Optional[str] = None,
+        max_bytes: int = 0,
+        retention: Optional[RetentionPolicy] = None,
         **kwargs
     ) -> None:
         super().__init__(**kwargs)
@@ -27,12 +41,19 @@ class CountRotatingFileMode(FileModeBase):
         self.level = level
         self.filepath = filepath
         self.backup_count = backup_count
+        self.compression = compression
+        self.max_bytes = max_bytes
+        self.retention = retention
 
         self.logfile: Optional[LogFile] = None
 
     def load(self, delogger) -> None:
         run_hdlr = CountRotatingFileHandler(
-            filepath=self.filepath, backup_count=self.backup_count
+            filepath=self.filepath,
+            backup_count=self.backup_count,
+            compression=self.compression,
+            max_bytes=self.max_bytes,
+            retention=self.retention,
         )
 
         delogger.add_handler(run_hdlr, self.level, fmt=self.fmt, datefmt=self.datefmt)
@@ -47,6 +68,8 @@ class TimedRotatingFileMode(FileModeBase):
         when: str = "midnight",
         backup_count: int = 0,
         level: int = DEBUG,
+        compression: Optional[str] = None,
+        retention: Optional[RetentionPolicy] = None,
         **kwargs
     ) -> None:
         super().__init__(**kwargs)
@@ -55,6 +78,8 @@ class TimedRotatingFileMode(FileModeBase):
         self.filepath = filepath
         self.when = when
         self.backup_count = backup_count
+        self.compression = compression
+        self.retention = retention
 
         self.logfile = LogFile(filepath)
         self.logfile.mkdir()
@@ -64,6 +89,114 @@ class TimedRotatingFileMode(FileModeBase):
             filename=str(self.logfile.filepath),
             when=self.when,
             backupCount=self.backup_count,
+            compression=self.compression,
+            retention=self.retention,
         )
 
         delogger.add_handler(timed_hdlr, self.level, fmt=self.fmt, datefmt=self.datefmt)
+
+
+class BufferedFileMode(FileModeBase):
+    """CountRotatingFileMode that writes the records in chunks.
+
+    See BufferedFileHandler for the flush triggers.
+
+    """
+
+    def __init__(
+        self,
+        filepath: str = "log/%Y%m%d_%H%M%S.log",
+        backup_count: int = 5,
+        level: int = DEBUG,
+        buffer_size: int = 64 * 1024,
+        flush_interval_ms: float = 1000,
+        flush_level: int = ERROR,
+        **kwargs
+    ) -> None:
+        super().__init__(**kwargs)
+
+        self.level = level
+        self.filepath = filepath
+        self.backup_count = backup_count
+        self.buffer_size = buffer_size
+        self.flush_interval_ms = flush_interval_ms
+        self.flush_level = flush_level
+
+        self.logfile: Optional[LogFile] = None
+
+    def load(self, delogger) -> None:
+        buffered_hdlr = BufferedFileHandler(
+            filepath=self.filepath,
+            backup_count=self.backup_count,
+            buffer_size=self.buffer_size,
+            flush_interval_ms=self.flush_interval_ms,
+            flush_level=self.flush_level,
+        )
+
+        delogger.add_handler(
+            buffered_hdlr, self.level, fmt=self.fmt, datefmt=self.datefmt
+        )
+
+        self.logfile = LogFile(buffered_hdlr.filepath)
+
+
+class RingFileMode(FileModeBase):
+    """Write the records into a fixed size ring file, a flight recorder.
+
+    The file never grows past size bytes and is never rotated. Read it with
+    delogger.handlers.ring_file.read_ring_file.
+
+    """
+
+    def __init__(
+        self,
+        filepath: str = "log/delogger.ring",
+        size: int = 16 * 1024 * 1024,
+        level: int = DEBUG,
+        **kwargs
+    ) -> None:
+        super().__init__(**kwargs)
+
+        self.level = level
+        self.filepath = filepath
+        self.size = size
+
+    def load(self, delogger) -> None:
+        ring_hdlr = RingFileHandler(self.filepath, self.size)
+
+        delogger.add_handler(ring_hdlr, self.level, fmt=self.fmt, datefmt=self.datefmt)
+
+
+class BinaryFileMode(FileModeBase):
+    """Save the records in a compact binary log.
+
+    Render the file with `python -m delogger decode`, into the text of
+    CountRotatingFileMode or into JSON. See BinaryFileHandler.
+
+    """
+
+    def __init__(
+        self,
+        filepath: str = "log/%Y%m%d_%H%M%S.dlb",
+        backup_count: int = 5,
+        level: int = DEBUG,
+        **kwargs
+    ) -> None:
+        super().__init__(**kwargs)
+
+        self.level = level
+        self.filepath = filepath
+        self.backup_count = backup_count
+
+        self.logfile: Optional[LogFile] = None
+
+    def load(self, delogger) -> None:
+        binary_hdlr = BinaryFileHandler(
+            filepath=self.filepath, backup_count=self.backup_count
+        )
+
+        delogger.add_handler(
+            binary_hdlr, self.level, fmt=self.fmt, datefmt=self.datefmt
+        )
+
+        self.logfile = LogFile(binary_hdlr.filepath)
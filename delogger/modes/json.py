@@ -0,0 +1,68 @@
+from logging import DEBUG
+from typing import Optional
+from typing import Sequence
+
+from delogger.formatters.json_formatter import JsonFormatter
+from delogger.handlers.count_rotating_file import CountRotatingFileHandler
+from delogger.modes.base import ModeBase
+from delogger.util.log_file import LogFile
+
+__all__ = ["JsonFileMode", "JsonStreamMode"]
+
+
+class JsonModeBase(ModeBase):
+    datefmt = None
+
+    def __init__(
+        self,
+        fields: Optional[Sequence[str]] = None,
+        extra: bool = True,
+        backend: str = "auto",
+        **kwargs
+    ) -> None:
+        super().__init__(**kwargs)
+
+        self.fields = fields
+        self.extra = extra
+        self.backend = backend
+
+    def make_formatter(self) -> JsonFormatter:
+        return JsonFormatter(
+            self.fields, datefmt=self.datefmt, extra=self.extra, backend=self.backend
+        )
+
+
+class JsonFileMode(JsonModeBase):
+    def __init__(
+        self,
+        filepath: str = "log/%Y%m%d_%H%M%S.jsonl",
+        backup_count: int = 5,
+        level: int = DEBUG,
+        **kwargs
+    ) -> None:
+        super().__init__(**kwargs)
+
+        self.level = level
+        self.filepath = filepath
+        self.backup_count = backup_count
+
+        self.logfile: Optional[LogFile] = None
+
+    def load(self, delogger) -> None:
+        json_hdlr = CountRotatingFileHandler(
+            filepath=self.filepath, backup_count=self.backup_count
+        )
+
+        delogger.add_handler(json_hdlr, self.level, formatter=self.make_formatter())
+
+        self.logfile = LogFile(json_hdlr.filepath)
+
+
+class JsonStreamMode(JsonModeBase):
+    def __init__(self, level: int = DEBUG, **kwargs) -> None:
+        super().__init__(**kwargs)
+
+        self.level = level
+
+    def load(self, delogger) -> None:
+        delogger.add_stream_handler(self.level, formatter=self.make_formatter())
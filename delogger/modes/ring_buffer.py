@@ -0,0 +1,56 @@
+from logging import DEBUG
+from logging import ERROR
+from typing import List
+
+from delogger.handlers.ring_buffer import RingBufferHandler
+from delogger.modes.base import ModeBase
+
+__all__ = ["RingBufferMode"]
+
+
+class RingBufferMode(ModeBase):
+    """Keep the last records and output them only when an error is logged.
+
+    The handlers of the modes are moved behind a RingBufferHandler, so the
+    records below trigger_level are kept unformatted and output with their
+    context when a record at trigger_level or above is logged.
+
+    Args:
+        modes (list): Modes whose handlers output the dumped records.
+        capacity (int): Number of records to keep.
+        level (int): Lowest level to keep.
+        trigger_level (int): Records at this level or above dump the ring.
+
+    Attributes:
+        handler (RingBufferHandler): Loaded handler.
+
+    """
+
+    def __init__(
+        self,
+        modes: List[ModeBase],
+        capacity: int = 1000,
+        level: int = DEBUG,
+        trigger_level: int = ERROR,
+        **kwargs
+    ) -> None:
+        super().__init__(**kwargs)
+
+        self.modes = modes
+        self.capacity = capacity
+        self.level = level
+        self.trigger_level = trigger_level
+
+        self.handler = None
+
+    def load(self, delogger) -> None:
+        logger = delogger._logger
+        handlers = logger.handlers[:]
+        delogger.load_modes(*self.modes)
+
+        targets = [hdlr for hdlr in logger.handlers if hdlr not in handlers]
+        for hdlr in targets:
+            delogger.remove_handler(hdlr)
+
+        self.handler = RingBufferHandler(targets, self.capacity, self.trigger_level)
+        delogger.add_handler(self.handler, self.level)
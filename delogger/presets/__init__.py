@@ -0,0 +1,30 @@
+from importlib import import_module
+from logging import Logger
+from typing import Dict
+
+__all__ = ["PRESETS", "get_preset"]
+
+PRESETS: Dict[str, str] = {
+    "debug": "delogger.presets.debug",
+    "debug_stream": "delogger.presets.debug_stream",
+    "info": "delogger.presets.info",
+    "output": "delogger.presets.output",
+    "profiler": "delogger.presets.profiler",
+}
+"""Preset name: module of the preset."""
+
+
+def get_preset(name: str) -> Logger:
+    """Get the logger of a preset, built on first access.
+
+    Same as `from delogger.presets.<name> import logger`.
+
+    Args:
+        name (str): Preset name of PRESETS.
+
+    """
+
+    if name not in PRESETS:
+        raise ValueError(f"Unknown preset: {name}")
+
+    return import_module(PRESETS[name]).logger
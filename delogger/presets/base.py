@@ -2,6 +2,9 @@ from abc import ABC
 from abc import abstractmethod
 from logging import Logger
 from os import getenv
+import threading
+from typing import Callable
+from typing import Dict
 from typing import Optional
 
 from delogger import Delogger
@@ -10,6 +13,10 @@ from delogger.loggers.base import DeloggerBase
 from delogger.modes.file import CountRotatingFileMode
 from delogger.modes.file import TimedRotatingFileMode
 from delogger.modes.slack import SlackWebhookMode
+from delogger.util.lazy_import import module_getattr
+
+_loggers: Dict[str, Logger] = {}
+_lock = threading.Lock()
 
 
 class PresetsBase(ABC):
@@ -48,3 +55,45 @@ class PresetsBase(ABC):
             return SlackWebhookMode(slack_webhook)
 
         return None
+
+
+def load_preset(key: str, factory: Callable[[], PresetsBase]) -> Logger:
+    """Get the logger of a preset, built by the first call.
+
+    Args:
+        key (str): Preset key, the module name of the preset.
+        factory (Callable): Make the PresetsBase of the preset.
+
+    """
+
+    with _lock:
+        logger = _loggers.get(key)
+        if logger is None:
+            logger = _loggers[key] = factory().get_logger()
+
+    return logger
+
+
+def preset_getattr(
+    module: str, factory: Callable[[], PresetsBase]
+) -> Callable[[str], Logger]:
+    """Make the module __getattr__ of a preset, which builds `logger` lazily.
+
+    Args:
+        module (str): Module name, __name__ of the preset.
+        factory (Callable): Make the PresetsBase of the preset.
+
+    Returns:
+        __getattr__ function of the module.
+
+    """
+
+    def __getattr__(name: str) -> Logger:
+        if name == "logger":
+            return load_preset(module, factory)
+
+        raise AttributeError(f"module {module!r} has no attribute {name!r}")
+
+    module_getattr(module)
+
+    return __getattr__
@@ -4,6 +4,7 @@ from delogger.decorators.debug_log import DebugLog
 from delogger.loggers.base import DeloggerBase
 from delogger.modes.stream import StreamColorDebugMode
 from delogger.presets.base import PresetsBase
+from delogger.presets.base import preset_getattr
 
 
 class DebugStreamPresets(PresetsBase):
@@ -14,4 +15,4 @@ class DebugStreamPresets(PresetsBase):
         return delogger.get_logger()
 
 
-logger = DebugStreamPresets("debug_stream").get_logger()
+__getattr__ = preset_getattr(__name__, lambda: DebugStreamPresets("debug_stream"))
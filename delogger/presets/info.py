@@ -4,6 +4,7 @@ from delogger.decorators.debug_log import DebugLog
 from delogger.loggers.base import DeloggerBase
 from delogger.modes.stream import StreamInfoMode
 from delogger.presets.base import PresetsBase
+from delogger.presets.base import preset_getattr
 
 
 class InfoPresets(PresetsBase):
@@ -14,4 +15,4 @@ class InfoPresets(PresetsBase):
         return delogger.get_logger()
 
 
-logger = InfoPresets("info_logger").get_logger()
+__getattr__ = preset_getattr(__name__, lambda: InfoPresets("info_logger"))
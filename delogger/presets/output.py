@@ -3,6 +3,7 @@ from logging import Logger
 from delogger.decorators.debug_log import DebugLog
 from delogger.loggers.base import DeloggerBase
 from delogger.presets.base import PresetsBase
+from delogger.presets.base import preset_getattr
 
 
 class OutputPresets(PresetsBase):
@@ -17,4 +18,6 @@ class OutputPresets(PresetsBase):
         return delogger.get_logger()
 
 
-logger = OutputPresets("output_logger", is_queue=True).get_logger()
+__getattr__ = preset_getattr(
+    __name__, lambda: OutputPresets("output_logger", is_queue=True)
+)
@@ -8,6 +8,7 @@ from delogger.decorators.profiles import MemoryProfile
 from delogger.loggers.base import DeloggerBase
 from delogger.modes.stream import StreamColorDebugMode
 from delogger.presets.base import PresetsBase
+from delogger.presets.base import preset_getattr
 
 
 class ProfilerPresets(PresetsBase):
@@ -24,4 +25,4 @@ class ProfilerPresets(PresetsBase):
         return delogger.get_logger()
 
 
-logger = ProfilerPresets("profiler_logger").get_logger()
+__getattr__ = preset_getattr(__name__, lambda: ProfilerPresets("profiler_logger"))
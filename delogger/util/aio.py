@@ -0,0 +1,34 @@
+import asyncio
+from typing import Any
+from typing import Awaitable
+
+__all__ = ["get_running_loop", "run"]
+
+try:
+    from asyncio import get_running_loop
+except ImportError:  # pragma: no cover
+
+    def get_running_loop() -> asyncio.AbstractEventLoop:
+        """asyncio.get_running_loop of Python 3.7 for Python 3.6."""
+
+        loop = asyncio._get_running_loop()
+        if loop is None:
+            raise RuntimeError("no running event loop")
+
+        return loop
+
+
+def run(main: Awaitable) -> Any:
+    """asyncio.run, or a new event loop on Python 3.6."""
+
+    asyncio_run = getattr(asyncio, "run", None)
+    if asyncio_run is not None:
+        return asyncio_run(main)
+
+    loop = asyncio.new_event_loop()
+    try:
+        asyncio.set_event_loop(loop)
+        return loop.run_until_complete(main)
+    finally:
+        asyncio.set_event_loop(None)
+        loop.close()
@@ -0,0 +1,231 @@
+import bz2
+import gzip
+import lzma
+import os
+from pathlib import Path
+import queue
+import shutil
+import threading
+import time
+import traceback
+from typing import Callable
+from typing import Collection
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+__all__ = [
+    "COMPRESSIONS",
+    "check_compression",
+    "compress_file",
+    "compressed_suffixes",
+    "is_complete",
+    "is_idle",
+    "join",
+    "recover",
+    "submit",
+]
+
+COMPRESSIONS: Dict[str, Tuple[str, Callable]] = {
+    "gzip": (".gz", gzip.open),
+    "bz2": (".bz2", bz2.open),
+    "lzma": (".xz", lzma.open),
+}
+"""Compression name: (file suffix, open function)."""
+
+TMP_SUFFIX = ".tmp"
+
+IDLE_SECONDS: float = 3600.0
+"""Seconds without a write after which a log file is taken as closed.
+
+Files that no handler of the process rotated away from, e.g. those left by
+an earlier run, are only compressed when they are idle, so the live files
+of other processes are left alone.
+"""
+
+_queue: "queue.Queue[Tuple[str, str]]" = queue.Queue()
+_lock = threading.Lock()
+_worker: Optional[threading.Thread] = None
+
+
+def check_compression(compression: Optional[str]) -> None:
+    """Raise ValueError if the compression is not None or in COMPRESSIONS."""
+
+    if compression is not None and compression not in COMPRESSIONS:
+        raise ValueError(f"Unknown compression: {compression}")
+
+
+def compressed_suffixes() -> Tuple[str, ...]:
+    """Get the file suffixes of every compression."""
+
+    return tuple(suffix for suffix, _ in COMPRESSIONS.values())
+
+
+def compress_file(filepath: str, compression: str) -> str:
+    """Compress a file next to it and remove it.
+
+    The data is written to a .tmp file that is renamed when it is
+    complete, so a compressed file is never half written. The source is
+    removed after the rename, and recover finishes the work of a crash
+    between the two.
+
+    Returns:
+        Path of the compressed file.
+
+    """
+
+    suffix, open_func = COMPRESSIONS[compression]
+    dest = filepath + suffix
+    tmp = dest + TMP_SUFFIX
+
+    with open(filepath, "rb") as src, open_func(tmp, "wb") as dst:
+        shutil.copyfileobj(src, dst, 1024 * 1024)
+
+    os.replace(tmp, dest)
+    os.remove(filepath)
+
+    return dest
+
+
+def is_idle(filepath: str, idle: float = IDLE_SECONDS) -> bool:
+    """Whether the file exists and was not modified for idle seconds."""
+
+    try:
+        return time.time() - os.path.getmtime(filepath) >= idle
+    except FileNotFoundError:
+        return False
+
+
+def is_complete(dest: str, source: str, compression: str) -> bool:
+    """Whether the compressed file decompresses to the size of the source.
+
+    The decompressors check the checksum at the end of the data, so a cut
+    off or damaged file is not complete.
+
+    """
+
+    _, open_func = COMPRESSIONS[compression]
+    size = 0
+    try:
+        with open_func(dest, "rb") as f:
+            while True:
+                chunk = f.read(1024 * 1024)
+                if not chunk:
+                    break
+                size += len(chunk)
+
+        return size == os.path.getsize(source)
+    except (OSError, EOFError, lzma.LZMAError):
+        return False
+
+
+def recover(dirpath: str, compression: str, protect: Collection[str] = ()) -> List[str]:
+    """Clean up the compressions a crash left half finished in a directory.
+
+    An idle .tmp file is removed and its source is compressed again in the
+    background. A source is removed only when the compressed file next to
+    it is complete, and a broken compressed file of an idle source is
+    compressed again. Files that are not idle may be written or compressed
+    by another process, and are left alone.
+
+    Args:
+        dirpath (str): Directory path.
+        compression (str): Compression name.
+        protect (list): Paths never removed nor compressed, e.g. the files
+            open for writing.
+
+    Returns:
+        The sources submitted again.
+
+    """
+
+    suffix, _ = COMPRESSIONS[compression]
+    if not os.path.isdir(dirpath):
+        return []
+
+    protected = {os.path.realpath(path) for path in protect}
+    resubmitted = []
+    with os.scandir(dirpath) as entries:
+        names = {entry.name for entry in entries if entry.is_file()}
+
+    def can_touch(name: str) -> bool:
+        path = os.path.join(dirpath, name)
+        return os.path.realpath(path) not in protected and is_idle(path)
+
+    for name in names:
+        if name.endswith(suffix + TMP_SUFFIX):
+            source = name[: -len(suffix + TMP_SUFFIX)]
+            if not is_idle(os.path.join(dirpath, name)):
+                continue
+
+            _remove(os.path.join(dirpath, name))
+            if source in names and can_touch(source):
+                submit(os.path.join(dirpath, source), compression)
+                resubmitted.append(os.path.join(dirpath, source))
+        elif name.endswith(suffix):
+            source = name[: -len(suffix)]
+            if source not in names or source + suffix + TMP_SUFFIX in names:
+                continue
+
+            source_path = os.path.join(dirpath, source)
+            if os.path.realpath(source_path) in protected:
+                continue
+            if is_complete(os.path.join(dirpath, name), source_path, compression):
+                _remove(source_path)
+            elif is_idle(source_path):
+                submit(source_path, compression)
+                resubmitted.append(source_path)
+
+    return resubmitted
+
+
+def _remove(filepath: str) -> None:
+    try:
+        os.remove(filepath)
+    except FileNotFoundError:
+        # removed by another process meanwhile
+        pass
+
+
+def submit(filepath: str, compression: str) -> None:
+    """Compress a file on the background worker thread.
+
+    The thread that logs never pays for the compression. The worker is a
+    daemon thread, so a compression cut off at exit is finished by recover
+    on the next start.
+
+    """
+
+    global _worker
+
+    check_compression(compression)
+    _queue.put((str(filepath), compression))
+
+    with _lock:
+        if _worker is None or not _worker.is_alive():
+            _worker = threading.Thread(
+                target=_run, name="delogger-compress", daemon=True
+            )
+            _worker.start()
+
+
+def join() -> None:
+    """Wait until every submitted file is compressed."""
+
+    _queue.join()
+
+
+def _run() -> None:
+    while True:
+        filepath, compression = _queue.get()
+        try:
+            if Path(filepath).is_file():
+                compress_file(filepath, compression)
+        except FileNotFoundError:
+            # removed by the retention meanwhile
+            pass
+        except Exception:
+            traceback.print_exc()
+        finally:
+            _queue.task_done()
@@ -0,0 +1,50 @@
+from importlib import import_module
+from importlib.util import find_spec
+import sys
+from types import ModuleType
+from typing import Any
+from typing import Optional
+
+__all__ = ["can_import", "import_optional", "module_getattr"]
+
+
+def can_import(module: str) -> bool:
+    """Whether an optional module is installed, without importing it."""
+
+    try:
+        return find_spec(module) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def import_optional(module: str, name: str) -> Optional[Any]:
+    """Import an attribute of an optional module, or None if it fails."""
+
+    try:
+        return getattr(import_module(module), name)
+    except (ImportError, AttributeError):
+        return None
+
+
+class _GetattrModule(ModuleType):
+    def __getattr__(self, name: str) -> Any:
+        getattr_func = self.__dict__.get("__getattr__")
+        if getattr_func is None:
+            raise AttributeError(f"module {self.__name__!r} has no attribute {name!r}")
+
+        return getattr_func(name)
+
+
+def module_getattr(module: str) -> None:
+    """Make the __getattr__ function of a module work on Python 3.6.
+
+    Module __getattr__ (PEP 562) is new in Python 3.7. On Python 3.6 the
+    class of the module is replaced by a ModuleType that calls it.
+
+    Args:
+        module (str): Module name, __name__ of the module.
+
+    """
+
+    if sys.version_info < (3, 7):
+        sys.modules[module].__class__ = _GetattrModule
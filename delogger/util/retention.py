@@ -0,0 +1,228 @@
+import os
+import re
+import threading
+import time
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+from typing import Pattern
+
+from delogger.util.compress import TMP_SUFFIX
+from delogger.util.compress import compressed_suffixes
+
+__all__ = ["LogEntry", "RetentionPolicy", "strftime_pattern"]
+
+_STRFTIME_RE: Dict[str, str] = {
+    "%Y": r"\d{4}",
+    "%m": r"\d{2}",
+    "%d": r"\d{2}",
+    "%H": r"\d{2}",
+    "%M": r"\d{2}",
+    "%S": r"\d{2}",
+    "%f": r"\d{6}",
+    "%%": "%",
+}
+
+
+def strftime_pattern(fmt: str) -> Pattern:
+    """Compile a regex that matches the file names made from a strftime name.
+
+    The names may carry the .NNN suffix of a size rollover and the suffix of
+    a compression. Unknown directives match any text.
+
+    Args:
+        fmt (str): strftime file name, e.g. "%Y%m%d_%H%M%S.log".
+
+    """
+
+    parts = []
+    for part in re.split(r"(%.)", fmt):
+        if len(part) == 2 and part[0] == "%":
+            parts.append(_STRFTIME_RE.get(part, ".+?"))
+        else:
+            parts.append(re.escape(part))
+
+    suffixes = "|".join(re.escape(suffix) for suffix in compressed_suffixes())
+
+    return re.compile(rf"{''.join(parts)}(?:\.\d{{3}})?(?:{suffixes})?")
+
+
+_SUFFIXES = compressed_suffixes()
+
+
+def _sort_key(name: str) -> str:
+    # A compressed file sorts as its source, before the .NNN files after it.
+    if name.endswith(_SUFFIXES):
+        return name[: name.rindex(".")]
+
+    return name
+
+
+class LogEntry(NamedTuple):
+    """A log file of a directory.
+
+    Attributes:
+        path (str): File path.
+        name (str): File name.
+        size (int): Bytes. 0 if the sizes are not needed.
+        mtime (float): Modification time. 0 if the times are not needed.
+
+    """
+
+    path: str
+    name: str
+    size: int = 0
+    mtime: float = 0.0
+
+
+class RetentionPolicy:
+    """Limits of the log files of a directory.
+
+    The files are listed with one os.scandir, oldest first by name, and
+    every file over a limit is removed in the same pass. The newest files
+    are kept by max_count and max_bytes, and files older than max_age are
+    removed. stat is called only for the bytes and age limits.
+
+    Args:
+        max_count (int): Maximum number of files. No limit if 0.
+        max_bytes (int): Maximum total bytes of the files. No limit if 0.
+        max_age (float): Maximum age of the files in seconds. No limit if 0.
+        background (bool): Whether enforce runs on a daemon thread.
+
+    """
+
+    def __init__(
+        self,
+        max_count: int = 0,
+        max_bytes: int = 0,
+        max_age: float = 0,
+        background: bool = False,
+    ) -> None:
+        self.max_count = max_count
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.background = background
+
+    def __bool__(self) -> bool:
+        return bool(self.max_count or self.max_bytes or self.max_age)
+
+    def scan(self, dirpath: str, match: Callable[[str], bool]) -> List[LogEntry]:
+        """List the matching files of the directory, oldest first."""
+
+        need_stat = bool(self.max_bytes or self.max_age)
+        entries = []
+        try:
+            with os.scandir(dirpath) as it:
+                for entry in it:
+                    name = entry.name
+                    if name.endswith(TMP_SUFFIX) or not match(name):
+                        continue
+                    if not entry.is_file():
+                        continue
+
+                    if need_stat:
+                        st = entry.stat()
+                        entries.append(
+                            LogEntry(entry.path, name, st.st_size, st.st_mtime)
+                        )
+                    else:
+                        entries.append(LogEntry(entry.path, name))
+        except FileNotFoundError:
+            return []
+
+        entries.sort(key=lambda e: _sort_key(e.name))
+
+        return entries
+
+    def select(
+        self, entries: List[LogEntry], protect: Optional[str] = None
+    ) -> List[LogEntry]:
+        """Select the entries to remove.
+
+        Args:
+            entries (list): Entries, oldest first.
+            protect (str): Path that is never removed, e.g. the open file.
+
+        """
+
+        protect = os.path.abspath(protect) if protect else None
+        protect_name = os.path.basename(protect) if protect else None
+
+        def is_protected(entry: LogEntry) -> bool:
+            return entry.name == protect_name and os.path.abspath(entry.path) == protect
+
+        # The protected file is the newest and always counts.
+        protected = [entry for entry in entries if is_protected(entry)]
+        kept = len(protected)
+        kept_bytes = sum(entry.size for entry in protected)
+
+        remove = []
+        expire = time.time() - self.max_age if self.max_age else None
+        for entry in reversed(entries):
+            if protected and is_protected(entry):
+                continue
+
+            if (
+                (self.max_count and kept >= self.max_count)
+                or (self.max_bytes and kept_bytes + entry.size > self.max_bytes)
+                or (expire is not None and entry.mtime < expire)
+            ):
+                remove.append(entry)
+                continue
+
+            kept += 1
+            kept_bytes += entry.size
+
+        remove.reverse()
+
+        return remove
+
+    def apply(
+        self,
+        dirpath: str,
+        match: Callable[[str], bool],
+        protect: Optional[str] = None,
+    ) -> List[str]:
+        """Remove the files over the limits now.
+
+        Returns:
+            Paths of the removed files.
+
+        """
+
+        if not self:
+            return []
+
+        removed = []
+        for entry in self.select(self.scan(dirpath, match), protect):
+            try:
+                os.remove(entry.path)
+            except FileNotFoundError:
+                continue
+            removed.append(entry.path)
+
+        return removed
+
+    def enforce(
+        self,
+        dirpath: str,
+        match: Callable[[str], bool],
+        protect: Optional[str] = None,
+    ) -> None:
+        """Remove the files over the limits, on a daemon thread if background."""
+
+        if not self:
+            return
+
+        if not self.background:
+            self.apply(dirpath, match, protect)
+            return
+
+        threading.Thread(
+            target=self.apply,
+            args=(dirpath, match, protect),
+            name="delogger-retention",
+            daemon=True,
+        ).start()
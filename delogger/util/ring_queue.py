@@ -0,0 +1,109 @@
+from collections import deque
+from queue import Empty
+from queue import Full
+from threading import Condition
+from threading import Event
+from time import monotonic
+from typing import Any
+from typing import Optional
+
+__all__ = ["RingQueue"]
+
+
+class RingQueue:
+    """Lock-light deque based queue for a single consumer.
+
+    put and get only touch the deque on the fast path. The consumer is woken
+    with an event only while it is waiting, and producers wait on a condition
+    only while the queue is full. There is no task_done/join bookkeeping.
+
+    The bound is checked without a lock, so concurrent producers can exceed
+    maxsize by at most the number of producer threads.
+
+    Args:
+        maxsize (int): Maximum number of items. Unbounded if <= 0.
+
+    """
+
+    def __init__(self, maxsize: int = 0) -> None:
+        self.maxsize = maxsize
+
+        self._deque: deque = deque()
+        self._not_empty = Event()
+        self._getter_waiting = False
+        self._not_full = Condition()
+        self._putters_waiting = 0
+
+    def qsize(self) -> int:
+        return len(self._deque)
+
+    def empty(self) -> bool:
+        return not self._deque
+
+    def full(self) -> bool:
+        return 0 < self.maxsize <= len(self._deque)
+
+    def put(self, item: Any, block: bool = True, timeout: Optional[float] = None):
+        if 0 < self.maxsize <= len(self._deque):
+            if not block:
+                raise Full
+            self._wait_not_full(timeout)
+
+        self._deque.append(item)
+        if self._getter_waiting:
+            self._not_empty.set()
+
+    def put_nowait(self, item: Any) -> None:
+        self.put(item, False)
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> Any:
+        try:
+            item = self._deque.popleft()
+        except IndexError:
+            if not block:
+                raise Empty
+            item = self._wait_not_empty(timeout)
+
+        if self._putters_waiting:
+            with self._not_full:
+                self._not_full.notify()
+
+        return item
+
+    def get_nowait(self) -> Any:
+        return self.get(False)
+
+    def _wait_not_empty(self, timeout: Optional[float]) -> Any:
+        deadline = None if timeout is None else monotonic() + timeout
+        while True:
+            # Announce the wait before checking again, so a producer that
+            # appends after the check always sets the event.
+            self._not_empty.clear()
+            self._getter_waiting = True
+            try:
+                try:
+                    return self._deque.popleft()
+                except IndexError:
+                    pass
+
+                remaining = None if deadline is None else deadline - monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise Empty
+
+                self._not_empty.wait(remaining)
+            finally:
+                self._getter_waiting = False
+
+    def _wait_not_full(self, timeout: Optional[float]) -> None:
+        deadline = None if timeout is None else monotonic() + timeout
+        with self._not_full:
+            self._putters_waiting += 1
+            try:
+                while 0 < self.maxsize <= len(self._deque):
+                    remaining = None if deadline is None else deadline - monotonic()
+                    if remaining is not None and remaining <= 0:
+                        raise Full
+
+                    self._not_full.wait(remaining)
+            finally:
+                self._putters_waiting -= 1
@@ -0,0 +1,94 @@
+import logging
+
+from freezegun import freeze_time
+
+from delogger import DeloggerQueue
+from delogger.filters.dedup import DedupFilter
+from delogger.handlers.shutdown import drain_all
+from delogger.loggers.base import DeloggerBase
+from tests.lib.base import DeloggerTestBase
+from tests.lib.records import ListHandler
+
+
+def _setup(name, window=10.0):
+    hdlr = ListHandler()
+    delogger = DeloggerBase(name)
+    delogger.add_handler(hdlr, logging.DEBUG, dedup_window=window)
+
+    return delogger.get_logger(), hdlr
+
+
+class TestDedupFilter(DeloggerTestBase):
+    def test_dedup(self):
+        with freeze_time("2020-01-01") as frozen:
+            logger, hdlr = _setup("test_dedup")
+
+            for _ in range(5):
+                logger.info("same %d", 1)
+            logger.info("same %d", 2)
+            logger.warning("same %d", 1)
+
+            assert hdlr.messages == ["same 1", "same 2", "same 1"]
+
+            frozen.tick(11)
+            logger.info("same %d", 1)
+
+        assert hdlr.messages[3:] == ["same 1 (repeated 4 times)", "same 1"]
+
+    def test_dedup_sweep(self):
+        with freeze_time("2020-01-01") as frozen:
+            logger, hdlr = _setup("test_dedup_sweep")
+
+            for _ in range(3):
+                logger.info("storm")
+            frozen.tick(11)
+            logger.info("other")
+
+        assert hdlr.messages == ["storm", "storm (repeated 2 times)", "other"]
+
+    def test_dedup_flush_and_unhashable(self):
+        hdlr = ListHandler()
+        flt = DedupFilter(hdlr, window=60, max_entries=1)
+        hdlr.addFilter(flt)
+
+        for _ in range(3):
+            hdlr.handle(logging.makeLogRecord({"msg": "%s", "args": ([1],)}))
+        flt.flush()
+
+        assert hdlr.messages == ["[1]", "[1] (repeated 2 times)"]
+        assert flt.suppressed == 2
+
+    def test_dedup_arg_types(self):
+        logger, hdlr = _setup("test_dedup_arg_types")
+
+        for value in (1, 1.0, True, 1):
+            logger.info("value %s", value)
+
+        assert hdlr.messages == ["value 1", "value 1.0", "value True"]
+
+    def test_dedup_max_entries(self):
+        hdlr = ListHandler()
+        hdlr.addFilter(DedupFilter(hdlr, window=60, max_entries=1))
+
+        for msg in ("a", "a", "b"):
+            hdlr.handle(logging.makeLogRecord({"msg": msg}))
+
+        assert hdlr.messages == ["a", "a (repeated 1 times)", "b"]
+
+    def test_dedup_drain(self):
+        for name in ("drain", "drain_all"):
+            hdlr = ListHandler()
+            delogger = DeloggerQueue(
+                f"test_dedup_{name}", drain_on_exit=name == "drain_all"
+            )
+            delogger.add_handler(hdlr, logging.DEBUG, dedup_window=60)
+            logger = delogger.get_logger()
+
+            for _ in range(3):
+                logger.info("same")
+            if name == "drain":
+                delogger.drain(5)
+            else:
+                drain_all(5)
+
+            assert hdlr.messages == ["same", "same (repeated 2 times)"]
@@ -0,0 +1,136 @@
+import logging
+import time
+
+from freezegun import freeze_time
+
+from delogger import DeloggerQueue
+from delogger.filters.rate_limit import RateLimitFilter
+from delogger.handlers.shutdown import drain_all
+from delogger.loggers.base import DeloggerBase
+from tests.lib.base import DeloggerTestBase
+from tests.lib.records import ListHandler
+
+
+def _setup(name, flt):
+    hdlr = ListHandler()
+    delogger = DeloggerBase(name)
+    delogger.add_handler(hdlr, logging.DEBUG)
+    delogger.add_filter(flt)
+
+    return delogger.get_logger(), hdlr
+
+
+class TestRateLimitFilter(DeloggerTestBase):
+    def test_rate_limit(self):
+        flt = RateLimitFilter(rate=2, rates={logging.ERROR: 5})
+        logger, hdlr = _setup("test_rate_limit", flt)
+
+        for i in range(10):
+            logger.info("info %d", i)
+            logger.error("error %d", i)
+
+        assert hdlr.messages.count("info 0") == 1
+        assert len([m for m in hdlr.messages if m.startswith("info")]) == 2
+        assert len([m for m in hdlr.messages if m.startswith("error")]) == 5
+        assert flt.suppressed == 13
+
+    def test_rate_limit_sites(self):
+        flt = RateLimitFilter(rate=1)
+        logger, hdlr = _setup("test_rate_limit_sites", flt)
+
+        for _ in range(3):
+            logger.info("a")
+        for _ in range(3):
+            logger.info("b")
+
+        assert hdlr.messages == ["a", "b"]
+
+    def test_rate_limit_refill(self):
+        with freeze_time("2020-01-01") as frozen:
+            flt = RateLimitFilter(rate=1)
+            logger, hdlr = _setup("test_rate_limit_refill", flt)
+
+            for _ in range(3):
+                logger.info("a")
+                frozen.tick(0.5)
+
+        assert hdlr.messages == ["a", "a"]
+
+    def test_rate_limit_summary(self):
+        flt = RateLimitFilter(rate=1, summary_interval=3600)
+        logger, hdlr = _setup("test_rate_limit_summary", flt)
+
+        for _ in range(4):
+            logger.warning("w")
+        flt.flush()
+        flt.flush()
+
+        record = hdlr.records[0]
+        assert hdlr.messages == [
+            "w",
+            f"suppressed 3 records from {record.pathname}:{record.lineno}",
+        ]
+        assert hdlr.records[1].levelno == logging.WARNING
+
+    def test_rate_limit_max_sites(self):
+        flt = RateLimitFilter(rate=1, max_sites=2, summary_interval=3600)
+        logger, hdlr = _setup("test_rate_limit_max_sites", flt)
+
+        for _ in range(2):
+            logger.info("a")
+        logger.info("b")
+        logger.info("c")
+
+        assert len(flt._sites) == 2
+        assert hdlr.messages[:2] == ["a", "b"]
+        assert hdlr.messages[2].startswith("suppressed 1 records from ")
+        assert hdlr.messages[3] == "c"
+
+    def test_rate_limit_summary_timer(self):
+        flt = RateLimitFilter(rate=1, summary_interval=0.1)
+        logger, hdlr = _setup("test_rate_limit_summary_timer", flt)
+
+        for _ in range(3):
+            logger.info("a")
+
+        # No record comes after the interval, and the timer logs the summary.
+        for _ in range(50):
+            if len(hdlr.messages) == 2:
+                break
+            time.sleep(0.05)
+        assert hdlr.messages[0] == "a"
+        assert hdlr.messages[1].startswith("suppressed 2 records from ")
+        assert flt._timer is None
+
+    def test_rate_limit_summary_close(self):
+        flt = RateLimitFilter(rate=1, summary_interval=3600)
+        logger, hdlr = _setup("test_rate_limit_summary_close", flt)
+
+        for _ in range(2):
+            logger.info("a")
+        assert flt._timer is not None
+        flt.close()
+
+        assert flt._timer is None
+        assert hdlr.messages[1].startswith("suppressed 1 records from ")
+
+    def test_rate_limit_summary_drain(self):
+        for name in ("drain", "drain_all"):
+            flt = RateLimitFilter(rate=1, summary_interval=3600)
+            hdlr = ListHandler()
+            delogger = DeloggerQueue(
+                f"test_rate_limit_summary_{name}", drain_on_exit=name == "drain_all"
+            )
+            delogger.add_handler(hdlr, logging.DEBUG)
+            delogger.add_filter(flt)
+            logger = delogger.get_logger()
+
+            for _ in range(2):
+                logger.info("a")
+            if name == "drain":
+                delogger.drain(5)
+            else:
+                drain_all(5)
+
+            assert hdlr.messages[0] == "a"
+            assert hdlr.messages[1].startswith("suppressed 1 records from ")
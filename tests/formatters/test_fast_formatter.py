@@ -0,0 +1,69 @@
+import logging
+import sys
+
+from freezegun import freeze_time
+import pytest
+
+from delogger.formatters.fast_formatter import FastFormatter
+from delogger.modes.file import FileModeBase
+from delogger.modes.stream import StreamDebugMode
+from tests.lib.base import DeloggerTestBase
+from tests.lib.records import make_record
+
+FMTS = [
+    (FileModeBase.fmt, FileModeBase.datefmt),
+    (StreamDebugMode.fmt, None),
+    ("%(asctime)s %(message)s", None),
+    ("%(levelno)5d %(msecs)08.3f %(relativeCreated)d 100%% %(user)r", None),
+    ("%(message)s", None),
+]
+
+
+class TestFastFormatter(DeloggerTestBase):
+    @pytest.mark.parametrize("fmt,datefmt", FMTS)
+    def test_same_as_formatter(self, fmt, datefmt):
+        fast = FastFormatter(fmt, datefmt)
+        std = logging.Formatter(fmt, datefmt)
+        assert fast._render is not None
+
+        try:
+            raise ValueError("error")
+        except ValueError:
+            exc_info = sys.exc_info()
+
+        records = [
+            make_record("msg %s", args=("x",), user="u"),
+            make_record("msg %s", args=("x",), user="u", exc_info=exc_info),
+            make_record(
+                "msg %s",
+                args=("x",),
+                user="u",
+                stack_info="Stack (most recent call last):\n  line",
+            ),
+        ]
+        for record in records:
+            assert fast.format(record) == std.format(record)
+            record.exc_text = None
+
+    def test_time_cache(self):
+        fast = FastFormatter("%(asctime)s")
+        std = logging.Formatter("%(asctime)s")
+
+        with freeze_time("2020-01-01 00:00:00.100") as frozen:
+            for _ in range(3):
+                record = make_record("msg %s", args=("x",), user="u")
+                assert fast.format(record) == std.format(record)
+                frozen.tick(0.45)
+
+        assert fast._time_cache[0] == int(record.created)
+        assert fast.formatTime(record, "%Y") == "2020"
+
+    def test_fallback(self):
+        assert FastFormatter("%(message)s %s")._render is None
+        assert FastFormatter("{message}", style="{")._render is None
+
+        record = make_record("msg %s", args=("x",), user="u")
+        assert FastFormatter("{message}", style="{").format(record) == "msg x"
+
+        with pytest.raises(ValueError):
+            FastFormatter("%(unknown)s").format(record)
@@ -0,0 +1,75 @@
+import json
+import logging
+import re
+import sys
+
+import pytest
+
+from delogger.formatters import json_formatter
+from delogger.formatters.json_formatter import JsonFormatter
+from tests.lib.base import DeloggerTestBase
+from tests.lib.records import make_record
+
+
+class TestJsonFormatter(DeloggerTestBase):
+    @pytest.mark.parametrize("backend", ["json", "orjson"])
+    def test_json_formatter(self, backend):
+        if backend == "orjson" and not json_formatter._can_orjson:
+            pytest.skip("orjson is not installed")
+
+        fmt = JsonFormatter(backend=backend, datefmt="%Y")
+        record = make_record(
+            "msg %s", logging.INFO, args=("x",), user="u", data={"a": [1]}
+        )
+        data = json.loads(fmt.format(record))
+
+        assert list(data) == list(JsonFormatter.DEFAULT_FIELDS) + ["user", "data"]
+        assert data["message"] == "msg x"
+        assert data["levelname"] == "INFO"
+        assert data["filename"] == "file.py"
+        assert data["lineno"] == 10
+        assert data["funcName"] == "func"
+        assert len(data["asctime"]) == 4
+        assert data["data"] == {"a": [1]}
+        assert fmt.backend == backend
+
+    def test_json_formatter_asctime(self):
+        record = make_record("msg %s", args=("x",))
+        record.created = 1577880000.123
+        record.msecs = 123.0
+        data = json.loads(JsonFormatter(["asctime"]).format(record))
+
+        assert re.fullmatch(r"\d{4}-\d\d-\d\d \d\d:\d\d:\d\d\.123", data["asctime"])
+
+    def test_json_formatter_fields(self):
+        fmt = JsonFormatter(
+            ["created", "message", "unknown"], extra=False, rename={"message": "msg"}
+        )
+        data = json.loads(
+            fmt.format(make_record("msg %s", args=("x",), user="u", obj=object()))
+        )
+
+        assert list(data) == ["created", "msg", "unknown"]
+        assert data["unknown"] is None
+
+        with pytest.raises(ValueError):
+            JsonFormatter(["bad field"])
+
+        with pytest.raises(ValueError):
+            JsonFormatter(backend="unknown")
+
+    def test_json_formatter_exception(self):
+        fmt = JsonFormatter(["message"], backend="json")
+        try:
+            raise ValueError("error")
+        except ValueError:
+            record = make_record("msg %s", args=("x",))
+            record.exc_info = sys.exc_info()
+
+        data = json.loads(fmt.format(record))
+
+        assert "ValueError: error" in data["exc_info"]
+        assert record.exc_text == data["exc_info"]
+
+        data = json.loads(fmt.format(make_record("msg %s", args=("x",), obj=object())))
+        assert data["obj"].startswith("<object object")
@@ -0,0 +1,118 @@
+import asyncio
+import json
+from pathlib import Path
+from shutil import rmtree
+
+import pytest
+
+from delogger.handlers.async_handler import AsyncExecutorHandler
+from delogger.handlers.async_handler import AsyncHandlerBase
+from delogger.handlers.async_handler import handle_batch_async
+from delogger.handlers.async_slack import AsyncSlackHandler
+from delogger.handlers.count_rotating_file import CountRotatingFileHandler
+from delogger.util.aio import run
+from tests.lib.base import DeloggerTestBase
+from tests.lib.records import make_record
+
+
+class _AsyncHandler(AsyncHandlerBase):
+    def __init__(self):
+        super().__init__()
+
+        self.records = []
+
+    async def emit_async(self, record):
+        self.records.append(record)
+
+
+async def _serve(requests, status=200):
+    async def handle(reader, writer):
+        head = await reader.readuntil(b"\r\n\r\n")
+        length = 0
+        for line in head.decode().split("\r\n"):
+            if line.lower().startswith("content-length:"):
+                length = int(line.split(":")[1])
+        body = await reader.readexactly(length)
+        requests.append((head.decode(), json.loads(body)))
+
+        writer.write(f"HTTP/1.1 {status} OK\r\nContent-Length: 0\r\n\r\n".encode())
+        await writer.drain()
+        writer.close()
+
+    return await asyncio.start_server(handle, "127.0.0.1", 0)
+
+
+class TestAsyncHandler(DeloggerTestBase):
+    def teardown_method(self):
+        if Path(self.OUTPUT_DIRPATH).is_dir():
+            rmtree(self.OUTPUT_DIRPATH)
+
+    def test_async_handler_base(self):
+        hdlr = _AsyncHandler()
+        hdlr.addFilter(lambda r: r.msg != "skip")
+
+        run(handle_batch_async(hdlr, [make_record("a"), make_record("skip")]))
+        hdlr.emit(make_record("sync"))
+
+        assert [r.msg for r in hdlr.records] == ["a", "sync"]
+
+    def test_async_handler_base_abstract(self):
+        class _NoEmit(AsyncHandlerBase):
+            pass
+
+        with pytest.raises(TypeError):
+            _NoEmit()
+
+    def test_async_executor_handler(self):
+        filepath = f"{self.OUTPUT_DIRPATH}/async.log"
+        hdlr = AsyncExecutorHandler(CountRotatingFileHandler(filepath))
+
+        async def main():
+            await hdlr.emit_batch_async([make_record("a"), make_record("b")])
+            await hdlr.emit_async(make_record("c"))
+            await hdlr.aclose()
+
+        run(main())
+
+        assert Path(filepath).read_text() == "a\nb\nc\n"
+
+    def test_async_slack_handler(self):
+        requests = []
+
+        async def main():
+            server = await _serve(requests)
+            port = server.sockets[0].getsockname()[1]
+            hdlr = AsyncSlackHandler(url=f"http://127.0.0.1:{port}/hook?a=1")
+
+            await hdlr.emit_async(make_record("one"))
+            await hdlr.emit_batch_async([make_record("two"), make_record("three")])
+
+            server.close()
+            await server.wait_closed()
+
+        run(main())
+
+        assert len(requests) == 2
+        assert requests[0][0].startswith("POST /hook?a=1 HTTP/1.1")
+        assert requests[0][1]["text"] == "one"
+        assert requests[1][1]["text"] == "two\nthree"
+
+    def test_async_slack_handler_error(self):
+        requests = []
+        errors = []
+
+        async def main():
+            server = await _serve(requests, status=500)
+            port = server.sockets[0].getsockname()[1]
+            hdlr = AsyncSlackHandler(url=f"http://127.0.0.1:{port}")
+            hdlr.handleError = errors.append
+
+            await hdlr.emit_async(make_record("one"))
+
+            server.close()
+            await server.wait_closed()
+
+        run(main())
+
+        assert len(requests) == 1
+        assert len(errors) == 1
@@ -0,0 +1,83 @@
+import logging
+from queue import Queue
+
+from delogger.handlers.backpressure import BlockPolicy
+from delogger.handlers.backpressure import DropBelowLevelPolicy
+from delogger.handlers.backpressure import DropNewestPolicy
+from delogger.handlers.backpressure import DropOldestPolicy
+from delogger.handlers.queue_listener import FlushBarrier
+from tests.lib.records import make_record
+
+
+class TestBackpressurePolicy:
+    def test_block_timeout(self):
+        que = Queue(1)
+        policy = BlockPolicy(timeout=0.01)
+
+        assert policy.put(que, make_record("first")) is True
+        assert policy.put(que, make_record("second")) is False
+
+        assert policy.dropped == 1
+        assert policy.counters() == {"dropped": 1, f"dropped_{logging.DEBUG}": 1}
+
+    def test_drop_newest(self):
+        que = Queue(2)
+        policy = DropNewestPolicy()
+
+        for i in range(5):
+            policy.put(que, make_record(str(i)))
+
+        assert [que.get_nowait().msg for _ in range(2)] == ["0", "1"]
+        assert policy.dropped == 3
+
+    def test_drop_oldest(self):
+        que = Queue(2)
+        policy = DropOldestPolicy()
+
+        for i in range(5):
+            assert policy.put(que, make_record(str(i))) is True
+
+        assert [que.get_nowait().msg for _ in range(2)] == ["3", "4"]
+        assert policy.dropped == 3
+
+    def test_drop_below_level(self):
+        que = Queue(1)
+        policy = DropBelowLevelPolicy(logging.WARNING, timeout=0.01)
+
+        policy.put(que, make_record("info", logging.INFO))
+        assert policy.put(que, make_record("debug")) is False
+        assert policy.put(que, make_record("error", logging.ERROR)) is False
+
+        assert policy.dropped == 2
+        assert policy.dropped_levels[logging.DEBUG] == 1
+        assert policy.dropped_levels[logging.ERROR] == 1
+
+        policy.reset()
+        assert policy.counters() == {"dropped": 0}
+
+    def test_drop_oldest_keeps_control_items(self):
+        que = Queue(2)
+        policy = DropOldestPolicy()
+        barrier = object()
+
+        que.put(barrier)
+        policy.put(que, make_record("0"))
+        policy.put(que, make_record("1"))
+
+        assert que.get_nowait() is barrier
+        assert que.get_nowait().msg == "1"
+        assert policy.dropped == 1
+
+    def test_drop_oldest_full_of_control_items(self):
+        que = Queue(1)
+        policy = DropOldestPolicy()
+        barrier = FlushBarrier()
+
+        que.put(barrier)
+        # No record can be evicted, so the incoming record is dropped.
+        assert policy.put(que, make_record("0", logging.INFO)) is False
+
+        assert que.get_nowait() is barrier
+        assert que.empty()
+        assert policy.dropped == 1
+        assert policy.dropped_levels[logging.INFO] == 1
@@ -0,0 +1,85 @@
+import logging
+from pathlib import Path
+import shutil
+import sys
+
+from delogger.handlers.binary_file import BinaryFileHandler
+from delogger.handlers.binary_file import iter_binary_file
+from delogger.modes.file import FileModeBase
+from tests.lib.base import DeloggerTestBase
+from tests.lib.records import make_record
+
+
+class TestBinaryFileHandler(DeloggerTestBase):
+    def teardown_method(self):
+        if Path(self.OUTPUT_DIRPATH).is_dir():
+            shutil.rmtree(self.OUTPUT_DIRPATH)
+
+    def _handler(self):
+        hdlr = BinaryFileHandler(f"{self.OUTPUT_DIRPATH}/test.dlb", backup_count=0)
+        hdlr.setFormatter(self._formatter())
+
+        return hdlr
+
+    def _formatter(self):
+        return logging.Formatter(FileModeBase.fmt, FileModeBase.datefmt)
+
+    def test_round_trip(self):
+        try:
+            raise ValueError("error")
+        except ValueError:
+            exc_info = sys.exc_info()
+
+        records = [
+            make_record("str %s int %d big %d float %.3f %r %s %s"),
+            make_record("100%%"),
+            make_record("%(a)s", args=({"a": 1},)),
+            make_record("object %s", args=(object,)),
+            make_record(ValueError("not str")),
+            make_record("exc", exc_info=exc_info),
+            make_record("stack", stack_info="Stack (most recent call last):\n  line"),
+        ]
+        records[0].args = ("日本", 1, 2**40, 1.5, "repr", None, True)
+        records.append(make_record(records[0].msg, args=records[0].args))
+
+        hdlr = self._handler()
+        for record in records[:4]:
+            hdlr.handle(record)
+        hdlr.emit_batch(records[4:])
+        hdlr.close()
+
+        formatter = self._formatter()
+        expected = [formatter.format(record) for record in records]
+        decoded = [formatter.format(r) for r in iter_binary_file(hdlr.filepath)]
+
+        assert decoded == expected
+
+    def test_template_once(self):
+        hdlr = self._handler()
+        hdlr.handle(make_record("user %s", args=("a",)))
+        size = Path(hdlr.filepath).stat().st_size
+        hdlr.handle(make_record("user %s", args=("b",)))
+        hdlr.handle(make_record("user %s", args=("c",)))
+        hdlr.close()
+
+        record_size = (Path(hdlr.filepath).stat().st_size - size) / 2
+        assert record_size < 20
+
+    def test_reopen_and_truncated(self):
+        hdlr = self._handler()
+        hdlr.handle(make_record("first"))
+        hdlr.close()
+
+        hdlr = self._handler()
+        hdlr.handle(make_record("second %d", args=(2,)))
+        hdlr.close()
+
+        records = list(iter_binary_file(hdlr.filepath))
+        assert [r.getMessage() for r in records] == ["first", "second 2"]
+
+        # A record cut off by a crash is skipped.
+        data = Path(hdlr.filepath).read_bytes()
+        Path(hdlr.filepath).write_bytes(data[:-3])
+
+        records = list(iter_binary_file(hdlr.filepath))
+        assert [r.getMessage() for r in records] == ["first"]
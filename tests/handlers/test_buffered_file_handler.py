@@ -0,0 +1,71 @@
+import logging
+from pathlib import Path
+import shutil
+import time
+
+from delogger.handlers.buffered_file import BufferedFileHandler
+from tests.lib.base import DeloggerTestBase
+from tests.lib.records import make_record
+
+
+class TestBufferedFileHandler(DeloggerTestBase):
+    def teardown_method(self):
+        if Path(self.OUTPUT_DIRPATH).is_dir():
+            shutil.rmtree(self.OUTPUT_DIRPATH)
+
+    def _handler(self, name, **kwargs):
+        hdlr = BufferedFileHandler(f"{self.OUTPUT_DIRPATH}/{name}.log", **kwargs)
+        hdlr.setFormatter(logging.Formatter("%(message)s"))
+
+        return hdlr
+
+    def _lines(self, hdlr):
+        return Path(hdlr.filepath).read_text().splitlines()
+
+    def test_buffer_size(self):
+        hdlr = self._handler("size", buffer_size=10, flush_interval_ms=0)
+
+        hdlr.handle(make_record("1234"))
+        assert self._lines(hdlr) == []
+
+        hdlr.handle(make_record("56789"))
+        assert self._lines(hdlr) == ["1234", "56789"]
+        assert hdlr.writes == 1
+
+        hdlr.close()
+
+    def test_flush_level(self):
+        hdlr = self._handler("level", flush_interval_ms=0)
+
+        hdlr.handle(make_record("info"))
+        assert self._lines(hdlr) == []
+
+        error = make_record("error", logging.ERROR)
+        hdlr.emit_batch([make_record("debug"), error])
+        assert self._lines(hdlr) == ["info", "debug", "error"]
+
+        hdlr.close()
+
+    def test_flush_interval(self):
+        hdlr = self._handler("interval", flush_interval_ms=50)
+
+        hdlr.handle(make_record("quiet"))
+        assert self._lines(hdlr) == []
+
+        for _ in range(100):
+            if self._lines(hdlr):
+                break
+            time.sleep(0.01)
+        assert self._lines(hdlr) == ["quiet"]
+
+        hdlr.close()
+        hdlr._timer.join(1)
+        assert not hdlr._timer.is_alive()
+
+    def test_close(self):
+        hdlr = self._handler("close", flush_interval_ms=0)
+
+        hdlr.handle(make_record("last"))
+        hdlr.close()
+
+        assert self._lines(hdlr) == ["last"]
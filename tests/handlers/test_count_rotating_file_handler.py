@@ -9,7 +9,7 @@ from tests.lib.base import DeloggerTestBase
 
 class TestCountRotatingHandler(DeloggerTestBase):
     def setup_class(self):
-        CountRotatingFileHandler._files = []
+        CountRotatingFileHandler._files = {}
         self.today = datetime.datetime.today()
         self.logpath_set = set()
 
@@ -93,3 +93,82 @@ class TestCountRotatingHandler(DeloggerTestBase):
 
             logger.debug("log file test")
             self.assert_normal(logpath, i + 1)
+
+
+class TestCountRotatingMaxBytes(DeloggerTestBase):
+    def setup_method(self):
+        CountRotatingFileHandler._files = {}
+
+    def teardown_method(self):
+        if Path(self.OUTPUT_DIRPATH).is_dir():
+            shutil.rmtree(self.OUTPUT_DIRPATH)
+
+    def _handler(self, **kwargs):
+        hdlr = CountRotatingFileHandler(
+            f"{self.OUTPUT_DIRPATH}/%Y%m%d_%H%M%S.log", **kwargs
+        )
+        hdlr.setFormatter(logging.Formatter("%(message)s"))
+
+        return hdlr
+
+    def _files(self):
+        return sorted(Path(self.OUTPUT_DIRPATH).iterdir())
+
+    def test_max_bytes(self):
+        hdlr = self._handler(backup_count=0, max_bytes=20)
+
+        # 10 bytes each
+        for i in range(5):
+            hdlr.handle(logging.makeLogRecord({"msg": f"record {i}:", "levelno": 20}))
+        hdlr.emit_batch(
+            [
+                logging.makeLogRecord({"msg": f"batch  {i}:", "levelno": 20})
+                for i in range(3)
+            ]
+        )
+        hdlr.close()
+
+        contents = [path.read_text() for path in self._files()]
+        assert contents == [
+            "record 0:\nrecord 1:\n",
+            "record 2:\nrecord 3:\n",
+            "record 4:\nbatch  0:\n",
+            "batch  1:\nbatch  2:\n",
+        ]
+        assert Path(hdlr.filepath) == self._files()[-1]
+
+    def test_max_bytes_backup_count(self):
+        hdlr = self._handler(backup_count=2, max_bytes=10)
+
+        for i in range(5):
+            hdlr.handle(logging.makeLogRecord({"msg": f"record {i}:", "levelno": 20}))
+        hdlr.close()
+
+        contents = [path.read_text() for path in self._files()]
+        assert contents == ["record 3:\n", "record 4:\n"]
+
+    def test_max_bytes_non_ascii(self):
+        hdlr = self._handler(backup_count=0, max_bytes=20)
+        msg = "\u00e9" * 5
+        size = hdlr.stream.measure(msg + "\n")
+
+        for _ in range(4):
+            hdlr.handle(logging.makeLogRecord({"msg": msg, "levelno": 20}))
+        hdlr.close()
+
+        sizes = [path.stat().st_size for path in self._files()]
+        assert sum(sizes) == size * 4
+        assert all(s <= 20 for s in sizes)
+
+    def test_max_bytes_existing(self):
+        hdlr = self._handler(backup_count=0, max_bytes=20)
+        hdlr.handle(logging.makeLogRecord({"msg": "record 0:", "levelno": 20}))
+        hdlr.close()
+
+        # The size of an existing file is counted.
+        CountRotatingFileHandler._files = {}
+        hdlr = self._handler(backup_count=0, max_bytes=15)
+        hdlr.handle(logging.makeLogRecord({"msg": "record 1:", "levelno": 20}))
+        hdlr.close()
+
+        assert len(self._files()) == 2
@@ -0,0 +1,129 @@
+import logging
+import os
+from pathlib import Path
+import shutil
+import threading
+
+from delogger.handlers.binary_file import BinaryFileHandler
+from delogger.handlers.binary_file import MAGIC
+from delogger.handlers.binary_file import iter_binary_file
+from delogger.handlers.count_rotating_file import CountRotatingFileHandler
+from delogger.handlers.file_writer import open_shared
+from tests.lib.base import DeloggerTestBase
+from tests.lib.records import make_record
+
+
+class TestSharedFileWriter(DeloggerTestBase):
+    def setup_method(self):
+        CountRotatingFileHandler._files = {}
+        Path(self.OUTPUT_DIRPATH).mkdir(parents=True, exist_ok=True)
+
+    def teardown_method(self):
+        if Path(self.OUTPUT_DIRPATH).is_dir():
+            shutil.rmtree(self.OUTPUT_DIRPATH)
+
+    def test_open_shared(self):
+        path = f"{self.OUTPUT_DIRPATH}/shared.log"
+        writer = open_shared(path)
+        # a different path to the same file
+        other = open_shared(
+            f"{self.OUTPUT_DIRPATH}/../{self.OUTPUT_DIRPATH}/shared.log"
+        )
+
+        assert writer is other
+        assert writer.refs == 2
+
+        writer.track_size()
+        writer.write("first\n")
+        writer.close()
+        assert not writer.closed
+
+        other.write("second\n")
+        other.close()
+        assert writer.closed
+        assert writer.size == 13
+        assert Path(path).read_text() == "first\nsecond\n"
+
+        # a new writer after the last close
+        writer = open_shared(path)
+        assert writer is not other
+        assert writer.size == 13
+        writer.close()
+
+    def test_size_encoding(self):
+        path = f"{self.OUTPUT_DIRPATH}/encoding.log"
+        writer = open_shared(path, encoding="latin-1")
+        writer.write("\u00e9\n")
+        # The size is only tracked on demand.
+        assert writer.size == 0
+
+        writer.track_size()
+        assert writer.size == 2
+        writer.write("\u00e9\u00e9\n")
+        writer.close()
+
+        assert writer.size == 5
+        assert Path(path).stat().st_size == 5
+
+    def test_replaced_file(self):
+        path = f"{self.OUTPUT_DIRPATH}/replaced.log"
+        writer = open_shared(path)
+        os.remove(path)
+
+        other = open_shared(path)
+        assert other is not writer
+
+        other.write("new\n")
+        other.close()
+        writer.close()
+        assert Path(path).read_text() == "new\n"
+
+    def test_handlers_share_writer(self):
+        path = f"{self.OUTPUT_DIRPATH}/%Y%m%d_%H%M%S.log"
+        hdlr1 = CountRotatingFileHandler(path)
+        hdlr2 = CountRotatingFileHandler(path)
+        for hdlr in (hdlr1, hdlr2):
+            hdlr.setFormatter(logging.Formatter("%(message)s"))
+
+        assert hdlr1.stream is hdlr2.stream
+
+        def write(hdlr, name):
+            for i in range(500):
+                hdlr.handle(make_record(f"{name} {i}"))
+
+        threads = [
+            threading.Thread(target=write, args=(hdlr, name))
+            for hdlr, name in ((hdlr1, "a"), (hdlr2, "b"))
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        hdlr1.close()
+        hdlr2.close()
+
+        lines = Path(hdlr1.filepath).read_text().splitlines()
+        assert len(lines) == 1000
+        for name in ("a", "b"):
+            assert [line for line in lines if line[0] == name] == [
+                f"{name} {i}" for i in range(500)
+            ]
+
+    def test_binary_shared(self):
+        path = f"{self.OUTPUT_DIRPATH}/%Y%m%d_%H%M%S.dlb"
+        hdlr1 = BinaryFileHandler(path)
+        hdlr2 = BinaryFileHandler(path)
+
+        assert hdlr1.stream is hdlr2.stream
+
+        hdlr1.handle(make_record("alpha %d", args=(1,)))
+        hdlr2.handle(make_record("beta %d", args=(2,)))
+        hdlr1.handle(make_record("alpha %d", args=(3,)))
+
+        hdlr1.close()
+        hdlr2.close()
+
+        messages = [r.getMessage() for r in iter_binary_file(hdlr1.filepath)]
+        assert messages == ["alpha 1", "beta 2", "alpha 3"]
+        assert Path(hdlr1.filepath).read_bytes().count(MAGIC) == 1
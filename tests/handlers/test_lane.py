@@ -0,0 +1,136 @@
+import logging
+from queue import Queue
+import threading
+
+import pytest
+
+from delogger import DeloggerQueue
+from delogger.handlers.backpressure import DropNewestPolicy
+from delogger.handlers.lane import Lane
+from delogger.handlers.queue_listener import DeloggerQueueListener
+from delogger.handlers.queue_listener import FlushBarrier
+from tests.lib.base import DeloggerTestBase
+from tests.lib.records import ListHandler
+from tests.lib.records import make_record
+
+
+class _SlowHandler(ListHandler):
+    def __init__(self, level=logging.NOTSET):
+        super().__init__(level)
+
+        self.release_event = threading.Event()
+
+    def emit(self, record):
+        self.release_event.wait(5)
+        super().emit(record)
+
+
+class TestLane(DeloggerTestBase):
+    def test_lane_does_not_block(self):
+        fast = ListHandler()
+        slow = _SlowHandler()
+        lane = Lane(_SlowHandler, maxsize=2)
+        rest = lane.take([fast, slow])
+
+        listener = DeloggerQueueListener(Queue(), *rest, lanes=[lane])
+        listener.start()
+
+        for i in range(10):
+            listener.queue.put(make_record(str(i)))
+
+        barrier = FlushBarrier()
+        listener.queue.put(barrier)
+
+        # The main handlers are done while the lane is still stuck.
+        for _ in range(500):
+            if len(fast.records) == 10:
+                break
+            threading.Event().wait(0.01)
+        assert len(fast.records) == 10
+        assert barrier.wait(0.05) is False
+
+        slow.release_event.set()
+        assert barrier.wait(5) is True
+        listener.stop()
+
+        assert rest == [fast]
+        assert lane.handlers == [slow]
+        assert 1 <= len(slow.records) < 10
+        assert lane.policy.counters()["dropped"] == 10 - len(slow.records)
+
+    def test_barrier_full_lane(self):
+        fast = ListHandler()
+        slow = _SlowHandler()
+        lane = Lane(_SlowHandler, maxsize=1, barrier_timeout=0.05)
+        rest = lane.take([fast, slow])
+
+        listener = DeloggerQueueListener(Queue(), *rest, lanes=[lane])
+        listener.start()
+
+        def wait_for(predicate):
+            for _ in range(500):
+                if predicate():
+                    return
+                threading.Event().wait(0.01)
+
+        # "0" is stuck in the slow handler and "1" fills the lane.
+        listener.queue.put(make_record("0"))
+        wait_for(lambda: len(fast.records) == 1 and lane.queue.empty())
+        listener.queue.put(make_record("1"))
+        wait_for(lambda: lane.queue.full())
+
+        barrier = FlushBarrier()
+        listener.queue.put(barrier)
+        listener.queue.put(make_record("after"))
+
+        # The main listener goes on after the barrier timeout of the lane.
+        assert barrier.wait(1) is False
+        assert barrier.missed == [lane]
+        wait_for(lambda: len(fast.records) == 3)
+        assert [r.msg for r in fast.records] == ["0", "1", "after"]
+
+        slow.release_event.set()
+        listener.stop()
+
+    def test_lane_level(self):
+        hdlr = ListHandler(logging.WARNING)
+        lane = Lane(lambda h: h is hdlr)
+        lane.take([hdlr])
+        lane.put_batch([make_record("debug"), make_record("warning", logging.WARNING)])
+
+        assert lane.queue.qsize() == 1
+
+        with pytest.raises(RuntimeError):
+            lane.take([hdlr])
+
+    def test_flush_barrier_count(self):
+        barrier = FlushBarrier()
+        barrier.add()
+        barrier.done()
+
+        assert barrier.wait(0) is False
+
+        barrier.done()
+        assert barrier.wait(0) is True
+
+    def test_delogger_queue_lanes(self):
+        fast = ListHandler()
+        slow = _SlowHandler()
+        slow.release_event.set()
+        policy = DropNewestPolicy()
+
+        delogger = DeloggerQueue(
+            "test_delogger_queue_lanes",
+            lanes=[Lane(_SlowHandler, maxsize=100, policy=policy)],
+        )
+        delogger.add_handler(fast, logging.DEBUG)
+        delogger.add_handler(slow, logging.INFO)
+        logger = delogger.get_logger()
+
+        logger.debug("debug")
+        logger.info("info")
+        assert delogger.join(5) is True
+
+        assert [r.msg for r in fast.records] == ["debug", "info"]
+        assert [r.msg for r in slow.records] == ["info"]
+        assert delogger._queue_hdlr.route.handlers == (fast,)
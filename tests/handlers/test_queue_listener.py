@@ -0,0 +1,154 @@
+import json
+import logging
+from pathlib import Path
+from queue import Queue
+from shutil import rmtree
+import urllib.request
+
+from delogger.handlers.count_rotating_file import CountRotatingFileHandler
+from delogger.handlers.queue_listener import DeloggerQueueListener
+from delogger.handlers.queue_listener import FlushBarrier
+from delogger.handlers.slack import SlackHandler
+from delogger.handlers.timed_rotating_file import TimedRotatingFileHandler
+from tests.lib.base import DeloggerTestBase
+from tests.lib.records import ListHandler
+from tests.lib.records import make_record
+from tests.lib.urlopen_mock import UrlopenMock
+
+
+class _BatchHandler(logging.Handler):
+    def __init__(self, level=logging.NOTSET):
+        super().__init__(level)
+
+        self.batches = []
+
+    def emit(self, record):
+        self.batches.append([record])
+
+    def emit_batch(self, records):
+        self.batches.append(list(records))
+
+
+class TestDeloggerQueueListener(DeloggerTestBase):
+    def teardown_method(self):
+        if Path(self.OUTPUT_DIRPATH).is_dir():
+            rmtree(self.OUTPUT_DIRPATH)
+
+    def test_batch(self):
+        que = Queue()
+        batch_hdlr = _BatchHandler(logging.INFO)
+        hdlr = ListHandler()
+        listener = DeloggerQueueListener(que, batch_hdlr, hdlr, max_batch=100)
+
+        for i in range(250):
+            que.put(make_record(str(i), logging.INFO if i % 2 else logging.DEBUG))
+
+        listener.start()
+        listener.stop()
+
+        assert [len(batch) for batch in batch_hdlr.batches] == [50, 50, 25]
+        assert len(hdlr.records) == 250
+        assert [r.msg for r in hdlr.records] == [str(i) for i in range(250)]
+
+    def test_batch_filter(self):
+        que = Queue()
+        batch_hdlr = _BatchHandler()
+        batch_hdlr.addFilter(lambda record: record.msg != "skip")
+        listener = DeloggerQueueListener(que, batch_hdlr)
+
+        que.put(make_record("skip"))
+        que.put(make_record("out"))
+        listener.start()
+        listener.stop()
+
+        assert [r.msg for r in batch_hdlr.batches[0]] == ["out"]
+
+    def test_wait(self):
+        que = Queue()
+        batch_hdlr = _BatchHandler()
+        listener = DeloggerQueueListener(que, batch_hdlr, max_batch=3, max_wait_ms=50)
+
+        que.put(make_record("0"))
+        que.put(make_record("1"))
+        listener.start()
+        listener.stop()
+
+        assert [len(batch) for batch in batch_hdlr.batches] == [2]
+
+    def test_count_rotating_file_emit_batch(self):
+        hdlr = CountRotatingFileHandler(f"{self.OUTPUT_DIRPATH}/batch.log")
+        hdlr.setFormatter(logging.Formatter("%(message)s"))
+
+        hdlr.emit_batch([make_record(str(i)) for i in range(10)])
+        hdlr.close()
+
+        with open(hdlr.filepath) as f:
+            assert f.read() == "".join(f"{i}\n" for i in range(10))
+
+    def test_timed_rotating_file_emit_batch(self):
+        Path(self.OUTPUT_DIRPATH).mkdir()
+        filepath = f"{self.OUTPUT_DIRPATH}/timed.log"
+        hdlr = TimedRotatingFileHandler(filepath, when="S", backupCount=1)
+        hdlr.setFormatter(logging.Formatter("%(message)s"))
+
+        hdlr.shouldRollover = lambda record: record.msg == "2"
+        hdlr.emit_batch([make_record(str(i)) for i in range(4)])
+        hdlr.close()
+
+        with open(filepath) as f:
+            assert f.read() == "2\n3\n"
+        assert len(list(Path(self.OUTPUT_DIRPATH).glob("timed.log.*"))) == 1
+
+    def test_slack_emit_batch(self):
+        urlopen_mock = UrlopenMock()
+
+        hdlr = SlackHandler(url="http://dummy.url")
+        hdlr.emit_batch(
+            [
+                make_record("debug"),
+                make_record("error", logging.ERROR),
+                make_record("info"),
+            ]
+        )
+
+        # one POST for the batch
+        assert urlopen_mock.call_count == 1
+        (request,), _ = urllib.request.urlopen.call_args
+        assert request.get_method() == "POST"
+        assert request.full_url == "http://dummy.url"
+
+        content = json.loads(request.data.decode("utf-8"))
+        assert content["text"] == "debug\nerror\ninfo"
+        assert content["icon_emoji"] == hdlr.emojis[logging.ERROR]
+        assert content["username"] == hdlr.usernames[logging.ERROR]
+
+    def test_slack_emit_batch_split(self):
+        urlopen_mock = UrlopenMock()
+
+        hdlr = SlackHandler(url="http://dummy.url")
+        text = "x" * (SlackHandler.BATCH_MAX_LENGTH // 3)
+        hdlr.emit_batch([make_record(text) for _ in range(3)])
+
+        assert urlopen_mock.call_count == 2
+        texts = [
+            json.loads(request.data.decode("utf-8"))["text"]
+            for (request,), _ in urllib.request.urlopen.call_args_list
+        ]
+        assert texts == [f"{text}\n{text}", text]
+
+    def test_flush_barrier(self):
+        que = Queue()
+        hdlr = ListHandler()
+        listener = DeloggerQueueListener(que, hdlr)
+        barrier = FlushBarrier()
+
+        que.put(make_record("0"))
+        que.put(barrier)
+        que.put(make_record("1"))
+
+        assert barrier.wait(0.01) is False
+        listener.start()
+        assert barrier.wait(5) is True
+        listener.stop()
+
+        assert [r.msg for r in hdlr.records] == ["0", "1"]
@@ -0,0 +1,44 @@
+import logging
+
+import pytest
+
+from delogger.handlers.ring_buffer import RingBufferHandler
+from tests.lib.base import DeloggerTestBase
+from tests.lib.records import ListHandler
+from tests.lib.records import make_record
+
+
+class TestRingBufferHandler(DeloggerTestBase):
+    def test_ring_buffer(self):
+        target = ListHandler()
+        hdlr = RingBufferHandler([target], capacity=3)
+
+        for i in range(5):
+            hdlr.handle(make_record(str(i)))
+        assert target.records == []
+        assert [r.msg for r in hdlr.records()] == ["2", "3", "4"]
+
+        hdlr.handle(make_record("error", logging.ERROR))
+        assert [r.msg for r in target.records] == ["2", "3", "4", "error"]
+        assert hdlr.records() == []
+        assert hdlr.dumps == 1
+
+        hdlr.handle(make_record("5"))
+        hdlr.handle(make_record("critical", logging.CRITICAL))
+        assert [r.msg for r in target.records][-2:] == ["5", "critical"]
+
+    def test_target_level(self):
+        debug = ListHandler()
+        info = ListHandler(logging.INFO)
+        hdlr = RingBufferHandler([debug, info], capacity=10)
+
+        hdlr.handle(make_record("debug"))
+        hdlr.handle(make_record("info", logging.INFO))
+        hdlr.dump()
+
+        assert [r.msg for r in debug.records] == ["debug", "info"]
+        assert [r.msg for r in info.records] == ["info"]
+
+    def test_capacity(self):
+        with pytest.raises(ValueError):
+            RingBufferHandler([], capacity=0)
@@ -0,0 +1,101 @@
+from pathlib import Path
+import shutil
+
+import pytest
+
+from delogger.handlers.ring_file import FRAME
+from delogger.handlers.ring_file import HEADER
+from delogger.handlers.ring_file import RingFileHandler
+from delogger.handlers.ring_file import read_ring_file
+from tests.lib.base import DeloggerTestBase
+from tests.lib.records import make_record
+
+
+class TestRingFileHandler(DeloggerTestBase):
+    def teardown_method(self):
+        if Path(self.OUTPUT_DIRPATH).is_dir():
+            shutil.rmtree(self.OUTPUT_DIRPATH)
+
+    def _handler(self, size):
+        return RingFileHandler(f"{self.OUTPUT_DIRPATH}/test.ring", size)
+
+    def test_ring(self):
+        # room for about 10 frames of 4 bytes
+        size = HEADER.size + (FRAME.size + 4) * 10 + 5
+        hdlr = self._handler(size)
+
+        msgs = [f"{i:04d}" for i in range(25)]
+        for msg in msgs:
+            hdlr.handle(make_record(msg))
+
+        assert Path(hdlr.filepath).stat().st_size == size
+        assert hdlr.wrap == 2
+        records = read_ring_file(hdlr.filepath)
+        assert records == msgs[-len(records) :]
+        assert len(records) >= 9
+
+        hdlr.close()
+
+    def test_reopen(self):
+        size = HEADER.size + (FRAME.size + 4) * 10
+        hdlr = self._handler(size)
+        for i in range(8):
+            hdlr.handle(make_record(f"{i:04d}"))
+        hdlr.close()
+
+        hdlr = self._handler(size)
+        assert hdlr.seq == 8
+        for i in range(8, 12):
+            hdlr.handle(make_record(f"{i:04d}"))
+        hdlr.close()
+
+        assert read_ring_file(hdlr.filepath) == [f"{i:04d}" for i in range(2, 12)]
+
+    def test_torn_frame(self):
+        size = HEADER.size + (FRAME.size + 4) * 10
+        hdlr = self._handler(size)
+        for i in range(5):
+            hdlr.handle(make_record(f"{i:04d}"))
+        hdlr.close()
+
+        # A frame half written on a crash is skipped.
+        with open(hdlr.filepath, "r+b") as f:
+            f.seek(HEADER.size + (FRAME.size + 4) * 2 + FRAME.size)
+            f.write(b"xx")
+
+        assert read_ring_file(hdlr.filepath) == ["0000", "0001", "0003", "0004"]
+
+    def test_size(self):
+        with pytest.raises(ValueError):
+            self._handler(HEADER.size)
+
+    def test_same_path(self):
+        size = HEADER.size + (FRAME.size + 4) * 10
+        hdlr1 = self._handler(size)
+        hdlr2 = RingFileHandler(f"{self.OUTPUT_DIRPATH}/./test.ring", size)
+
+        # The handlers share the cursor, so no frame is overwritten.
+        for i in range(0, 6, 2):
+            hdlr1.handle(make_record(f"{i:04d}"))
+            hdlr2.handle(make_record(f"{i + 1:04d}"))
+        assert hdlr1.seq == hdlr2.seq == 6
+
+        with pytest.raises(ValueError):
+            self._handler(size * 2)
+
+        hdlr1.close()
+        hdlr2.handle(make_record("0006"))
+        hdlr2.close()
+
+        expected = [f"{i:04d}" for i in range(7)]
+        assert read_ring_file(hdlr1.filepath) == expected
+
+        # A removed file is mapped again.
+        hdlr1 = self._handler(size)
+        Path(hdlr1.filepath).unlink()
+        hdlr2 = self._handler(size)
+        hdlr2.handle(make_record("new"))
+        assert read_ring_file(hdlr2.filepath) == ["new"]
+
+        hdlr1.close()
+        hdlr2.close()
@@ -0,0 +1,188 @@
+import logging
+from pathlib import Path
+from shutil import rmtree
+import signal
+import subprocess
+import sys
+import textwrap
+import threading
+
+from delogger import DeloggerQueue
+from delogger.handlers import shutdown
+from delogger.handlers.shutdown import DrainReport
+from tests.lib.base import DeloggerTestBase
+
+SCRIPT = """
+import logging
+import os
+import signal
+import time
+
+from delogger import DeloggerQueue
+
+
+class SlowHandler(logging.FileHandler):
+    def emit(self, record):
+        time.sleep({delay})
+        super().emit(record)
+
+
+delogger = DeloggerQueue("shutdown", drain_timeout={timeout})
+delogger.add_handler(SlowHandler({filepath!r}), logging.DEBUG)
+logger = delogger.get_logger()
+for i in range(20):
+    logger.error("error %d", i)
+{end}
+"""
+
+
+APP_HANDLER_SCRIPT = """
+import logging
+import os
+import signal
+import sys
+
+from delogger import DeloggerQueue
+
+
+def on_sigterm(signum, frame):
+    logger.info("graceful shutdown")
+    sys.exit(0)
+
+
+signal.signal(signal.SIGTERM, on_sigterm)
+
+delogger = DeloggerQueue("shutdown_app", maxsize=5, drain_timeout=5)
+delogger.add_handler(logging.FileHandler({filepath!r}), logging.DEBUG)
+logger = delogger.get_logger()
+for i in range(3):
+    logger.info("info %d", i)
+os.kill(os.getpid(), signal.SIGTERM)
+"""
+
+
+def _run(filepath, delay, timeout, end):
+    script = SCRIPT.format(delay=delay, timeout=timeout, filepath=filepath, end=end)
+    return _run_script(script)
+
+
+def _run_script(script):
+    return subprocess.run(
+        [sys.executable, "-c", textwrap.dedent(script)],
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        timeout=30,
+    )
+
+
+class TestShutdown(DeloggerTestBase):
+    def teardown_method(self):
+        if Path(self.OUTPUT_DIRPATH).is_dir():
+            rmtree(self.OUTPUT_DIRPATH)
+
+    def test_drain(self):
+        event = threading.Event()
+
+        class _BlockHandler(logging.Handler):
+            def emit(self, record):
+                event.wait(5)
+
+        delogger = DeloggerQueue("test_shutdown_drain", drain_on_exit=False)
+        assert delogger.drain() == DrainReport(0, 0)
+
+        delogger.add_handler(_BlockHandler(), logging.DEBUG)
+        logger = delogger.get_logger()
+        for i in range(3):
+            logger.debug("%d", i)
+
+        report = delogger.drain(timeout=0.05)
+        assert report == DrainReport(0, 3)
+        assert delogger._queue_hdlr not in shutdown._handlers
+
+        event.set()
+        assert delogger.drain(timeout=5) == DrainReport(3, 0)
+        assert delogger.join() is False
+
+    def test_drain_all(self):
+        delogger = DeloggerQueue("test_shutdown_drain_all", drain_timeout=1)
+        records = []
+        hdlr = logging.Handler()
+        hdlr.emit = records.append
+        delogger.add_handler(hdlr, logging.DEBUG)
+        logger = delogger.get_logger()
+
+        logger.debug("debug")
+        report = shutdown.drain_all()
+
+        assert report.abandoned == 0
+        assert shutdown.last_report == report
+        assert len(records) == 1
+
+    def test_sigterm(self):
+        Path(self.OUTPUT_DIRPATH).mkdir()
+        filepath = f"{self.OUTPUT_DIRPATH}/sigterm.log"
+
+        end = "os.kill(os.getpid(), signal.SIGTERM)\ntime.sleep(10)"
+        result = _run(filepath, 0.01, 5, end)
+
+        assert result.returncode == -signal.SIGTERM
+        assert len(Path(filepath).read_text().splitlines()) == 20
+
+    def test_sigterm_app_handler(self):
+        Path(self.OUTPUT_DIRPATH).mkdir()
+        filepath = f"{self.OUTPUT_DIRPATH}/sigterm_app.log"
+
+        result = _run_script(APP_HANDLER_SCRIPT.format(filepath=filepath))
+
+        # The records logged by the handler of the app are still written.
+        assert result.returncode == 0, result.stderr
+        assert "abandoned" not in result.stderr
+        assert Path(filepath).read_text().splitlines() == [
+            "info 0",
+            "info 1",
+            "info 2",
+            "graceful shutdown",
+        ]
+
+    def test_register_signals(self):
+        previous = signal.getsignal(signal.SIGUSR1)
+        try:
+            DeloggerQueue("test_shutdown_signals_1").get_logger()
+            DeloggerQueue(
+                "test_shutdown_signals_2", drain_signals=(signal.SIGUSR1,)
+            ).get_logger()
+
+            assert signal.getsignal(signal.SIGUSR1) is shutdown._on_signal
+            assert signal.getsignal(signal.SIGTERM) is shutdown._on_signal
+        finally:
+            signal.signal(signal.SIGUSR1, previous)
+            shutdown._previous_handlers.pop(signal.SIGUSR1, None)
+
+    def test_flush_all(self):
+        delogger = DeloggerQueue("test_shutdown_flush_all", drain_timeout=1)
+        records = []
+        hdlr = logging.Handler()
+        hdlr.emit = records.append
+        delogger.add_handler(hdlr, logging.DEBUG)
+        logger = delogger.get_logger()
+
+        logger.debug("debug")
+        report = shutdown.flush_all()
+
+        assert report.abandoned == 0
+        assert len(records) == 1
+
+        # The listener keeps running.
+        logger.debug("after")
+        assert delogger.join(5) is True
+        assert len(records) == 2
+
+    def test_atexit_abandoned(self):
+        Path(self.OUTPUT_DIRPATH).mkdir()
+        filepath = f"{self.OUTPUT_DIRPATH}/atexit.log"
+
+        result = _run(filepath, 0.5, 0.2, "")
+
+        assert result.returncode == 0
+        assert "queued records abandoned at shutdown" in result.stderr
+        assert len(Path(filepath).read_text().splitlines()) < 20
@@ -0,0 +1,32 @@
+import logging
+
+
+def make_record(msg="msg", level=logging.DEBUG, args=(), **attrs):
+    """Make a record logged at /path/file.py:10 in func.
+
+    Extra keyword arguments, such as exc_info or custom fields, are set as
+    record attributes.
+
+    """
+
+    record = logging.LogRecord(
+        "name", level, "/path/file.py", 10, msg, args, None, "func"
+    )
+    record.__dict__.update(attrs)
+    return record
+
+
+class ListHandler(logging.Handler):
+    """Handler that collects the handled records."""
+
+    def __init__(self, level=logging.NOTSET):
+        super().__init__(level)
+
+        self.records = []
+
+    @property
+    def messages(self):
+        return [record.getMessage() for record in self.records]
+
+    def emit(self, record):
+        self.records.append(record)
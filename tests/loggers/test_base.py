@@ -87,3 +87,30 @@ class TestDeloggerBase(DeloggerTestBase):
             "only",
         ]
         self.check_capsys(capsys, expected_logs)
+
+    def test_auto_level(self):
+        delogger = DeloggerBase("test_auto_level")
+        logger = delogger.get_logger()
+        assert logger.level == logging.DEBUG
+
+        delogger.add_handler(logging.NullHandler(), logging.WARNING)
+        assert logger.level == logging.WARNING
+        assert logger.isEnabledFor(logging.INFO) is False
+
+        delogger.add_handler(logging.NullHandler(), logging.INFO)
+        assert logger.level == logging.INFO
+
+        # Already set up loggers keep the level of their handlers.
+        assert DeloggerBase("test_auto_level").get_logger().level == logging.INFO
+
+    def test_auto_level_notset(self):
+        delogger = DeloggerBase("test_auto_level_notset")
+        delogger.add_handler(logging.NullHandler(), logging.NOTSET)
+
+        assert delogger.get_logger().level == logging.DEBUG
+
+    def test_level_override(self):
+        delogger = DeloggerBase("test_level_override", level=logging.DEBUG)
+        delogger.add_handler(logging.NullHandler(), logging.ERROR)
+
+        assert delogger.get_logger().level == logging.DEBUG
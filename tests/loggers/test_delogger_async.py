@@ -0,0 +1,122 @@
+import asyncio
+import logging
+import threading
+
+from delogger import DeloggerAsync
+from delogger.handlers.async_handler import AsyncExecutorHandler
+from delogger.handlers.async_handler import AsyncHandlerBase
+from delogger.modes.stream import StreamDebugMode
+from delogger.util.aio import run
+from tests.lib.base import DeloggerTestBase
+
+
+class _AsyncHandler(AsyncHandlerBase):
+    def __init__(self, level=logging.NOTSET):
+        super().__init__(level)
+
+        self.batches = []
+        self.closed = False
+
+    async def emit_async(self, record):
+        await self.emit_batch_async([record])
+
+    async def emit_batch_async(self, records):
+        await asyncio.sleep(0)
+        self.batches.append([r.getMessage() for r in records])
+
+    async def aclose(self):
+        self.closed = True
+
+
+class TestDeloggerAsync(DeloggerTestBase):
+    def test_delogger_async(self, capsys):
+        delogger = DeloggerAsync("test_delogger_async", modes=[StreamDebugMode()])
+        logger = delogger.get_logger()
+
+        async def main():
+            self.execute_log(logger)
+            assert await delogger.flush(timeout=5) is True
+
+        run(main())
+
+        self.check_debug_stream_log(logger, capsys, is_color=False)
+        assert isinstance(delogger._async_hdlr.handlers[0], AsyncExecutorHandler)
+
+        delogger = DeloggerAsync("test_delogger_async")
+        assert delogger._async_hdlr is None
+        delogger.get_logger()
+        assert delogger._async_hdlr is not None
+
+    def test_delogger_async_handler(self):
+        hdlr = _AsyncHandler()
+        delogger = DeloggerAsync("test_delogger_async_handler")
+        delogger.add_handler(hdlr, logging.INFO)
+        logger = delogger.get_logger()
+
+        # Records logged outside of the loop are kept until the task starts.
+        logger.info("before")
+
+        async def main():
+            logger.debug("debug")
+            logger.info("loop")
+
+            thread = threading.Thread(target=logger.info, args=("thread",))
+            thread.start()
+            thread.join()
+            await asyncio.sleep(0)
+
+            assert await delogger.aclose(timeout=5) is True
+
+        run(main())
+
+        assert sum(hdlr.batches, []) == ["before", "loop", "thread"]
+        assert hdlr.closed is True
+
+    def test_delogger_async_not_setup(self):
+        delogger = DeloggerAsync("test_delogger_async_not_setup")
+
+        async def main():
+            assert await delogger.flush() is False
+            assert await delogger.aclose() is False
+
+        run(main())
+
+    def test_delogger_async_maxsize(self):
+        hdlr = _AsyncHandler()
+        delogger = DeloggerAsync("test_delogger_async_maxsize", maxsize=2)
+        delogger.add_handler(hdlr, logging.DEBUG)
+        logger = delogger.get_logger()
+
+        async def main():
+            for i in range(5):
+                logger.debug("%d", i)
+            assert await delogger.flush(timeout=5) is True
+
+        run(main())
+
+        assert sum(hdlr.batches, []) == ["0", "1"]
+        assert delogger._async_hdlr.dropped == 3
+
+    def test_delogger_async_pending_maxsize(self):
+        hdlr = _AsyncHandler()
+        delogger = DeloggerAsync("test_delogger_async_pending_maxsize", maxsize=2)
+        delogger.add_handler(hdlr, logging.DEBUG)
+        logger = delogger.get_logger()
+
+        # Records logged outside of the loop are kept up to maxsize.
+        for i in range(5):
+            logger.debug("%d", i)
+
+        async def main():
+            assert await delogger.flush(timeout=5) is True
+
+        run(main())
+
+        assert sum(hdlr.batches, []) == ["0", "1"]
+        assert delogger._async_hdlr.dropped == 3
+
+    def test_delogger_async_auto_level(self):
+        delogger = DeloggerAsync("test_delogger_async_auto_level")
+        delogger.add_handler(_AsyncHandler(), logging.INFO)
+
+        assert delogger.get_logger().level == logging.INFO
@@ -0,0 +1,149 @@
+import logging
+import multiprocessing
+from pathlib import Path
+import pickle
+import queue
+from shutil import rmtree
+import threading
+import time
+
+from delogger import DeloggerProcessQueue
+from delogger.handlers.delogger_process_queue import DeloggerProcessQueueHandler
+from delogger.modes.file import CountRotatingFileMode
+from tests.lib.base import Assert
+from tests.lib.base import DeloggerTestBase
+
+
+def _child_log(logger, index):
+    for i in range(10):
+        logger.info("child %d %d", index, i)
+
+
+def _spawn_child_log(queue):
+    logger = DeloggerProcessQueue.attach(queue, "test_process_queue_attach")
+    logger.info("spawned child")
+
+
+class TestDeloggerProcessQueue(DeloggerTestBase):
+    def teardown_method(self):
+        if Path(self.OUTPUT_DIRPATH).is_dir():
+            rmtree(self.OUTPUT_DIRPATH)
+
+    def test_process_queue(self):
+        filepath = f"{self.OUTPUT_DIRPATH}/process.log"
+        delogger = DeloggerProcessQueue(
+            "test_process_queue",
+            modes=[CountRotatingFileMode(filepath, backup_count=0)],
+            context="fork",
+        )
+        logger = delogger.get_logger()
+
+        self.execute_log(logger)
+
+        ctx = multiprocessing.get_context("fork")
+        procs = [ctx.Process(target=_child_log, args=(logger, i)) for i in range(3)]
+        for proc in procs:
+            proc.start()
+        for proc in procs:
+            proc.join()
+
+        assert delogger.stop(timeout=10) is True
+        assert delogger.stop() is False
+
+        # Records of different processes are not ordered.
+        with open(filepath) as f:
+            lines = f.read().splitlines()
+        parent_lines = [line for line in lines if "_child_log" not in line]
+        for level, line in zip(self.ALL_LEVELS, parent_lines):
+            Assert._match(self.LOG_FMT % level, line)
+
+        assert len(lines) == 5 + 3 * 10
+        assert sum("child 1" in line for line in lines) == 10
+
+    def test_process_queue_attach(self):
+        filepath = f"{self.OUTPUT_DIRPATH}/attach.log"
+        delogger = DeloggerProcessQueue(
+            "test_process_queue_attach",
+            modes=[CountRotatingFileMode(filepath, backup_count=0)],
+            context="spawn",
+        )
+        delogger.get_logger()
+
+        ctx = multiprocessing.get_context("spawn")
+        proc = ctx.Process(target=_spawn_child_log, args=(delogger.queue,))
+        proc.start()
+        proc.join()
+
+        assert delogger.stop(timeout=10) is True
+        with open(filepath) as f:
+            assert "spawned child" in f.read()
+
+    def test_process_queue_level(self):
+        filepath = f"{self.OUTPUT_DIRPATH}/level.log"
+        delogger = DeloggerProcessQueue(
+            "test_process_queue_level",
+            modes=[CountRotatingFileMode(filepath, level=logging.INFO, backup_count=0)],
+            context="fork",
+        )
+        logger = delogger.get_logger()
+
+        assert logger.level == logging.INFO
+        assert not logger.isEnabledFor(logging.DEBUG)
+
+        logger.debug("debug")
+        logger.info("info")
+
+        assert delogger.stop(timeout=10) is True
+        with open(filepath) as f:
+            lines = f.read().splitlines()
+        assert len(lines) == 1
+        assert "info" in lines[0]
+
+    def test_prepare(self):
+        hdlr = DeloggerProcessQueueHandler(None)
+        try:
+            raise ValueError("error")
+        except ValueError:
+            record = logging.LogRecord(
+                "name", logging.ERROR, "", 0, "%s %d", ("a", 1), True
+            )
+            record.exc_info = __import__("sys").exc_info()
+
+        prepared = logging.makeLogRecord(
+            pickle.loads(pickle.dumps(hdlr.prepare(record)))
+        )
+
+        assert prepared.getMessage() == "a 1"
+        assert prepared.args is None
+        assert prepared.exc_info is None
+        assert "ValueError: error" in prepared.exc_text
+
+    def test_start_sender_once(self):
+        que: queue.Queue = queue.Queue()
+        hdlr = DeloggerProcessQueueHandler(que)
+        start_sender = hdlr._start_sender
+        starts = []
+
+        def slow_start_sender():
+            starts.append(1)
+            # Let the other thread reach the pid check.
+            time.sleep(0.05)
+            start_sender()
+
+        hdlr._start_sender = slow_start_sender
+        threads = [
+            threading.Thread(target=hdlr.enqueue, args=({"msg": str(i)},))
+            for i in range(2)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        hdlr.flush()
+        sent = []
+        while not que.empty():
+            sent.extend(que.get())
+
+        assert len(starts) == 1
+        assert sorted(attrs["msg"] for attrs in sent) == ["0", "1"]
@@ -1,5 +1,13 @@
+import logging
+import threading
+
+import pytest
+
 from delogger import DeloggerQueue
 from delogger.decorators.debug_log import DebugLog
+from delogger.handlers.backpressure import DropNewestPolicy
+from delogger.handlers.delogger_queue import DeloggerQueueHandler
+from delogger.handlers.lane import Lane
 from delogger.modes.stream import StreamDebugMode
 from tests.lib.base import DeloggerTestBase
 
@@ -58,3 +66,196 @@ class TestDeloggerQueue(DeloggerTestBase):
         self.check_debug_stream_log(logger, capsys, is_color=False)
 
         assert getattr(logger, "debuglog")
+
+    def test_delogger_queue_bounded(self, capsys):
+        policy = DropNewestPolicy()
+        delogger = DeloggerQueue(
+            "test_delogger_queue_bounded",
+            modes=[StreamDebugMode()],
+            maxsize=10,
+            policy=policy,
+        )
+        logger = delogger.get_logger()
+
+        self.execute_log(logger)
+
+        delogger.join()
+        self.check_debug_stream_log(logger, capsys, is_color=False)
+
+        assert delogger.policy is policy
+        assert delogger.drop_counters() == {"dropped": 0}
+
+    def test_delogger_queue_type(self, capsys):
+        for queue_type in DeloggerQueue.QUEUE_TYPES:
+            delogger = DeloggerQueue(
+                f"test_delogger_queue_type_{queue_type}",
+                modes=[StreamDebugMode()],
+                queue_type=queue_type,
+            )
+            logger = delogger.get_logger()
+
+            self.execute_log(logger)
+
+            assert delogger.join(timeout=5) is True
+            self.check_debug_stream_log(logger, capsys, is_color=False)
+
+    def test_delogger_queue_type_error(self):
+        with pytest.raises(ValueError):
+            DeloggerQueue("test_delogger_queue_type_error", queue_type="unknown")
+
+        with pytest.raises(ValueError):
+            DeloggerQueue(
+                "test_delogger_queue_type_error", queue_type="simple", maxsize=10
+            )
+
+    def test_delogger_queue_join_timeout(self):
+        event = threading.Event()
+
+        class _BlockHandler(logging.Handler):
+            def emit(self, record):
+                event.wait(5)
+
+        delogger = DeloggerQueue("test_delogger_queue_join_timeout")
+        delogger.add_handler(_BlockHandler(), logging.DEBUG)
+        logger = delogger.get_logger()
+
+        logger.debug("blocked")
+
+        assert delogger.join(timeout=0.01) is False
+        event.set()
+        assert delogger.join(timeout=5) is True
+
+    def test_delogger_queue_prepare(self, capsys):
+        for prepare in DeloggerQueueHandler.PREPARE_STRATEGIES:
+            delogger = DeloggerQueue(
+                f"test_delogger_queue_prepare_{prepare}",
+                modes=[StreamDebugMode()],
+                prepare=prepare,
+            )
+            logger = delogger.get_logger()
+
+            self.execute_log(logger)
+
+            assert delogger.join(timeout=5) is True
+            self.check_debug_stream_log(logger, capsys, is_color=False)
+
+        with pytest.raises(ValueError):
+            DeloggerQueue("test_delogger_queue_prepare_error", prepare="unknown")
+
+    def test_delogger_queue_prepare_lazy(self):
+        event = threading.Event()
+        records = []
+
+        class _BlockHandler(logging.Handler):
+            def emit(self, record):
+                event.wait(5)
+                records.append(record)
+
+        delogger = DeloggerQueue("test_delogger_queue_lazy", prepare="lazy")
+        delogger.add_handler(_BlockHandler(), logging.DEBUG)
+        logger = delogger.get_logger()
+
+        values = [1]
+        logger.debug("blocked")
+        logger.debug("immutable %s %s", 1, ("a", None))
+        logger.debug("mutable %s", values)
+        values.append(2)
+        event.set()
+
+        assert delogger.join(timeout=5) is True
+        assert [r.getMessage() for r in records] == [
+            "blocked",
+            "immutable 1 ('a', None)",
+            "mutable [1]",
+        ]
+        # Immutable records are rendered in the listener thread.
+        assert records[1].args == (1, ("a", None))
+        assert records[2].args is None
+
+    def test_delogger_queue_shared(self):
+        records = {"a": [], "b": []}
+        loggers = {}
+        for key in records:
+            hdlr = logging.Handler()
+            hdlr.emit = records[key].append
+            delogger = DeloggerQueue(f"test_delogger_queue_shared_{key}")
+            delogger.add_handler(hdlr, logging.DEBUG)
+            loggers[key] = (delogger, delogger.get_logger())
+
+        (delogger_a, logger_a), (delogger_b, logger_b) = loggers.values()
+        assert delogger_a._queue_hdlr.listener is delogger_b._queue_hdlr.listener
+        assert delogger_a._queue_hdlr.queue is delogger_b._queue_hdlr.queue
+
+        logger_a.debug("a")
+        logger_b.debug("b")
+        logging.getLogger("test_delogger_queue_shared_a.child").debug("child")
+        assert delogger_b.join(5) is True
+
+        assert [r.getMessage() for r in records["a"]] == ["a", "child"]
+        assert [r.getMessage() for r in records["b"]] == ["b"]
+
+    def test_delogger_queue_shared_drain(self):
+        # A listener for the test only, apart from the loggers of other tests.
+        DeloggerQueue._shared_listener = None
+        records = []
+        hdlr = logging.Handler()
+        hdlr.emit = records.append
+        loggers = []
+        for key in ("a", "b"):
+            delogger = DeloggerQueue(f"test_delogger_queue_shared_drain_{key}")
+            delogger.add_handler(hdlr, logging.DEBUG)
+            loggers.append((delogger, delogger.get_logger()))
+
+        (delogger_a, logger_a), (delogger_b, logger_b) = loggers
+        listener = delogger_a._queue_hdlr.listener
+        assert listener.users == 2
+
+        logger_a.info("a")
+        logger_b.info("b1")
+        assert delogger_a.drain(5).abandoned == 0
+        assert listener.users == 1
+
+        # The drain of a does not stop the listener of b.
+        logger_a.info("dropped")
+        logger_b.info("b2")
+        assert delogger_b.join(1) is True
+        assert [r.getMessage() for r in records] == ["a", "b1", "b2"]
+
+        assert delogger_b.drain(5).abandoned == 0
+        assert listener.users == 0
+        assert delogger_b.join(1) is False
+
+        # The next logger starts a new listener.
+        delogger = DeloggerQueue("test_delogger_queue_shared_drain_c")
+        delogger.get_logger()
+        assert delogger._queue_hdlr.listener is not listener
+        delogger.drain(5)
+
+    def test_delogger_queue_not_shared(self):
+        shared = DeloggerQueue("test_delogger_queue_not_shared_0")
+        isolated = DeloggerQueue("test_delogger_queue_not_shared_1", shared=False)
+        bounded = DeloggerQueue("test_delogger_queue_not_shared_2", maxsize=10)
+        for delogger in (shared, isolated, bounded):
+            delogger.get_logger()
+
+        assert shared.shared is True
+        assert isolated.shared is False
+        assert bounded.shared is False
+        listeners = {d._queue_hdlr.listener for d in (shared, isolated, bounded)}
+        assert len(listeners) == 3
+
+        with pytest.raises(ValueError):
+            DeloggerQueue("test_delogger_queue_not_shared_3", maxsize=10, shared=True)
+
+    def test_delogger_queue_auto_level(self):
+        for shared in (True, False):
+            delogger = DeloggerQueue(
+                f"test_delogger_queue_auto_level_{shared}",
+                shared=shared,
+                lanes=[Lane(logging.NullHandler)],
+            )
+            delogger.add_handler(logging.StreamHandler(), logging.ERROR)
+            delogger.add_handler(logging.NullHandler(), logging.WARNING)
+            logger = delogger.get_logger()
+
+            assert logger.level == logging.WARNING
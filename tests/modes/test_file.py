@@ -2,7 +2,10 @@ from pathlib import Path
 from shutil import rmtree
 
 from delogger import Delogger
+from delogger.handlers.ring_file import read_ring_file
+from delogger.modes.file import BufferedFileMode
 from delogger.modes.file import CountRotatingFileMode
+from delogger.modes.file import RingFileMode
 from delogger.modes.file import TimedRotatingFileMode
 from tests.lib.base import Assert
 from tests.lib.base import DeloggerTestBase
@@ -47,6 +50,38 @@ class TestFileMode(DeloggerTestBase):
         logfile.filepath.unlink()
         logfile.filepath.parent.rmdir()
 
+    def test_buffered_file_mode(self, capsys):
+        buffered_mode = BufferedFileMode(filepath=f"{self.OUTPUT_DIRPATH}/buffered.log")
+        delogger = Delogger("buffered_file_mode")
+        delogger.load_modes(buffered_mode)
+        logger = delogger.get_logger()
+
+        logfile = buffered_mode.logfile
+
+        logger.debug("debug")
+        logger.info("info")
+        logger.warning("warning")
+        assert logfile.filepath.read_text() == ""
+
+        logger.error("error")
+        logger.critical("critical")
+        self.check_log_file(logfile.filepath)
+
+    def test_ring_file_mode(self, capsys):
+        ring_mode = RingFileMode(filepath=f"{self.OUTPUT_DIRPATH}/test.ring", size=4096)
+        delogger = Delogger("ring_file_mode")
+        delogger.load_modes(ring_mode)
+        logger = delogger.get_logger()
+
+        self.execute_log(logger)
+
+        lines = read_ring_file(ring_mode.filepath)
+        assert len(lines) == len(self.ALL_LEVELS)
+
+        logs = [self.LOG_FMT % level for level in self.ALL_LEVELS]
+        for log, line in zip(logs, lines):
+            Assert._match(log, line)
+
     def test_timed_rotating_file_mode(self, capsys):
         timed_file_mode = TimedRotatingFileMode()
         delogger = Delogger("timed_rotating_file_mode")
@@ -0,0 +1,39 @@
+import json
+from pathlib import Path
+from shutil import rmtree
+
+from delogger import Delogger
+from delogger.modes.json import JsonFileMode
+from delogger.modes.json import JsonStreamMode
+from tests.lib.base import DeloggerTestBase
+
+
+class TestJsonMode(DeloggerTestBase):
+    def teardown_method(self):
+        if Path(self.OUTPUT_DIRPATH).is_dir():
+            rmtree(self.OUTPUT_DIRPATH)
+
+    def test_json_file_mode(self):
+        json_mode = JsonFileMode(filepath=f"{self.OUTPUT_DIRPATH}/test.jsonl")
+        delogger = Delogger("json_file_mode", modes=[json_mode])
+        logger = delogger.get_logger()
+
+        self.execute_log(logger)
+        logger.info("extra", extra={"user": "u"})
+
+        lines = json_mode.logfile.filepath.read_text().splitlines()
+        data = [json.loads(line) for line in lines]
+
+        assert [d["message"] for d in data] == self.ALL_LEVELS + ["extra"]
+        assert data[-1]["user"] == "u"
+        assert data[0]["levelname"] == "DEBUG"
+
+    def test_json_stream_mode(self, capsys):
+        delogger = Delogger(
+            "json_stream_mode", modes=[JsonStreamMode(fields=["message"])]
+        )
+        logger = delogger.get_logger()
+
+        logger.info("info")
+
+        assert json.loads(capsys.readouterr().err) == {"message": "info"}
@@ -0,0 +1,29 @@
+import logging
+
+from delogger import Delogger
+from delogger.modes.ring_buffer import RingBufferMode
+from delogger.modes.stream import StreamDebugMode
+from tests.lib.base import DeloggerTestBase
+
+
+class TestRingBufferMode(DeloggerTestBase):
+    def test_ring_buffer_mode(self, capsys):
+        ring_mode = RingBufferMode([StreamDebugMode()], capacity=2)
+        delogger = Delogger("ring_buffer_mode", modes=[ring_mode])
+        logger = delogger.get_logger()
+
+        assert logger.handlers == [ring_mode.handler]
+        assert logger.level == logging.DEBUG
+
+        logger.debug("debug")
+        logger.info("info")
+        logger.warning("warning")
+        assert capsys.readouterr().err == ""
+
+        logger.error("error")
+
+        assert capsys.readouterr().err.splitlines() == [
+            "INFO  | info",
+            "WARN  | warning",
+            "ERROR | error",
+        ]
@@ -1,10 +1,30 @@
 import os
 from pathlib import Path
 from shutil import rmtree
+import subprocess
+import sys
+
+import pytest
 
 from tests.lib.base import DeloggerTestBase
 from tests.lib.urlopen_mock import UrlopenMock
 
+IMPORT_SCRIPT = """
+import logging
+import os
+import threading
+
+import delogger.presets.output
+
+assert not os.path.exists("log"), "log directory"
+assert threading.active_count() == 1, "listener thread"
+assert not logging.getLogger("output_logger").handlers, "handlers"
+
+logger = delogger.presets.output.logger
+assert logger is delogger.presets.output.logger
+assert logger.handlers
+"""
+
 
 class TestPresets(DeloggerTestBase):
     def teardown_method(self):
@@ -82,3 +102,30 @@ class TestPresets(DeloggerTestBase):
         assert getattr(logger, "add_line_profile")
         assert getattr(logger, "memory_profile")
         assert getattr(logger, "line_memory_profile")
+
+    def test_import_is_lazy(self, tmp_path):
+        env = dict(os.environ, PYTHONPATH=os.getcwd())
+        result = subprocess.run(
+            [sys.executable, "-c", IMPORT_SCRIPT],
+            cwd=str(tmp_path),
+            env=env,
+            stderr=subprocess.PIPE,
+            universal_newlines=True,
+            timeout=30,
+        )
+
+        assert result.returncode == 0, result.stderr
+
+    def test_get_preset(self):
+        from delogger.presets import get_preset
+        from delogger.presets.debug_stream import logger
+
+        assert get_preset("debug_stream") is logger
+
+        with pytest.raises(ValueError):
+            get_preset("unknown")
+
+        import delogger.presets.debug_stream as debug_stream
+
+        with pytest.raises(AttributeError):
+            debug_stream.unknown
@@ -0,0 +1,81 @@
+import os
+import subprocess
+import sys
+from types import ModuleType
+
+import pytest
+
+from delogger.util.lazy_import import module_getattr
+from tests.lib.base import DeloggerTestBase
+
+SCRIPT = """
+import sys
+
+import delogger
+
+lazy = ["asyncio", "colorlog", "line_profiler", "memory_profiler", "multiprocessing", "psutil"]
+print(" ".join(name for name in lazy if name in sys.modules))
+"""
+
+
+def _run(script):
+    env = dict(os.environ, PYTHONPATH=os.getcwd())
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        timeout=30,
+    )
+    assert result.returncode == 0, result.stderr
+
+    return result.stdout.split()
+
+
+class TestImport(DeloggerTestBase):
+    def test_lazy_dependencies(self):
+        assert _run(SCRIPT) == []
+
+    def test_lazy_loggers(self):
+        script = (
+            SCRIPT + "delogger.DeloggerAsync\nprint(delogger.DeloggerAsync.__name__)"
+        )
+        assert _run(script) == ["DeloggerAsync"]
+
+    def test_color_handler(self):
+        script = (
+            "import sys\n"
+            "from delogger import Delogger\n"
+            "from delogger.modes.stream import StreamColorDebugMode\n"
+            "print('colorlog' in sys.modules)\n"
+            "Delogger('color', modes=[StreamColorDebugMode()])\n"
+            "print('colorlog' in sys.modules)\n"
+        )
+        assert _run(script) == ["False", "True"]
+
+    def test_profilers(self):
+        script = (
+            "import sys\n"
+            "from delogger.decorators.profiles import LineMemoryProfile\n"
+            "print('line_profiler' in sys.modules)\n"
+            "assert LineMemoryProfile().can_run()\n"
+            "print('line_profiler' in sys.modules, 'memory_profiler' in sys.modules)\n"
+        )
+        assert _run(script) == ["False", "True", "True"]
+
+    def test_module_getattr(self, monkeypatch):
+        module = ModuleType("delogger_test_module_getattr")
+        module.__getattr__ = lambda name: name.upper() if name == "lazy" else None
+        monkeypatch.setitem(sys.modules, module.__name__, module)
+        monkeypatch.setattr(sys, "version_info", (3, 6, 15))
+
+        module_getattr(module.__name__)
+        # The module class calls __getattr__ on Python 3.6.
+        assert type(module).__getattr__(module, "lazy") == "LAZY"
+        assert module.lazy == "LAZY"
+        assert module.other is None
+
+        del module.__getattr__
+        with pytest.raises(AttributeError):
+            module.lazy
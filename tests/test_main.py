@@ -0,0 +1,53 @@
+import json
+from pathlib import Path
+from shutil import rmtree
+
+from delogger import Delogger
+from delogger.__main__ import main
+from delogger.modes.file import BinaryFileMode
+from delogger.modes.file import RingFileMode
+from tests.lib.base import Assert
+from tests.lib.base import DeloggerTestBase
+
+
+class TestMain(DeloggerTestBase):
+    def teardown_method(self):
+        if Path(self.OUTPUT_DIRPATH).is_dir():
+            rmtree(self.OUTPUT_DIRPATH)
+
+    def test_decode_binary(self, capsys):
+        binary_mode = BinaryFileMode(filepath=f"{self.OUTPUT_DIRPATH}/test.dlb")
+        delogger = Delogger("decode_binary", modes=[binary_mode])
+        logger = delogger.get_logger()
+
+        self.execute_log(logger)
+
+        assert main(["decode", str(binary_mode.logfile.filepath)]) == 0
+        lines = capsys.readouterr().out.splitlines()
+        assert len(lines) == len(self.ALL_LEVELS)
+        for level, line in zip(self.ALL_LEVELS, lines):
+            Assert._match(self.LOG_FMT % level, line)
+
+        assert main(["decode", "--json", str(binary_mode.logfile.filepath)]) == 0
+        data = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        assert [d["message"] for d in data] == self.ALL_LEVELS
+        assert data[2]["levelname"] == "WARN"
+
+    def test_decode_ring(self, capsys):
+        ring_mode = RingFileMode(filepath=f"{self.OUTPUT_DIRPATH}/test.ring", size=4096)
+        delogger = Delogger("decode_ring", modes=[ring_mode])
+        logger = delogger.get_logger()
+
+        self.execute_log(logger)
+
+        assert main(["decode", ring_mode.filepath]) == 0
+        lines = capsys.readouterr().out.splitlines()
+        assert len(lines) == len(self.ALL_LEVELS)
+
+    def test_decode_unknown(self, capsys):
+        Path(self.OUTPUT_DIRPATH).mkdir()
+        filepath = Path(self.OUTPUT_DIRPATH) / "test.log"
+        filepath.write_text("text")
+
+        assert main(["decode", str(filepath)]) == 1
+        assert "not a delogger" in capsys.readouterr().err
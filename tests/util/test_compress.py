@@ -0,0 +1,161 @@
+import gzip
+import logging
+import os
+from pathlib import Path
+import shutil
+
+import pytest
+
+from delogger.handlers.count_rotating_file import CountRotatingFileHandler
+from delogger.handlers.timed_rotating_file import TimedRotatingFileHandler
+from delogger.util import compress
+from delogger.util.compress import COMPRESSIONS
+from delogger.util.compress import compress_file
+from delogger.util.compress import recover
+from tests.lib.base import DeloggerTestBase
+
+
+class TestCompress(DeloggerTestBase):
+    def setup_method(self):
+        Path(self.OUTPUT_DIRPATH).mkdir(exist_ok=True)
+
+    def teardown_method(self):
+        compress.join()
+        if Path(self.OUTPUT_DIRPATH).is_dir():
+            shutil.rmtree(self.OUTPUT_DIRPATH)
+
+    def _file(self, name, text="log\n" * 100, idle=True):
+        path = Path(self.OUTPUT_DIRPATH) / name
+        path.write_text(text)
+        if idle:
+            old = path.stat().st_mtime - compress.IDLE_SECONDS
+            os.utime(path, (old, old))
+        return path
+
+    @pytest.mark.parametrize("compression", list(COMPRESSIONS))
+    def test_compress_file(self, compression):
+        path = self._file("test.log")
+        suffix, open_func = COMPRESSIONS[compression]
+
+        dest = compress_file(str(path), compression)
+
+        assert dest == str(path) + suffix
+        assert not path.exists()
+        with open_func(dest, "rt") as f:
+            assert f.read() == "log\n" * 100
+
+    def test_recover(self):
+        # cut off while compressing
+        half = self._file("half.log")
+        self._file("half.log.gz.tmp", "broken")
+        # cut off between the rename and the remove
+        done = self._file("done.log")
+        with gzip.open(str(done) + ".gz", "wt") as f:
+            f.write("log\n" * 100)
+
+        assert recover(self.OUTPUT_DIRPATH, "gzip") == [str(half)]
+        compress.join()
+
+        names = sorted(p.name for p in Path(self.OUTPUT_DIRPATH).iterdir())
+        assert names == ["done.log.gz", "half.log.gz"]
+
+    def test_recover_incomplete(self):
+        # a compressed file cut off by a crash
+        broken = self._file("broken.log")
+        with open(str(broken) + ".gz", "wb") as f:
+            f.write(gzip.compress(broken.read_bytes())[:-4])
+        # a live file of another process, being compressed
+        live = self._file("live.log", idle=False)
+        self._file("live.log.gz.tmp", "writing", idle=False)
+        # the file open in this process, next to a complete compressed file
+        current = self._file("current.log")
+        with gzip.open(str(current) + ".gz", "wt") as f:
+            f.write("log\n" * 100)
+
+        assert recover(self.OUTPUT_DIRPATH, "gzip", [str(current)]) == [str(broken)]
+        compress.join()
+
+        names = sorted(p.name for p in Path(self.OUTPUT_DIRPATH).iterdir())
+        assert names == [
+            "broken.log.gz",
+            "current.log",
+            "current.log.gz",
+            "live.log",
+            "live.log.gz.tmp",
+        ]
+        with gzip.open(str(broken) + ".gz", "rt") as f:
+            assert f.read() == "log\n" * 100
+        assert live.exists()
+
+    def test_unknown(self):
+        with pytest.raises(ValueError):
+            CountRotatingFileHandler(f"{self.OUTPUT_DIRPATH}/x.log", compression="zip")
+
+    def test_count_rotating(self):
+        CountRotatingFileHandler._files = {}
+        for name in ("20200101_000000.log", "20200102_000000.log"):
+            self._file(name)
+
+        hdlr = CountRotatingFileHandler(
+            f"{self.OUTPUT_DIRPATH}/%Y%m%d_%H%M%S.log",
+            backup_count=3,
+            compression="gzip",
+        )
+        hdlr.close()
+        compress.join()
+
+        names = sorted(p.name for p in Path(self.OUTPUT_DIRPATH).iterdir())
+        assert names[:2] == ["20200101_000000.log.gz", "20200102_000000.log.gz"]
+        assert names[2] == Path(hdlr.filepath).name
+
+        # The compressed files count for backup_count.
+        CountRotatingFileHandler._files = {}
+        hdlr = CountRotatingFileHandler(
+            f"{self.OUTPUT_DIRPATH}/%Y%m%d_%H%M%S.log",
+            backup_count=2,
+            compression="gzip",
+        )
+        hdlr.close()
+        compress.join()
+
+        names = sorted(p.name for p in Path(self.OUTPUT_DIRPATH).iterdir())
+        assert names == ["20200102_000000.log.gz", Path(hdlr.filepath).name]
+
+    def test_count_rotating_live_files(self):
+        CountRotatingFileHandler._files = {}
+        # written by another process just now
+        self._file("20200101_000000.log", idle=False)
+        # open in this process
+        other = CountRotatingFileHandler(f"{self.OUTPUT_DIRPATH}/20200102_000000.log")
+        other.emit(logging.makeLogRecord({"msg": "other"}))
+        old = Path(other.filepath).stat().st_mtime - compress.IDLE_SECONDS
+        os.utime(other.filepath, (old, old))
+
+        hdlr = CountRotatingFileHandler(
+            f"{self.OUTPUT_DIRPATH}/%Y%m%d_%H%M%S.log",
+            backup_count=3,
+            compression="gzip",
+        )
+        hdlr.close()
+        other.close()
+        compress.join()
+
+        names = sorted(p.name for p in Path(self.OUTPUT_DIRPATH).iterdir())
+        assert names == [
+            "20200101_000000.log",
+            "20200102_000000.log",
+            Path(hdlr.filepath).name,
+        ]
+
+    def test_timed_rotating(self):
+        hdlr = TimedRotatingFileHandler(
+            f"{self.OUTPUT_DIRPATH}/timed.log", when="S", compression="bz2"
+        )
+        hdlr.emit(logging.makeLogRecord({"msg": "before"}))
+        hdlr.doRollover()
+        compress.join()
+        hdlr.close()
+
+        names = [p.name for p in Path(self.OUTPUT_DIRPATH).iterdir()]
+        assert len(names) == 2
+        assert any(name.endswith(".bz2") for name in names)
@@ -0,0 +1,111 @@
+import logging
+import os
+from pathlib import Path
+import shutil
+import time
+
+from delogger.handlers.count_rotating_file import CountRotatingFileHandler
+from delogger.handlers.timed_rotating_file import TimedRotatingFileHandler
+from delogger.util.retention import RetentionPolicy
+from delogger.util.retention import strftime_pattern
+from tests.lib.base import DeloggerTestBase
+
+
+class TestRetention(DeloggerTestBase):
+    def setup_method(self):
+        Path(self.OUTPUT_DIRPATH).mkdir(exist_ok=True)
+
+    def teardown_method(self):
+        if Path(self.OUTPUT_DIRPATH).is_dir():
+            shutil.rmtree(self.OUTPUT_DIRPATH)
+
+    def _files(self, *names, size=10):
+        for name in names:
+            (Path(self.OUTPUT_DIRPATH) / name).write_text("x" * size)
+
+    def _names(self):
+        return sorted(p.name for p in Path(self.OUTPUT_DIRPATH).iterdir())
+
+    def test_strftime_pattern(self):
+        match = strftime_pattern("%Y%m%d_%H%M%S.log").fullmatch
+
+        assert match("20200101_000000.log")
+        assert match("20200101_000000.log.001")
+        assert match("20200101_000000.log.gz")
+        assert not match("20200101_000000.log.gz.tmp")
+        assert not match("20200101_000000xlog")
+        assert not match("other.log")
+
+    def test_max_count(self):
+        names = [f"2020010{i}.log" for i in range(1, 10)]
+        self._files(*names, "other.log", "20200101.log.gz.tmp")
+        match = strftime_pattern("%Y%m%d.log").fullmatch
+
+        removed = RetentionPolicy(max_count=3).apply(self.OUTPUT_DIRPATH, match)
+
+        # Every excess file is removed in one pass.
+        assert len(removed) == 6
+        assert self._names() == sorted(
+            names[-3:] + ["20200101.log.gz.tmp", "other.log"]
+        )
+
+    def test_max_bytes_and_protect(self):
+        self._files("20200101.log", "20200102.log", "20200103.log.gz")
+        match = strftime_pattern("%Y%m%d.log").fullmatch
+        protect = os.path.join(self.OUTPUT_DIRPATH, "20200101.log")
+
+        RetentionPolicy(max_bytes=20).apply(self.OUTPUT_DIRPATH, match, protect)
+
+        assert self._names() == ["20200101.log", "20200103.log.gz"]
+
+    def test_max_age(self):
+        self._files("20200101.log", "20200102.log")
+        old = Path(self.OUTPUT_DIRPATH) / "20200101.log"
+        os.utime(old, (time.time() - 100, time.time() - 100))
+        match = strftime_pattern("%Y%m%d.log").fullmatch
+
+        RetentionPolicy(max_age=50).apply(self.OUTPUT_DIRPATH, match)
+
+        assert self._names() == ["20200102.log"]
+
+    def test_background(self):
+        self._files("20200101.log", "20200102.log")
+        match = strftime_pattern("%Y%m%d.log").fullmatch
+
+        RetentionPolicy(max_count=1, background=True).enforce(
+            self.OUTPUT_DIRPATH, match
+        )
+
+        for _ in range(100):
+            if len(self._names()) == 1:
+                break
+            time.sleep(0.01)
+        assert self._names() == ["20200102.log"]
+
+    def test_count_rotating(self):
+        CountRotatingFileHandler._files = {}
+        self._files(*[f"2020010{i}_000000.log" for i in range(1, 10)])
+
+        hdlr = CountRotatingFileHandler(
+            f"{self.OUTPUT_DIRPATH}/%Y%m%d_%H%M%S.log", backup_count=3
+        )
+        hdlr.close()
+
+        assert self._names() == [
+            "20200108_000000.log",
+            "20200109_000000.log",
+            Path(hdlr.filepath).name,
+        ]
+
+    def test_timed_rotating(self):
+        self._files("timed.log.2020-01-01", "timed.log.2020-01-02", size=100)
+
+        hdlr = TimedRotatingFileHandler(
+            f"{self.OUTPUT_DIRPATH}/timed.log",
+            when="midnight",
+            retention=RetentionPolicy(max_bytes=150),
+        )
+        hdlr.emit(logging.makeLogRecord({"msg": "msg"}))
+        hdlr.close()
+
+        assert self._names() == ["timed.log", "timed.log.2020-01-02"]
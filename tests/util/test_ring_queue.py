@@ -0,0 +1,71 @@
+from queue import Empty
+from queue import Full
+from threading import Thread
+import time
+
+import pytest
+
+from delogger.util.ring_queue import RingQueue
+
+
+class TestRingQueue:
+    def test_fifo(self):
+        que = RingQueue()
+        for i in range(5):
+            que.put_nowait(i)
+
+        assert que.qsize() == 5
+        assert [que.get_nowait() for _ in range(5)] == list(range(5))
+        assert que.empty()
+
+        with pytest.raises(Empty):
+            que.get_nowait()
+
+    def test_get_timeout(self):
+        que = RingQueue()
+
+        with pytest.raises(Empty):
+            que.get(True, 0.01)
+
+    def test_get_wakeup(self):
+        que = RingQueue()
+        Thread(target=lambda: (time.sleep(0.01), que.put("item"))).start()
+
+        assert que.get(True, 5) == "item"
+
+    def test_bounded(self):
+        que = RingQueue(2)
+        que.put_nowait(0)
+        que.put_nowait(1)
+
+        assert que.full()
+        with pytest.raises(Full):
+            que.put_nowait(2)
+        with pytest.raises(Full):
+            que.put(2, True, 0.01)
+
+        Thread(target=lambda: (time.sleep(0.01), que.get())).start()
+        que.put(2, True, 5)
+
+        assert [que.get_nowait() for _ in range(2)] == [1, 2]
+
+    def test_threads(self):
+        que = RingQueue(10)
+        items = []
+
+        def consume():
+            for _ in range(4000):
+                items.append(que.get())
+
+        consumer = Thread(target=consume)
+        consumer.start()
+        producers = [
+            Thread(target=lambda: [que.put(i) for i in range(1000)]) for _ in range(4)
+        ]
+        for producer in producers:
+            producer.start()
+        for producer in producers:
+            producer.join()
+        consumer.join(5)
+
+        assert len(items) == 4000